@@ -63,9 +63,8 @@ async def chat_stream_endpoint(
                     request.query, 
                     request.filters
                 ):
-                    # SSE 형식으로 데이터 전송
-                    event_data = event.model_dump()
-                    yield f"data: {json.dumps(event_data, ensure_ascii=False)}\n\n"
+                    # SSE 형식으로 데이터 전송 (dict 변환 없이 Pydantic의 JSON 직렬화 사용)
+                    yield f"data: {event.model_dump_json()}\n\n"
                     
             except Exception as e:
                 logger.error(f"스트리밍 중 오류: {e}")
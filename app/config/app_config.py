@@ -31,6 +31,9 @@ class AppConfig(BaseSettings):
     max_request_size: int = 10 * 1024 * 1024  # 10MB
     request_timeout: int = 300  # 5분
 
+    # 시작 시 파이프라인 워밍업 (첫 요청의 연결/초기화 지연 방지)
+    startup_warmup: bool = True
+
     # 로깅 설정
     log_level: str = "INFO"
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -2,7 +2,7 @@
 파이프라인 기본 설정 파일 - 보안이 필요하지 않은 설정들
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 
 
@@ -16,13 +16,16 @@ class SearchConfig:
     tolerance: int = 3  # 페이지 확장 범위 (0이면 확장 안함)
     
     # 검색 상세 설정 (기존)
-    vector_search_candidates: int = 100
+    vector_search_candidates: Optional[int] = None  # knn 후보 수 (None이면 max(k * 4, 64))
     text_search_operator: str = "or"
     text_search_type: str = "best_fields"
+    parallel_workers: int = 4      # 요청별 쿼리 준비 단계(번역/키워드/HyDE/임베딩) 병렬 실행 스레드 수
+    task_timeout: float = 10.0     # 쿼리 준비 작업별 타임아웃 (초, 초과 시 대체값 사용)
     
     # 하이브리드 검색 가중치
-    fusion_method: str = "convex"   # convex | rrf
+    fusion_method: str = "convex"   # convex | rrf | native_rrf (ES 8.14+ retriever)
     rrf_k: int = 60                 # rrf 파라미터
+    rrf_window_size: Optional[int] = None  # 하이브리드(convex/native_rrf) knn 후보 수 (None이면 max(top_k * 2, 10))
     vector_weight: float = 0.3      # convex 파라미터
     text_weight: float = 0.7        # convex 파라미터
 
@@ -31,6 +34,7 @@ class SearchConfig:
 class GenerationConfig:
     """생성 관련 설정"""
     default_model: str = "gemini-2.0-flash-001"
+    prompt_cache_ttl: Optional[int] = None  # 시스템 프롬프트 컨텍스트 캐시 유지 시간 (초, None이면 미사용)
     
     # 태스크별 설정
     keyword_generation: Dict[str, Any] = None
@@ -73,6 +77,8 @@ class ContextConfig:
     """컨텍스트 구성 관련 설정"""
     context_type: str = "text"  # text | image | both
     text_field: str = "extracted_text"  # content | extracted_text
+    image_download_workers: int = 8     # 이미지 컨텍스트 병렬 다운로드 스레드 수
+    max_context_chars: Optional[int] = 120_000  # 컨텍스트 최대 글자 수 (이미지는 파트당 1024자로 환산, None이면 제한 없음)
     
 
 @dataclass
@@ -82,6 +88,39 @@ class ElasticsearchConfig:
     request_timeout: int = 30
     max_retries: int = 3
     retry_on_timeout: bool = True
+    connections_per_node: int = 64    # 노드당 HTTP 커넥션 풀 크기 (동시 요청 수 이상)
+    http_compress: bool = True        # 요청/응답 gzip 압축
+    node_class: str = "urllib3"       # HTTP 노드 구현 [urllib3|requests]
+    quantizer_path: Optional[str] = None  # byte 인덱스용 int8 보정 테이블(.npz), None이면 벡터별 대칭 양자화
+    source_excludes: Tuple[str, ...] = ("embedding",)  # 검색 응답 _source에서 제외할 필드 (벡터 필드)
+    source_includes: Optional[Tuple[str, ...]] = None  # 검색 응답 _source에 포함할 필드 (None이면 제외 필드 외 전체)
+    request_cache: bool = True        # 샤드 요청 캐시 사용 (size > 0 검색도 캐시)
+    expand_max_should_clauses: int = 64  # 페이지 확장을 단일 should 쿼리로 묶을 최대 PDF 수 (초과 시 msearch)
+
+
+@dataclass
+class CacheConfig:
+    """캐시 관련 설정"""
+    retrieval_cache_enabled: bool = True
+    retrieval_cache_size: int = 2048     # 최대 캐시 항목 수
+    retrieval_cache_ttl: int = 300       # 캐시 만료 시간 (초)
+    embedding_cache_enabled: bool = True
+    embedding_cache_size: int = 10_000   # 최대 임베딩 캐시 항목 수
+    embedding_store_enabled: bool = False  # 디스크(SQLite) 임베딩 저장소 (재시작/워커 간 공유)
+    embedding_store_path: Optional[str] = None  # None이면 {storage.local_temp_dir}/embedding_cache.sqlite3
+    semantic_cache_enabled: bool = False # 유사 질문 답변 캐시 (벡터 검색 방식에서만 동작)
+    semantic_cache_threshold: float = 0.85  # 캐시 히트 최소 코사인 유사도
+    semantic_cache_size: int = 1000
+    semantic_cache_ttl: int = 300        # 캐시 만료 시간 (초)
+    answer_cache_enabled: bool = True    # 동일 질문 답변 캐시 (검색은 매번 수행하여 결과가 같을 때만 재사용)
+    answer_cache_size: int = 1024
+    answer_cache_ttl: int = 600          # 캐시 만료 시간 (초)
+    answer_cache_min_overlap: float = 0.9  # 재사용에 필요한 검색 결과 ID Jaccard 유사도
+    llm_cache_enabled: bool = True       # 번역/키워드/HyDE 생성 결과 캐시
+    llm_cache_size: int = 1024
+    llm_cache_ttl: int = 3600            # 캐시 만료 시간 (초)
+    filter_match_cache_size: int = 512   # 필터 사전 확인 캐시 (문서가 있는 필터만 저장)
+    filter_match_cache_ttl: int = 300    # 캐시 만료 시간 (초)
 
 
 @dataclass
@@ -92,6 +131,7 @@ class PipelineConfig:
     storage: StorageConfig = None
     context: ContextConfig = None
     elasticsearch: ElasticsearchConfig = None
+    cache: CacheConfig = None
     
     def __post_init__(self):
         if self.search is None:
@@ -104,6 +144,8 @@ class PipelineConfig:
             self.context = ContextConfig()
         if self.elasticsearch is None:
             self.elasticsearch = ElasticsearchConfig()
+        if self.cache is None:
+            self.cache = CacheConfig()
 
 
 # # 전역 기본 설정 인스턴스
@@ -126,12 +168,12 @@ def get_custom_pipeline_config() -> PipelineConfig:
         tolerance=3,                                         # 페이지 확장 범위 (0이면 확장 안함)
         
         # 검색 상세 설정
-        vector_search_candidates=100,                        # 벡터 검색 후보 수
+        vector_search_candidates=None,                       # 벡터 검색 후보 수 (None이면 top_k 기반 자동)
         text_search_operator="or",                           # 텍스트 검색 연산자 [or|and]
         text_search_type="best_fields",                      # 텍스트 검색 타입
 
         # 하이브리드 검색 설정
-        fusion_method="rrf",     # convex | rrf
+        fusion_method="rrf",     # convex | rrf | native_rrf
         rrf_k=60,                 # rrf 파라미터
         vector_weight=0.3,        # convex 파라미터
         text_weight=0.7,          # convex 파라미터
@@ -140,6 +182,7 @@ def get_custom_pipeline_config() -> PipelineConfig:
     # ========== 생성 설정 ==========
     generation_config = GenerationConfig(
         default_model="gemini-2.0-flash-001",
+        prompt_cache_ttl=None,                 # 시스템 프롬프트 컨텍스트 캐시 (초, 예: 3600)
         
         # 키워드 생성 설정
         keyword_generation={
@@ -173,7 +216,9 @@ def get_custom_pipeline_config() -> PipelineConfig:
     # ========== 컨텍스트 설정 ==========
     context_config = ContextConfig(
         context_type="text",                   # [text|image|both]
-        text_field="extracted_text"            # [content|extracted_text]
+        text_field="extracted_text",           # [content|extracted_text]
+        image_download_workers=8,              # 이미지 병렬 다운로드 수
+        max_context_chars=120_000              # 컨텍스트 최대 글자 수 (None이면 제한 없음)
     )
     
     # ========== Elasticsearch 설정 ==========
@@ -181,7 +226,37 @@ def get_custom_pipeline_config() -> PipelineConfig:
         verify_certs=False,
         request_timeout=30,
         max_retries=3,
-        retry_on_timeout=True
+        retry_on_timeout=True,
+        connections_per_node=64,
+        http_compress=True,
+        node_class="urllib3",                  # [urllib3|requests]
+        quantizer_path=None,                   # byte 인덱스 색인 시 사용한 보정 테이블 경로
+        source_includes=None,                  # 예: ("extracted_text", "gcs_pdf_path", "page_number", "minio_image_path", "folder_levels")
+        expand_max_should_clauses=64           # 초과 시 페이지 확장을 msearch로 분할
+    )
+    
+    # ========== 캐시 설정 ==========
+    cache_config = CacheConfig(
+        retrieval_cache_enabled=True,
+        retrieval_cache_size=2048,
+        retrieval_cache_ttl=300,
+        embedding_cache_enabled=True,
+        embedding_cache_size=10_000,
+        embedding_store_enabled=False,
+        embedding_store_path=None,
+        semantic_cache_enabled=False,
+        semantic_cache_threshold=0.85,
+        semantic_cache_size=1000,
+        semantic_cache_ttl=300,
+        answer_cache_enabled=True,
+        answer_cache_size=1024,
+        answer_cache_ttl=600,
+        answer_cache_min_overlap=0.9,
+        llm_cache_enabled=True,
+        llm_cache_size=1024,
+        llm_cache_ttl=3600,
+        filter_match_cache_size=512,
+        filter_match_cache_ttl=300
     )
     
     # ========== 전체 설정 조합 ==========
@@ -190,5 +265,6 @@ def get_custom_pipeline_config() -> PipelineConfig:
         generation=generation_config,
         storage=storage_config,
         context=context_config,
-        elasticsearch=elasticsearch_config
+        elasticsearch=elasticsearch_config,
+        cache=cache_config
     )
\ No newline at end of file
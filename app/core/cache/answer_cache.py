@@ -0,0 +1,139 @@
+"""
+동일 질문 답변 캐시 - 같은 질문/필터 재요청 시 답변 생성 생략 (검색 결과가 그대로일 때만 재사용)
+"""
+
+import hashlib
+import logging
+import unicodedata
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.core.cache.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class AnswerCache:
+    """(인덱스, (검색 설정, 필터, 정규화 질문) 해시) → (답변, 전체 hits, 원본 hits) 캐시"""
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 600.0,
+        min_overlap: float = 0.9
+    ):
+        """
+        답변 캐시 초기화
+
+        Args:
+            maxsize: 최대 캐시 항목 수
+            ttl: 캐시 만료 시간 (초)
+            min_overlap: 재사용에 필요한 원본 hit ID 집합의 최소 Jaccard 유사도
+        """
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.min_overlap = min_overlap
+
+        logger.info(f"답변 캐시 초기화: maxsize={maxsize}, ttl={ttl}s, min_overlap={min_overlap}")
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """전각/반각, 공백, 대소문자 차이를 무시하도록 질문 정규화"""
+        return " ".join(unicodedata.normalize("NFKC", query).split()).casefold()
+
+    def make_key(self, index_name: str, namespace: str, user_query: str) -> Tuple[str, str]:
+        """
+        캐시 키 생성
+
+        Args:
+            index_name: 검색 인덱스명 (인덱스 단위 무효화용)
+            namespace: 검색 설정/필터 구분 키
+            user_query: 사용자 질문
+
+        Returns:
+            Tuple: 캐시 키
+        """
+        normalized = self.normalize_query(user_query)
+        digest = hashlib.sha256(f"{namespace}|{normalized}".encode("utf-8")).hexdigest()
+        return (index_name, digest)
+
+    def get(
+        self,
+        key: Tuple[str, str],
+        hits: List[Dict[str, Any]]
+    ) -> Optional[Tuple[str, List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """
+        캐시된 답변 조회 (방금 검색한 hits가 캐시 당시 hits와 충분히 겹칠 때만 반환)
+
+        Args:
+            key: 캐시 키
+            hits: 이번 요청의 원본 검색 결과
+
+        Returns:
+            Tuple: (답변, 전체 hits, 원본 hits) 또는 None
+        """
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+
+        overlap = self._jaccard(self._hit_ids(hits), self._hit_ids(cached[2]))
+        if overlap < self.min_overlap:
+            # 색인 변경 등으로 검색 결과가 달라졌으면 새로 생성
+            self._cache.pop(key)
+            logger.debug(f"답변 캐시 무효 (검색 결과 겹침: {overlap:.2f})")
+            return None
+
+        logger.info(f"답변 캐시 히트 (검색 결과 겹침: {overlap:.2f})")
+        return cached
+
+    def set(
+        self,
+        key: Tuple[str, str],
+        answer: str,
+        total_hits: List[Dict[str, Any]],
+        hits: List[Dict[str, Any]]
+    ) -> None:
+        """
+        답변 저장
+
+        Args:
+            key: 캐시 키
+            answer: 생성된 답변
+            total_hits: 전체 컨텍스트 hits
+            hits: 원본 검색 hits
+        """
+        self._cache.set(key, (answer, total_hits, hits))
+
+    def invalidate(self, index_name: Optional[str] = None) -> int:
+        """
+        캐시 무효화 (문서 갱신 시 호출)
+
+        Args:
+            index_name: 무효화할 인덱스명 (None이면 전체)
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        if index_name is None:
+            removed = len(self._cache)
+            self._cache.clear()
+        else:
+            removed = self._cache.pop_where(lambda key: key[0] == index_name)
+
+        logger.info(f"답변 캐시 무효화: index={index_name or '전체'}, {removed}개 제거")
+        return removed
+
+    def clear(self) -> None:
+        """전체 캐시 비우기"""
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @staticmethod
+    def _hit_ids(hits: Iterable[Dict[str, Any]]) -> frozenset:
+        return frozenset(hit.get("_id") for hit in hits)
+
+    @staticmethod
+    def _jaccard(a: frozenset, b: frozenset) -> float:
+        if not a and not b:
+            return 1.0
+        return len(a & b) / len(a | b)
@@ -0,0 +1,138 @@
+"""
+디스크 기반 임베딩 저장소 (SQLite) - 프로세스 재시작/워커 간 임베딩 캐시 공유
+"""
+
+import os
+import sqlite3
+import threading
+import logging
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingStore:
+    """해시 키 → float32 벡터 BLOB을 저장하는 SQLite 저장소"""
+    
+    def __init__(self, db_path: str):
+        """
+        임베딩 저장소 초기화
+        
+        Args:
+            db_path: SQLite 파일 경로 (디렉토리가 없으면 생성)
+        """
+        db_dir = os.path.dirname(db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        
+        # 여러 스레드에서 하나의 커넥션을 락으로 보호하여 공유
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=5.0)
+        with self._lock:
+            # WAL 모드: 여러 워커 프로세스의 동시 읽기 허용
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS emb("
+                "hash BLOB PRIMARY KEY, model TEXT, dim INT, vec BLOB)"
+            )
+            self._conn.commit()
+        
+        logger.info(f"임베딩 저장소 초기화: {db_path}")
+    
+    @staticmethod
+    def _encode(vector: Sequence[float]) -> bytes:
+        """벡터를 float32 바이트로 인코딩"""
+        return np.asarray(vector, dtype=np.float32).tobytes()
+    
+    @staticmethod
+    def _decode(blob: bytes) -> np.ndarray:
+        """float32 바이트를 벡터로 디코딩 (복사 없이 읽기 전용 배열)"""
+        return np.frombuffer(blob, dtype=np.float32)
+    
+    def get(self, key: bytes, model: str) -> Optional[np.ndarray]:
+        """
+        저장된 벡터 조회
+        
+        Args:
+            key: 임베딩 캐시 키 (해시)
+            model: 모델명
+            
+        Returns:
+            np.ndarray: float32 벡터 (없으면 None)
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT vec FROM emb WHERE hash=? AND model=?", (key, model)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"임베딩 저장소 조회 실패: {e}")
+            return None
+        
+        return self._decode(row[0]) if row else None
+    
+    def get_many(self, keys: Sequence[bytes], model: str) -> Dict[bytes, np.ndarray]:
+        """
+        여러 벡터 일괄 조회
+        
+        Args:
+            keys: 임베딩 캐시 키 목록
+            model: 모델명
+            
+        Returns:
+            Dict: 키 → 벡터 (저장된 키만 포함)
+        """
+        if not keys:
+            return {}
+        
+        placeholders = ",".join("?" * len(keys))
+        try:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT hash, vec FROM emb WHERE model=? AND hash IN ({placeholders})",
+                    (model, *keys)
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"임베딩 저장소 일괄 조회 실패: {e}")
+            return {}
+        
+        return {bytes(key): self._decode(blob) for key, blob in rows}
+    
+    def put_many(self, items: Dict[bytes, Sequence[float]], model: str) -> None:
+        """
+        벡터 일괄 저장 (기존 키는 덮어씀)
+        
+        Args:
+            items: 키 → 벡터
+            model: 모델명
+        """
+        if not items:
+            return
+        
+        rows = [
+            (key, model, len(vector), self._encode(vector))
+            for key, vector in items.items()
+        ]
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO emb(hash, model, dim, vec) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"임베딩 저장소 저장 실패: {e}")
+    
+    def put(self, key: bytes, model: str, vector: Sequence[float]) -> None:
+        """벡터 저장"""
+        self.put_many({key: vector}, model)
+    
+    def close(self) -> None:
+        """커넥션 종료"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,122 @@
+"""
+검색 결과 캐시 - 동일 질문/필터에 대한 Elasticsearch 왕복 및 임베딩 계산 생략
+"""
+
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.cache.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+# 검색 결과 응답 구성에 실제로 사용되는 _source 필드 (메모리 사용량 제한용)
+DEFAULT_CACHED_SOURCE_FIELDS: Tuple[str, ...] = (
+    "minio_pdf_path",
+    "gcs_pdf_path",
+    "page_number",
+    "page",
+)
+
+
+class RetrievalCache:
+    """(인덱스, 검색 방식, top_k, 정규화 질문 해시, 필터) → 검색 hits 캐시"""
+
+    def __init__(
+        self,
+        maxsize: int = 2048,
+        ttl: float = 300.0,
+        source_fields: Sequence[str] = DEFAULT_CACHED_SOURCE_FIELDS
+    ):
+        """
+        검색 결과 캐시 초기화
+
+        Args:
+            maxsize: 최대 캐시 항목 수
+            ttl: 캐시 만료 시간 (초)
+            source_fields: hit에 보관할 _source 필드 목록
+        """
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.source_fields = tuple(source_fields)
+
+        logger.info(f"검색 결과 캐시 초기화: maxsize={maxsize}, ttl={ttl}s")
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """공백/대소문자 차이를 무시하도록 질문 정규화"""
+        return " ".join(query.split()).casefold()
+
+    def make_key(
+        self,
+        index_name: str,
+        search_method: str,
+        top_k: int,
+        query: str,
+        filter_str: str
+    ) -> Tuple[str, str, int, str, str]:
+        """
+        캐시 키 생성
+
+        Args:
+            index_name: 검색 인덱스명
+            search_method: 검색 방식
+            top_k: 검색 결과 수
+            query: 사용자 질문
+            filter_str: 필터 문자열
+
+        Returns:
+            Tuple: 캐시 키
+        """
+        digest = hashlib.sha1(self.normalize_query(query).encode("utf-8")).hexdigest()
+        return (index_name, search_method, top_k, digest, filter_str)
+
+    def get(self, key: Tuple) -> Optional[List[Dict[str, Any]]]:
+        """캐시된 hits 조회 (미스 시 None)"""
+        hits = self._cache.get(key)
+        if hits is not None:
+            logger.debug(f"검색 결과 캐시 히트: index={key[0]}, filter='{key[4]}'")
+        return hits
+
+    def set(self, key: Tuple, hits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        필요한 필드만 남긴 hits를 캐시에 저장
+
+        Args:
+            key: 캐시 키
+            hits: Elasticsearch 검색 결과
+
+        Returns:
+            List[Dict]: 캐시에 저장된 축소 hits
+        """
+        slim_hits = [self._slim_hit(hit) for hit in hits]
+        self._cache.set(key, slim_hits)
+        return slim_hits
+
+    def invalidate(self, index_name: Optional[str] = None) -> int:
+        """
+        캐시 무효화 (인덱스 갱신 시 호출)
+
+        Args:
+            index_name: 무효화할 인덱스명 (None이면 전체)
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        if index_name is None:
+            removed = len(self._cache)
+            self._cache.clear()
+        else:
+            removed = self._cache.pop_where(lambda key: key[0] == index_name)
+
+        logger.info(f"검색 결과 캐시 무효화: index={index_name or '전체'}, {removed}개 제거")
+        return removed
+
+    def _slim_hit(self, hit: Dict[str, Any]) -> Dict[str, Any]:
+        """hit에서 응답 구성에 필요한 필드만 추출"""
+        src = hit.get("_source", {})
+        return {
+            "_id": hit.get("_id"),
+            "_score": hit.get("_score"),
+            "_source": {field: src[field] for field in self.source_fields if field in src},
+        }
@@ -0,0 +1,174 @@
+"""
+의미 기반(벡터 유사도) 답변 캐시 - 유사 질문에 대한 검색/생성 재실행 방지
+"""
+
+import time
+import threading
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.utils.vec_ops import l2_normalize
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SemanticCacheEntry:
+    """의미 캐시 항목"""
+    query: str
+    namespace: str
+    answer: str
+    total_hits: List[Dict[str, Any]]
+    hits: List[Dict[str, Any]]
+    expires_at: float
+
+
+class SemanticCache:
+    """정규화된 질문 임베딩의 내적(코사인 유사도) 기반 flat 인덱스 캐시"""
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        maxsize: int = 1000,
+        ttl: float = 300.0
+    ):
+        """
+        의미 캐시 초기화
+
+        Args:
+            threshold: 캐시 히트로 판단할 최소 코사인 유사도
+            maxsize: 최대 캐시 항목 수 (초과 시 LRU 방출)
+            ttl: 항목 만료 시간 (초)
+        """
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+        # 첫 항목 추가 시 차원에 맞춰 할당
+        self._vectors: Optional[np.ndarray] = None                 # (maxsize, dim) float32
+        self._valid = np.zeros(maxsize, dtype=bool)                 # 슬롯 사용 여부
+        self._namespace_ids = np.full(maxsize, -1, dtype=np.int32)  # 슬롯별 namespace id
+        self._namespaces: Dict[str, int] = {}
+        self._entries: "OrderedDict[int, SemanticCacheEntry]" = OrderedDict()  # LRU 순서
+        self._free_slots: List[int] = list(range(maxsize - 1, -1, -1))
+        self._lock = threading.Lock()
+
+        logger.info(f"의미 캐시 초기화: threshold={threshold}, maxsize={maxsize}, ttl={ttl}s")
+
+    def lookup(self, vector: Sequence[float], namespace: str) -> Optional[SemanticCacheEntry]:
+        """
+        가장 유사한 캐시 항목 조회
+
+        Args:
+            vector: 질문 임베딩
+            namespace: 캐시 구분 키 (인덱스/검색 방식/필터 등)
+
+        Returns:
+            SemanticCacheEntry: 유사도가 threshold 이상인 항목 (없으면 None)
+        """
+        query = l2_normalize(vector)
+
+        with self._lock:
+            namespace_id = self._namespaces.get(namespace)
+            if self._vectors is None or namespace_id is None:
+                return None
+            if query.shape[0] != self._vectors.shape[1]:
+                return None
+
+            mask = self._valid & (self._namespace_ids == namespace_id)
+            if not mask.any():
+                return None
+
+            scores = self._vectors @ query
+            scores[~mask] = -np.inf
+            slot = int(np.argmax(scores))
+            score = float(scores[slot])
+
+            if score < self.threshold:
+                return None
+
+            entry = self._entries[slot]
+            if entry.expires_at <= time.monotonic():
+                self._evict(slot)
+                return None
+
+            self._entries.move_to_end(slot)
+
+        logger.info(f"의미 캐시 히트 (유사도: {score:.3f}): '{entry.query[:50]}'")
+        return entry
+
+    def add(
+        self,
+        vector: Sequence[float],
+        namespace: str,
+        query: str,
+        answer: str,
+        total_hits: List[Dict[str, Any]],
+        hits: List[Dict[str, Any]]
+    ) -> None:
+        """
+        캐시 항목 추가
+
+        Args:
+            vector: 질문 임베딩
+            namespace: 캐시 구분 키
+            query: 원본 질문
+            answer: 생성된 답변
+            total_hits: 전체 컨텍스트 hits
+            hits: 원본 검색 hits
+        """
+        normalized = l2_normalize(vector)
+
+        with self._lock:
+            if self._vectors is None:
+                self._vectors = np.zeros((self.maxsize, normalized.shape[0]), dtype=np.float32)
+            elif normalized.shape[0] != self._vectors.shape[1]:
+                logger.warning("의미 캐시 차원 불일치로 저장 생략")
+                return
+
+            self._evict_expired()
+            if not self._free_slots:
+                # 가장 오래 사용되지 않은 항목 방출
+                self._evict(next(iter(self._entries)))
+
+            namespace_id = self._namespaces.setdefault(namespace, len(self._namespaces))
+            slot = self._free_slots.pop()
+
+            self._vectors[slot] = normalized
+            self._valid[slot] = True
+            self._namespace_ids[slot] = namespace_id
+            self._entries[slot] = SemanticCacheEntry(
+                query=query,
+                namespace=namespace,
+                answer=answer,
+                total_hits=total_hits,
+                hits=hits,
+                expires_at=time.monotonic() + self.ttl
+            )
+
+    def clear(self) -> None:
+        """전체 캐시 비우기"""
+        with self._lock:
+            for slot in list(self._entries):
+                self._evict(slot)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _evict(self, slot: int) -> None:
+        """슬롯 비우기 (락 보유 상태에서 호출)"""
+        del self._entries[slot]
+        self._valid[slot] = False
+        self._namespace_ids[slot] = -1
+        self._free_slots.append(slot)
+
+    def _evict_expired(self) -> None:
+        """만료 항목 일괄 제거 (락 보유 상태에서 호출)"""
+        now = time.monotonic()
+        for slot in [s for s, entry in self._entries.items() if entry.expires_at <= now]:
+            self._evict(slot)
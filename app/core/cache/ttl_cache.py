@@ -0,0 +1,106 @@
+"""
+스레드 안전한 TTL + LRU 캐시
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, Optional
+
+
+# get()에서 None 값과 미스를 구분하기 위한 센티널
+_MISSING = object()
+
+
+class TTLCache:
+    """만료 시간(TTL)과 최대 크기(LRU 방출)를 가지는 인메모리 캐시"""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = 300.0):
+        """
+        캐시 초기화
+
+        Args:
+            maxsize: 최대 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+            ttl: 항목 만료 시간 (초, None이면 만료 없이 LRU로만 동작)
+        """
+        if maxsize <= 0:
+            raise ValueError(f"maxsize는 1 이상이어야 합니다: {maxsize}")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        캐시 조회 (만료된 항목은 제거 후 default 반환)
+
+        Args:
+            key: 캐시 키
+            default: 미스 시 반환값
+
+        Returns:
+            캐시된 값 또는 default
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+        """
+        with self._lock:
+            expires_at = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """캐시 항목 제거 후 값 반환"""
+        with self._lock:
+            item = self._data.pop(key, None)
+            return default if item is None else item[1]
+
+    def pop_where(self, predicate: Callable[[Hashable], bool]) -> int:
+        """
+        조건에 맞는 키의 항목 일괄 제거
+
+        Args:
+            predicate: 키를 받아 제거 여부를 반환하는 함수
+
+        Returns:
+            int: 제거된 항목 수
+        """
+        with self._lock:
+            targets: List[Hashable] = [key for key in self._data if predicate(key)]
+            for key in targets:
+                del self._data[key]
+            return len(targets)
+
+    def clear(self) -> None:
+        """전체 캐시 비우기"""
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -0,0 +1,152 @@
+"""
+임베딩 결과 캐시 래퍼 - 동일 텍스트의 임베딩 API 재호출 방지
+"""
+
+import hashlib
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.core.embedding.base_embedder import BaseEmbedder
+from app.utils.vec_ops import as_float32
+from app.core.cache.ttl_cache import TTLCache
+from app.core.cache.embedding_store import EmbeddingStore
+
+logger = logging.getLogger(__name__)
+
+# 질문 측 태스크 (사용자 입력이라 공백 차이만 있는 동일 질문이 반복됨)
+_QUERY_TASKS = frozenset({"RETRIEVAL_QUERY", "QUESTION_ANSWERING", "FACT_VERIFICATION"})
+
+
+class CachedEmbedder(BaseEmbedder):
+    """
+    임의의 임베딩 모델을 감싸 결과를 LRU 캐시하는 구현 (선택적으로 디스크 저장소 사용)
+    
+    벡터는 float32 ndarray로 보관/반환한다 (list[float] 대비 메모리 1/4 이하,
+    Elasticsearch 직렬화기와 벡터 연산에서 그대로 사용 가능).
+    """
+    
+    def __init__(
+        self,
+        inner: BaseEmbedder,
+        maxsize: int = 10_000,
+        store: Optional[EmbeddingStore] = None
+    ):
+        """
+        캐시 임베더 초기화
+        
+        Args:
+            inner: 실제 임베딩을 수행할 임베딩 모델
+            maxsize: 최대 메모리 캐시 항목 수
+            store: 디스크 임베딩 저장소 (메모리 캐시 미스 시 조회, None이면 미사용)
+        """
+        self.inner = inner
+        self._cache = TTLCache(maxsize=maxsize, ttl=None)
+        self._store = store
+        
+        logger.info(f"임베딩 캐시 적용: {inner.model_name} (maxsize={maxsize})")
+    
+    @staticmethod
+    def _normalize_text(text: str, task: str) -> str:
+        """질문 측 태스크는 연속 공백/앞뒤 공백을 정리해 같은 질문이 같은 키를 갖도록 함"""
+        if task in _QUERY_TASKS:
+            return " ".join(text.split())
+        return text
+    
+    def _make_key(self, text: str, task: str, dimensionality: int) -> bytes:
+        """(모델, 태스크, 차원, 텍스트) 기반 캐시 키 생성"""
+        raw = f"{self.inner.model_name}\0{task}\0{dimensionality}\0{text}"
+        return hashlib.sha256(raw.encode("utf-8")).digest()
+    
+    def embed_text(
+        self,
+        text: str,
+        task: str = "RETRIEVAL_DOCUMENT",
+        dimensionality: Optional[int] = None
+    ) -> np.ndarray:
+        """텍스트를 임베딩 벡터로 변환 (캐시 우선, float32 ndarray 반환)"""
+        dimensionality = dimensionality or self.inner.default_dimensionality
+        text = self._normalize_text(text, task)
+        key = self._make_key(text, task, dimensionality)
+        
+        vector = self._cache.get(key)
+        if vector is not None:
+            logger.debug("임베딩 캐시 히트")
+            return vector
+        
+        if self._store is not None:
+            vector = self._store.get(key, self.inner.model_name)
+            if vector is not None:
+                logger.debug("임베딩 저장소 히트")
+                self._cache.set(key, vector)
+                return vector
+        
+        # 캐시 락은 원격 호출 동안 잡지 않음
+        vector = as_float32(self.inner.embed_text(text, task=task, dimensionality=dimensionality))
+        self._cache.set(key, vector)
+        if self._store is not None:
+            self._store.put(key, self.inner.model_name, vector)
+        return vector
+    
+    def embed_batch(
+        self,
+        texts: List[str],
+        task: str = "RETRIEVAL_DOCUMENT",
+        dimensionality: Optional[int] = None
+    ) -> List[np.ndarray]:
+        """여러 텍스트를 배치로 임베딩 (캐시 미스만 중복 제거 후 한 번에 원격 호출)"""
+        dimensionality = dimensionality or self.inner.default_dimensionality
+        texts = [self._normalize_text(text, task) for text in texts]
+        keys = [self._make_key(text, task, dimensionality) for text in texts]
+        
+        results: List[Optional[np.ndarray]] = [self._cache.get(key) for key in keys]
+        
+        # 캐시 미스 텍스트를 키 기준으로 중복 제거 (키 → 결과 위치 목록)
+        miss_positions: Dict[bytes, List[int]] = {}
+        for i, vector in enumerate(results):
+            if vector is None:
+                miss_positions.setdefault(keys[i], []).append(i)
+        
+        # 메모리 캐시 미스는 디스크 저장소에서 먼저 조회
+        if miss_positions and self._store is not None:
+            stored = self._store.get_many(list(miss_positions), self.inner.model_name)
+            for key, vector in stored.items():
+                self._cache.set(key, vector)
+                for i in miss_positions.pop(key):
+                    results[i] = vector
+        
+        if miss_positions:
+            miss_vectors = self.inner.embed_batch(
+                [texts[positions[0]] for positions in miss_positions.values()],
+                task=task,
+                dimensionality=dimensionality
+            )
+            miss_vectors = [as_float32(vector) for vector in miss_vectors]
+            for (key, positions), vector in zip(miss_positions.items(), miss_vectors):
+                self._cache.set(key, vector)
+                for i in positions:
+                    results[i] = vector
+            
+            if self._store is not None:
+                self._store.put_many(
+                    dict(zip(miss_positions, miss_vectors)), self.inner.model_name
+                )
+        
+        logger.debug(f"배치 임베딩: {len(texts)}개 요청, {len(miss_positions)}개 원격 호출")
+        return results
+    
+    @property
+    def model_name(self) -> str:
+        """모델명 반환"""
+        return self.inner.model_name
+    
+    @property
+    def need_translation(self) -> bool:
+        """번역이 필요한지 여부 반환"""
+        return self.inner.need_translation
+    
+    @property
+    def default_dimensionality(self) -> int:
+        """기본 차원 수 반환"""
+        return self.inner.default_dimensionality
@@ -3,6 +3,8 @@ Google 임베딩 모델 구현
 """
 
 from typing import List, Optional
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from google import genai
 from google.genai.types import EmbedContentConfig
@@ -13,6 +15,33 @@ from app.config.secrets_config import GoogleCloudSecrets
 
 logger = logging.getLogger(__name__)
 
+# Vertex AI 임베딩 API의 요청당 최대 텍스트 수
+MAX_BATCH_SIZE = 250
+
+# 배치 임베딩 시 동시에 보낼 최대 요청 수
+MAX_CONCURRENT_BATCHES = 4
+
+
+@lru_cache(maxsize=8)
+def get_google_embedder(
+    model_name: str,
+    project_id: Optional[str] = None,
+    location: Optional[str] = None
+) -> "GoogleEmbedder":
+    """
+    프로세스 공용 Google 임베딩 모델 반환 (동일 모델/프로젝트는 하나의 인스턴스 공유)
+    
+    Args:
+        model_name: 사용할 모델명
+        project_id: Google Cloud 프로젝트 ID (None이면 환경변수 사용)
+        location: Vertex AI 리전
+        
+    Returns:
+        GoogleEmbedder: 공용 임베딩 모델
+    """
+    secrets = GoogleCloudSecrets(project_id=project_id, location=location) if project_id else None
+    return GoogleEmbedder(model_name, secrets)
+
 
 class GoogleEmbedder(BaseEmbedder):
     """Google 임베딩 모델 구현"""
@@ -20,7 +49,8 @@ class GoogleEmbedder(BaseEmbedder):
     def __init__(
         self, 
         model_name: str = "text-embedding-004",
-        secrets: Optional[GoogleCloudSecrets] = None
+        secrets: Optional[GoogleCloudSecrets] = None,
+        batch_size: int = MAX_BATCH_SIZE
     ):
         """
         Google 임베딩 모델 초기화
@@ -28,8 +58,10 @@ class GoogleEmbedder(BaseEmbedder):
         Args:
             model_name: 사용할 모델명
             secrets: Google Cloud 인증 정보 (None이면 환경변수 사용)
+            batch_size: 배치 임베딩 요청당 텍스트 수 (최대 MAX_BATCH_SIZE, 요청당 토큰 한도를 넘으면 줄임)
         """
         self._model_name = model_name
+        self.batch_size = max(1, min(batch_size, MAX_BATCH_SIZE))
         
         # genai 클라이언트 초기화
         if secrets:
@@ -86,7 +118,7 @@ class GoogleEmbedder(BaseEmbedder):
         task: str = "RETRIEVAL_DOCUMENT",
         dimensionality: Optional[int] = None
     ) -> List[List[float]]:
-        """여러 텍스트를 배치로 임베딩"""
+        """여러 텍스트를 배치로 임베딩 (batch_size 단위로 나누어 요청, 여러 요청은 동시 전송)"""
         try:
             # 설정 구성
             config = EmbedContentConfig(
@@ -94,14 +126,28 @@ class GoogleEmbedder(BaseEmbedder):
                 output_dimensionality=dimensionality or self._default_dimensionality
             )
             
-            # 배치 임베딩 생성
-            response = self.client.models.embed_content(
-                model=self._model_name,
-                contents=texts,
-                config=config
-            )
+            def embed_chunk(chunk: List[str]) -> List[List[float]]:
+                response = self.client.models.embed_content(
+                    model=self._model_name,
+                    contents=chunk,
+                    config=config
+                )
+                return [embedding.values for embedding in response.embeddings]
+            
+            chunks = [
+                texts[start:start + self.batch_size]
+                for start in range(0, len(texts), self.batch_size)
+            ]
+            if len(chunks) <= 1:
+                return embed_chunk(chunks[0]) if chunks else []
+            
+            # 요청 순서대로 결과 병합 (map은 입력 순서 유지)
+            vectors = []
+            with ThreadPoolExecutor(max_workers=min(len(chunks), MAX_CONCURRENT_BATCHES)) as executor:
+                for chunk_vectors in executor.map(embed_chunk, chunks):
+                    vectors.extend(chunk_vectors)
             
-            return [embedding.values for embedding in response.embeddings]
+            return vectors
             
         except Exception as e:
             logger.error(f"배치 임베딩 생성 실패: {e}")
@@ -3,7 +3,8 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
+import asyncio
 from google.genai import types
 
 
@@ -89,6 +90,69 @@ class BaseGenerator(ABC):
             str: 생성된 텍스트 청크
         """
         pass
+    
+    async def agenerate_multimodal(
+        self,
+        parts: List[types.Part],
+        model: Optional[str] = None,
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        비동기 멀티모달 생성 (기본 구현은 동기 메서드를 스레드에서 실행, 구현체에서 네이티브 비동기로 대체 가능)
+        
+        Args:
+            parts: 입력 파트들 (텍스트, 이미지 등)
+            model: 사용할 모델명
+            generation_config: 생성 설정
+            
+        Returns:
+            str: 생성된 텍스트
+        """
+        return await asyncio.to_thread(self.generate_multimodal, parts, model, generation_config)
+    
+    async def agenerate_multimodal_stream(
+        self,
+        parts: List[types.Part],
+        model: Optional[str] = None,
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        비동기 스트리밍 멀티모달 생성 (기본 구현은 동기 스트림의 각 청크를 스레드에서 대기)
+        
+        Args:
+            parts: 입력 파트들 (텍스트, 이미지 등)
+            model: 사용할 모델명
+            generation_config: 생성 설정
+            
+        Yields:
+            str: 생성된 텍스트 청크
+        """
+        stream = self.generate_multimodal_stream(parts, model, generation_config)
+        done = object()
+        while True:
+            chunk = await asyncio.to_thread(next, stream, done)
+            if chunk is done:
+                break
+            yield chunk
+    
+    def create_prompt_cache(
+        self,
+        system_instruction: str,
+        ttl_seconds: int,
+        model: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        고정 시스템 프롬프트를 서버 측 컨텍스트 캐시로 등록 (미지원 구현체는 None 반환)
+        
+        Args:
+            system_instruction: 캐시할 시스템 프롬프트
+            ttl_seconds: 캐시 유지 시간 (초)
+            model: 캐시를 사용할 모델명
+            
+        Returns:
+            str: 생성 설정의 cached_content로 전달할 캐시 이름 또는 None
+        """
+        return None
 
 
     @property
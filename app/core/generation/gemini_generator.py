@@ -2,7 +2,8 @@
 Gemini 생성 모델 구현
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, AsyncIterator
+from functools import lru_cache
 import logging
 from google import genai
 from google.genai import types
@@ -13,6 +14,56 @@ from app.config.secrets_config import GoogleCloudSecrets
 logger = logging.getLogger(__name__)
 
 
+# 기본 생성 파라미터
+_DEFAULT_TEMPERATURE = 0.7
+_DEFAULT_TOP_P = 1.0
+_DEFAULT_MAX_OUTPUT_TOKENS = 2048
+
+# Safety settings (항상 포함, 모든 설정 객체가 공유)
+_SAFETY_SETTINGS = [
+    types.SafetySetting(
+        category="HARM_CATEGORY_HATE_SPEECH",
+        threshold="OFF"
+    ),
+    types.SafetySetting(
+        category="HARM_CATEGORY_DANGEROUS_CONTENT", 
+        threshold="OFF"
+    ),
+    types.SafetySetting(
+        category="HARM_CATEGORY_SEXUALLY_EXPLICIT",
+        threshold="OFF"
+    ),
+    types.SafetySetting(
+        category="HARM_CATEGORY_HARASSMENT",
+        threshold="OFF"
+    )
+]
+
+
+@lru_cache(maxsize=64)
+def _build_generation_config(
+    temperature: float,
+    top_p: float,
+    max_output_tokens: int,
+    cached_content: Optional[str] = None,
+    response_mime_type: Optional[str] = None
+) -> types.GenerateContentConfig:
+    """생성 파라미터 조합별 GenerateContentConfig 생성 (캐시)"""
+    return types.GenerateContentConfig(
+        temperature=temperature,
+        top_p=top_p,
+        max_output_tokens=max_output_tokens,
+        safety_settings=_SAFETY_SETTINGS,
+        cached_content=cached_content,
+        response_mime_type=response_mime_type
+    )
+
+
+_DEFAULT_GENERATION_CONFIG = _build_generation_config(
+    _DEFAULT_TEMPERATURE, _DEFAULT_TOP_P, _DEFAULT_MAX_OUTPUT_TOKENS
+)
+
+
 class GeminiGenerator(BaseGenerator):
     """Gemini 생성 모델 구현"""
     
@@ -99,12 +150,43 @@ class GeminiGenerator(BaseGenerator):
             logger.error(f"멀티모달 생성 실패: {e}")
             raise
     
+    async def agenerate_multimodal(
+        self,
+        parts: List[types.Part],
+        model: Optional[str] = None,
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """비동기 멀티모달 생성 (응답 대기 중 스레드를 점유하지 않음)"""
+        try:
+            model_name = model or self._default_model
+            
+            contents = [
+                types.Content(
+                    role="user",
+                    parts=parts
+                )
+            ]
+            
+            config = self._create_generation_config(generation_config)
+            
+            response = await self.client.aio.models.generate_content(
+                model=model_name,
+                contents=contents,
+                config=config
+            )
+            
+            return response.text
+            
+        except Exception as e:
+            logger.error(f"비동기 멀티모달 생성 실패: {e}")
+            raise
+    
     def generate_text_stream(
         self,
         prompt: str,
         model: Optional[str] = None,
         generation_config: Optional[Dict[str, Any]] = None
-    ):
+    ) -> Iterator[str]:
         """스트리밍 텍스트 생성"""
         try:
             model_name = model or self._default_model
@@ -125,7 +207,9 @@ class GeminiGenerator(BaseGenerator):
                 contents=contents,
                 config=config
             ):
-                yield chunk.text
+                # 종료/메타데이터 청크는 text가 None이므로 건너뜀
+                if chunk.text:
+                    yield chunk.text
                 
         except Exception as e:
             logger.error(f"스트리밍 텍스트 생성 실패: {e}")
@@ -136,7 +220,7 @@ class GeminiGenerator(BaseGenerator):
         parts: List[types.Part],
         model: Optional[str] = None,
         generation_config: Optional[Dict[str, Any]] = None
-    ):
+    ) -> Iterator[str]:
         """스트리밍 멀티모달 생성 (텍스트 + 이미지)"""
         try:
             model_name = model or self._default_model
@@ -157,53 +241,82 @@ class GeminiGenerator(BaseGenerator):
                 contents=contents,
                 config=config
             ):
-                yield chunk.text
+                # 종료/메타데이터 청크는 text가 None이므로 건너뜀
+                if chunk.text:
+                    yield chunk.text
                 
         except Exception as e:
             logger.error(f"스트리밍 멀티모달 생성 실패: {e}")
             raise
     
+    async def agenerate_multimodal_stream(
+        self,
+        parts: List[types.Part],
+        model: Optional[str] = None,
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """비동기 스트리밍 멀티모달 생성 (청크 대기 중 스레드를 점유하지 않음)"""
+        try:
+            model_name = model or self._default_model
+            
+            contents = [
+                types.Content(
+                    role="user",
+                    parts=parts
+                )
+            ]
+            
+            config = self._create_generation_config(generation_config)
+            
+            async for chunk in await self.client.aio.models.generate_content_stream(
+                model=model_name,
+                contents=contents,
+                config=config
+            ):
+                # 종료/메타데이터 청크는 text가 None이므로 건너뜀
+                if chunk.text:
+                    yield chunk.text
+                
+        except Exception as e:
+            logger.error(f"비동기 스트리밍 멀티모달 생성 실패: {e}")
+            raise
+    
     def _create_generation_config(self, user_config: Optional[Dict[str, Any]] = None) -> types.GenerateContentConfig:
-        """GenerateContentConfig 객체 생성"""
-        
-        # 기본 설정
-        config_dict = {
-            "temperature": 0.7,
-            "top_p": 1.0,
-            "max_output_tokens": 2048
-        }
-        
-        # 사용자 설정으로 업데이트
-        if user_config:
-            config_dict.update(user_config)
-        
-        # Safety settings (항상 포함)
-        safety_settings = [
-            types.SafetySetting(
-                category="HARM_CATEGORY_HATE_SPEECH",
-                threshold="OFF"
-            ),
-            types.SafetySetting(
-                category="HARM_CATEGORY_DANGEROUS_CONTENT", 
-                threshold="OFF"
-            ),
-            types.SafetySetting(
-                category="HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                threshold="OFF"
-            ),
-            types.SafetySetting(
-                category="HARM_CATEGORY_HARASSMENT",
-                threshold="OFF"
-            )
-        ]
+        """GenerateContentConfig 객체 반환 (동일 설정은 캐시된 객체 재사용)"""
+        if not user_config:
+            return _DEFAULT_GENERATION_CONFIG
         
-        return types.GenerateContentConfig(
-            temperature=config_dict.get("temperature", 0.7),
-            top_p=config_dict.get("top_p", 1.0),
-            max_output_tokens=config_dict.get("max_output_tokens", 2048),
-            safety_settings=safety_settings
+        return _build_generation_config(
+            user_config.get("temperature", _DEFAULT_TEMPERATURE),
+            user_config.get("top_p", _DEFAULT_TOP_P),
+            user_config.get("max_output_tokens", _DEFAULT_MAX_OUTPUT_TOKENS),
+            user_config.get("cached_content"),
+            user_config.get("response_mime_type")
         )
     
+    def create_prompt_cache(
+        self,
+        system_instruction: str,
+        ttl_seconds: int,
+        model: Optional[str] = None
+    ) -> Optional[str]:
+        """시스템 프롬프트를 Vertex AI 컨텍스트 캐시로 등록 (최소 토큰 수 미달 등 실패 시 None)"""
+        model_name = model or self._default_model
+        try:
+            cache = self.client.caches.create(
+                model=model_name,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=system_instruction,
+                    ttl=f"{ttl_seconds}s"
+                )
+            )
+            logger.info(f"프롬프트 컨텍스트 캐시 생성: {cache.name} (ttl={ttl_seconds}s)")
+            return cache.name
+            
+        except Exception as e:
+            logger.warning(f"프롬프트 컨텍스트 캐시 생성 실패, 전체 프롬프트로 요청: {e}")
+            return None
+    
     @property
     def default_model(self) -> str:
         """기본 모델명 반환"""
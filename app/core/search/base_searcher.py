@@ -50,7 +50,8 @@ class BaseSearcher(ABC):
         query_vector: List[float],
         vector_field: str,
         top_k: int,
-        filters: Optional[List[Dict[str, Any]]] = None
+        filters: Optional[List[Dict[str, Any]]] = None,
+        num_candidates: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         벡터 검색
@@ -61,6 +62,7 @@ class BaseSearcher(ABC):
             vector_field: 벡터 필드명
             top_k: 반환할 결과 개수
             filters: 적용할 필터들
+            num_candidates: ANN 탐색 후보 수 (None이면 top_k에 맞춰 자동 결정)
             
         Returns:
             List[Dict]: 검색 결과
@@ -99,6 +101,69 @@ class BaseSearcher(ABC):
         """
         pass
     
+    def hybrid_search_batch(
+        self,
+        index_name: str,
+        queries: List[str],
+        query_vectors: List[List[float]],
+        text_fields: List[str],
+        vector_field: str,
+        top_k: int,
+        fusion_method: str = "convex",
+        fusion_params: Optional[Dict[str, Any]] = None,
+        filters_list: Optional[List[Optional[List[Dict[str, Any]]]]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        여러 질의의 하이브리드 검색 (기본 구현은 질의별 hybrid_search 반복, 구현체에서 일괄 요청으로 대체 가능)
+        
+        Args:
+            index_name: 인덱스명
+            queries: 텍스트 쿼리 목록
+            query_vectors: 쿼리 벡터 목록 (queries와 같은 순서)
+            text_fields: 텍스트 검색 대상 필드들
+            vector_field: 벡터 필드명
+            top_k: 질의별 반환할 결과 개수
+            fusion_method: score 정규화 방식
+            fusion_params: fusion method 관련 파라미터
+            filters_list: 질의별 필터 목록 (None이면 필터 없음)
+            
+        Returns:
+            List[List[Dict]]: 입력 순서대로의 검색 결과
+        """
+        filters_list = filters_list or [None] * len(queries)
+        return [
+            self.hybrid_search(
+                index_name, query, query_vector, text_fields, vector_field,
+                top_k, fusion_method, fusion_params, filters
+            )
+            for query, query_vector, filters in zip(queries, query_vectors, filters_list)
+        ]
+    
+    def has_field(self, index_name: str, field: str) -> bool:
+        """
+        인덱스 매핑에 필드(멀티필드 서브필드 포함)가 있는지 확인 (기본 구현은 확인 불가로 False)
+        
+        Args:
+            index_name: 인덱스명
+            field: 필드명 (점 표기 가능, 예: "folder_levels.keyword")
+            
+        Returns:
+            bool: 필드 존재 여부
+        """
+        return False
+    
+    def invalidate_cache(self, index_name: Optional[str] = None) -> int:
+        """
+        검색기 내부 캐시 무효화 (기본 구현은 캐시가 없으므로 0)
+        
+        Args:
+            index_name: 무효화할 인덱스명 (None이면 전체)
+            
+        Returns:
+            int: 제거된 항목 수
+        """
+        return 0
+    
     @abstractmethod
     def expand_search_results(
         self,
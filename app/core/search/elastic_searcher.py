@@ -3,41 +3,205 @@ Elasticsearch 검색기 구현
 """
 
 from typing import List, Dict, Any, Optional, Tuple
+from functools import lru_cache
 import logging
-from elasticsearch import Elasticsearch
+from elasticsearch import Elasticsearch, ConnectionError as ESConnectionError
+from elastic_transport import DEFAULT
 
 from app.core.search.base_searcher import BaseSearcher
+from app.core.cache.ttl_cache import TTLCache
 from app.config.secrets_config import ElasticsearchSecrets
 from app.config.pipeline_config import ElasticsearchConfig
 
 logger = logging.getLogger(__name__)
 
 
+# 검색 응답에서 실제로 사용하는 부분만 받기 위한 filter_path
+SEARCH_FILTER_PATH = ["hits.hits._id", "hits.hits._score", "hits.hits._source"]
+
+# 페이지 번호 문자열 테이블 (page_number 필드는 5자리 zero-padding 문자열)
+MAX_PAGES = 100_000
+PAGE_FMT: Tuple[str, ...] = tuple(f"{n:05d}" for n in range(MAX_PAGES))
+
+
+def format_page_number(page_num: int) -> str:
+    """페이지 번호를 page_number 필드 형식(5자리 zero-padding)으로 변환"""
+    return PAGE_FMT[page_num] if page_num < MAX_PAGES else f"{page_num:05d}"
+
+
+def _build_json_serializers() -> Optional[Dict[str, Any]]:
+    """
+    orjson 기반 요청/응답 직렬화기 구성 (벡터가 포함된 본문의 float 직렬화 비용 절감)
+    
+    Returns:
+        Dict: mimetype → 직렬화기 (orjson 미설치 시 None, 기본 json 사용)
+    """
+    try:
+        import orjson
+        from elasticsearch.serializer import NdjsonSerializer, OrjsonSerializer
+    except ImportError:
+        logger.warning("orjson을 사용할 수 없어 기본 JSON 직렬화기 사용")
+        return None
+    
+    class OrjsonNdjsonSerializer(NdjsonSerializer):
+        """msearch 등 NDJSON 본문용 orjson 직렬화기"""
+        
+        def json_dumps(self, data: Any) -> bytes:
+            return orjson.dumps(data, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY)
+        
+        def json_loads(self, data: bytes) -> Any:
+            return orjson.loads(data)
+    
+    return {
+        OrjsonSerializer.mimetype: OrjsonSerializer(),
+        OrjsonNdjsonSerializer.mimetype: OrjsonNdjsonSerializer(),
+    }
+
+
+@lru_cache(maxsize=None)
+def get_es_client(
+    host: str,
+    username: str,
+    password: str,
+    verify_certs: bool = False,
+    request_timeout: int = 30,
+    max_retries: int = 3,
+    retry_on_timeout: bool = True,
+    connections_per_node: int = 64,
+    http_compress: bool = True,
+    node_class: str = "urllib3"
+) -> Elasticsearch:
+    """
+    프로세스 공용 Elasticsearch 클라이언트 반환 (동일 접속 정보는 하나의 커넥션 풀 공유)
+    
+    Args:
+        host: Elasticsearch 호스트
+        username: 사용자명
+        password: 비밀번호
+        verify_certs: 인증서 검증 여부
+        request_timeout: 요청 타임아웃 (초)
+        max_retries: 최대 재시도 횟수
+        retry_on_timeout: 타임아웃 시 재시도 여부
+        connections_per_node: 노드당 HTTP 커넥션 풀 크기
+        http_compress: 요청/응답 gzip 압축 여부
+        node_class: HTTP 노드 구현 (urllib3 | requests)
+        
+    Returns:
+        Elasticsearch: 공용 클라이언트
+    """
+    logger.info(
+        f"Elasticsearch 클라이언트 생성: {host} "
+        f"(node_class={node_class}, connections_per_node={connections_per_node})"
+    )
+    return Elasticsearch(
+        hosts=[host],
+        basic_auth=(username, password),
+        verify_certs=verify_certs,
+        request_timeout=request_timeout,
+        max_retries=max_retries,
+        retry_on_timeout=retry_on_timeout,
+        connections_per_node=connections_per_node,
+        http_compress=http_compress,
+        node_class=node_class,
+        serializers=_build_json_serializers() or DEFAULT,
+        # 단일 엔드포인트(게이트웨이) 접속이므로 스니핑으로 인한 추가 왕복 방지
+        sniff_on_start=False,
+        sniff_on_node_failure=False
+    )
+
+
+def resolve_num_candidates(k: int, num_candidates: Optional[int] = None) -> int:
+    """
+    knn num_candidates 결정 (HNSW 탐색 비용은 후보 수에 비례)
+    
+    Args:
+        k: knn으로 가져올 결과 수
+        num_candidates: 설정값 (None이면 max(k * 4, 64))
+        
+    Returns:
+        int: k 이상의 후보 수
+    """
+    if num_candidates is None:
+        num_candidates = max(k * 4, 64)
+    return max(num_candidates, k)
+
+
+def resolve_knn_window(top_k: int, window_size: Optional[int] = None) -> int:
+    """
+    하이브리드 검색의 knn k (융합 후보 수) 결정
+    
+    외부 size(top_k)와 별개로 knn 결과 수를 제한하며, 작을수록 HNSW 탐색 비용이 줄고
+    클수록 벡터 측 재현율이 높아짐
+    
+    Args:
+        top_k: 최종 반환할 결과 수
+        window_size: 설정값 (None이면 max(top_k * 2, 10))
+        
+    Returns:
+        int: top_k 이상의 knn k
+    """
+    return max(window_size or max(top_k * 2, 10), top_k)
+
+
 class ElasticSearcher(BaseSearcher):
     """Elasticsearch 구현"""
     
-    def __init__(self, secrets: ElasticsearchSecrets, config: ElasticsearchConfig):
+    def __init__(
+        self,
+        secrets: ElasticsearchSecrets,
+        config: ElasticsearchConfig,
+        filter_match_cache: Optional[TTLCache] = None
+    ):
         """
         Elasticsearch 클라이언트 초기화
         
         Args:
             secrets: Elasticsearch 인증 정보
             config: Elasticsearch 설정
+            filter_match_cache: 필터 사전 확인 결과 캐시 (None이면 기본 크기/TTL로 생성)
         """
-        self.conn = Elasticsearch(
-            hosts=[secrets.host],
-            basic_auth=secrets.get_credentials(),
+        # 검색기 인스턴스마다 새 클라이언트를 만들지 않고 공용 커넥션 풀 재사용
+        self.conn = get_es_client(
+            secrets.host,
+            *secrets.get_credentials(),
             verify_certs=config.verify_certs,
             request_timeout=config.request_timeout,
             max_retries=config.max_retries,
-            retry_on_timeout=config.retry_on_timeout
+            retry_on_timeout=config.retry_on_timeout,
+            connections_per_node=config.connections_per_node,
+            http_compress=config.http_compress,
+            node_class=config.node_class
         )
         
-        # 연결 테스트
-        if not self.ping():
-            raise ConnectionError(f"Elasticsearch 연결 실패: {secrets.host}")
+        # 생성 시 ping 왕복 없이 첫 요청에서 연결 확인
+        self.host = secrets.host
+        self._connection_verified = False
+        
+        # byte 인덱스 색인 시 사용한 보정 테이블 (질문 벡터에도 동일하게 적용)
+        self._quantizer = None
+        if config.quantizer_path:
+            from app.utils.quantize import Quantizer
+            self._quantizer = Quantizer.load(config.quantizer_path)
+        
+        # 응답 _source 필터 (top-k 결과마다 저장된 벡터를 읽어오지 않도록, 포함 필드 지정 시 그 외 필드도 생략)
+        self.source_excludes = list(config.source_excludes)
+        self.source_includes = list(config.source_includes) if config.source_includes else None
+        self.source_filter: Dict[str, List[str]] = {"excludes": self.source_excludes}
+        if self.source_includes:
+            self.source_filter["includes"] = self.source_includes
+        self.request_cache = config.request_cache
+        self.expand_max_should_clauses = config.expand_max_should_clauses
         
-        logger.info(f"Elasticsearch 연결 성공: {secrets.host}")
+        # (인덱스, 필터) → 필터에 해당하는 문서가 있음 (없음은 색인 직후 바로 반영되도록 캐시하지 않음)
+        self._filter_match_cache = filter_match_cache if filter_match_cache is not None else TTLCache(maxsize=512, ttl=300.0)
+        
+        # (인덱스, 벡터 필드) → dense_vector (element_type, similarity) 캐시
+        self._vector_mappings: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        
+        # (인덱스, 필드) → 매핑에 필드 존재 여부 캐시
+        self._field_exists: Dict[Tuple[str, str], bool] = {}
+        
+        logger.info(f"Elasticsearch 검색기 초기화: {secrets.host}")
     
     def ping(self) -> bool:
         """연결 상태 확인"""
@@ -47,48 +211,436 @@ class ElasticSearcher(BaseSearcher):
             logger.error(f"Elasticsearch ping 실패: {e}")
             return False
     
-    def keyword_search(
+    def force_merge(self, index_name: str, max_segments: int = 1) -> None:
+        """
+        인덱스 세그먼트 병합 (배포/색인 완료 후 1회 실행)
+        
+        HNSW 그래프는 세그먼트마다 따로 만들어지므로 샤드당 1개 세그먼트로 병합하면
+        knn 검색 시 그래프 탐색이 1회로 줄어듦. 색인이 계속되는 인덱스에는 사용하지 않음.
+        dense_vector 인덱스는 샤드 수가 적을수록 처리량이 좋으며, 대용량이어도 10개 이하 권장
+        
+        Args:
+            index_name: 인덱스명
+            max_segments: 샤드당 최대 세그먼트 수
+        """
+        logger.info(f"세그먼트 병합 시작: {index_name} (max_num_segments={max_segments})")
+        self._request(
+            self.conn.indices.forcemerge,
+            index=index_name,
+            max_num_segments=max_segments,
+            wait_for_completion=True
+        )
+        logger.info(f"세그먼트 병합 완료: {index_name}")
+    
+    def warmup(
         self,
         index_name: str,
-        query: str,
-        text_fields: List[str],
-        top_k: int,
-        filters: Optional[List[Dict[str, Any]]] = None
+        sample_vector: List[float],
+        vector_field: str,
+        iters: int = 5
+    ) -> None:
+        """
+        knn 검색을 미리 실행하여 HNSW 그래프를 메모리에 적재 (첫 사용자 질의의 cold 지연 방지)
+        
+        Args:
+            index_name: 인덱스명
+            sample_vector: 워밍업용 질문 벡터
+            vector_field: 벡터 필드명
+            iters: 반복 횟수
+        """
+        for _ in range(iters):
+            try:
+                self.vector_search(index_name, sample_vector, vector_field, top_k=10)
+            except Exception as e:
+                logger.warning(f"워밍업 검색 실패: {index_name} ({e})")
+                return
+        logger.info(f"워밍업 완료: {index_name} ({iters}회)")
+    
+    def _request(self, method, **kwargs) -> Any:
+        """
+        Elasticsearch 요청 실행 (연결 확인 전 첫 연결 오류는 1회 재시도)
+        
+        Args:
+            method: 클라이언트 메서드 (예: self.conn.search)
+            **kwargs: 요청 인자
+            
+        Returns:
+            Elasticsearch 응답
+        """
+        try:
+            response = method(**kwargs)
+        except ESConnectionError as e:
+            if self._connection_verified:
+                raise
+            logger.error(f"Elasticsearch 연결 실패: {self.host} ({e}) - 1회 재시도")
+            response = method(**kwargs)
+        
+        if not self._connection_verified:
+            self._connection_verified = True
+            logger.info(f"Elasticsearch 연결 확인: {self.host}")
+        return response
+    
+    def _get_vector_mapping(self, index_name: str, vector_field: str) -> Tuple[str, str]:
+        """
+        벡터 필드의 dense_vector 매핑 조회 (인덱스별 최초 1회만 매핑 조회)
+        
+        Args:
+            index_name: 인덱스명
+            vector_field: 벡터 필드명 (점 표기 가능)
+            
+        Returns:
+            Tuple: (element_type, similarity), 조회 실패 시 ("float", "cosine")
+        """
+        key = (index_name, vector_field)
+        mapping = self._vector_mappings.get(key)
+        if mapping is not None:
+            return mapping
+        
+        element_type, similarity = "float", "cosine"
+        try:
+            response = self._request(self.conn.indices.get_mapping, index=index_name)
+            for index_mapping in response.values():
+                properties = index_mapping.get("mappings", {}).get("properties", {})
+                field_mapping = {}
+                for part in vector_field.split("."):
+                    field_mapping = properties.get(part, {})
+                    properties = field_mapping.get("properties", {})
+                element_type = field_mapping.get("element_type", "float")
+                similarity = field_mapping.get("similarity", "cosine")
+                break
+        except Exception as e:
+            logger.warning(f"벡터 필드 매핑 조회 실패 (float/cosine으로 간주): {e}")
+        
+        mapping = (element_type, similarity)
+        self._vector_mappings[key] = mapping
+        logger.info(
+            f"벡터 필드 매핑: {index_name}.{vector_field} = "
+            f"element_type={element_type}, similarity={similarity}"
+        )
+        return mapping
+    
+    def has_field(self, index_name: str, field: str) -> bool:
+        """
+        인덱스 매핑에 필드(멀티필드 서브필드 포함)가 있는지 확인 (인덱스/필드별 최초 1회만 매핑 조회)
+        
+        Args:
+            index_name: 인덱스명
+            field: 필드명 (점 표기 가능, 예: "folder_levels.keyword")
+            
+        Returns:
+            bool: 필드 존재 여부 (매핑 조회 실패 시 False, 실패 결과는 캐시하지 않음)
+        """
+        key = (index_name, field)
+        exists = self._field_exists.get(key)
+        if exists is not None:
+            return exists
+        
+        try:
+            response = self._request(self.conn.indices.get_mapping, index=index_name)
+        except Exception as e:
+            logger.warning(f"필드 매핑 조회 실패 ({index_name}.{field}): {e}")
+            return False
+        
+        exists = bool(response)
+        for index_mapping in response.values():
+            # 객체 하위 필드는 properties, 멀티필드(.keyword 등)는 fields 아래에 있음
+            children = index_mapping.get("mappings", {}).get("properties", {})
+            for part in field.split("."):
+                field_mapping = children.get(part)
+                if field_mapping is None:
+                    exists = False
+                    break
+                children = {**field_mapping.get("properties", {}), **field_mapping.get("fields", {})}
+            if not exists:
+                break
+        
+        self._field_exists[key] = exists
+        logger.info(f"필드 매핑 확인: {index_name}.{field} = {'있음' if exists else '없음'}")
+        return exists
+    
+    def _prepare_query_vector(
+        self,
+        index_name: str,
+        vector_field: str,
+        query_vector: List[float]
+    ) -> List[Any]:
+        """
+        인덱스 벡터 매핑에 맞게 쿼리 벡터 변환
+        (byte 인덱스면 int8 양자화, dot_product 인덱스면 단위 벡터로 정규화)
+        
+        보정 테이블이 설정되어 있으면 색인과 같은 차원별 scale/zero_point를 사용한다.
+        
+        Args:
+            index_name: 인덱스명
+            vector_field: 벡터 필드명
+            query_vector: 원본 쿼리 벡터
+            
+        Returns:
+            List: 전송할 쿼리 벡터
+        """
+        element_type, similarity = self._get_vector_mapping(index_name, vector_field)
+        if element_type != "byte":
+            if similarity == "dot_product":
+                # dot_product는 단위 벡터를 요구 (문서 벡터는 색인 시 정규화, 질문 벡터는 여기서 1회 정규화)
+                from app.utils.vec_ops import l2_normalize
+                return l2_normalize(query_vector).tolist()
+            return query_vector
+        
+        if self._quantizer is not None:
+            return self._quantizer.quantize(query_vector).tolist()
+        
+        # numpy는 byte 인덱스 사용 시에만 필요
+        from app.utils.vec_ops import quantize_int8
+        return quantize_int8(query_vector).tolist()
+    
+    def _search_hits(
+        self,
+        index_name: str,
+        search_body: Dict[str, Any],
+        size: int
     ) -> List[Dict[str, Any]]:
-        """키워드 검색 구현"""
+        """
+        검색 요청 실행 후 hits 반환 (벡터 필드는 _source에서 제외, 응답은 hits만 필터링)
+        
+        Args:
+            index_name: 인덱스명
+            search_body: 검색 본문
+            size: 반환할 결과 수
+            
+        Returns:
+            List[Dict]: 검색 결과 hits
+        """
+        response = self._request(
+            self.conn.search,
+            index=index_name,
+            body=search_body,
+            size=size,
+            source_excludes=self.source_excludes,
+            source_includes=self.source_includes,
+            filter_path=SEARCH_FILTER_PATH,
+            track_total_hits=False,  # 전체 hit 수는 사용하지 않으므로 정확한 집계 생략
+            request_cache=self.request_cache
+        )
+        # filter_path 적용 시 결과가 없으면 hits 키 자체가 생략됨
+        return response.get("hits", {}).get("hits", [])
+    
+    def _filters_match_anything(self, index_name: str, filters: List[Dict[str, Any]]) -> bool:
+        """
+        필터에 해당하는 문서가 하나라도 있는지 확인 (terminate_after=1 count, 문서가 있는 경우만 TTL 캐시)
+        
+        Args:
+            index_name: 인덱스명
+            filters: 적용할 필터들 (should 결합)
+            
+        Returns:
+            bool: 문서 존재 여부 (확인 실패 시 True)
+        """
+        key = (index_name, repr(filters))
+        if key in self._filter_match_cache:
+            return True
+        
         try:
-            search_body = {
-                "query": {
-                    "multi_match": {
-                        "query": query,
-                        "fields": text_fields,
-                        "type": "best_fields",
-                        "operator": "or"
+            response = self._request(
+                self.conn.count,
+                index=index_name,
+                query={
+                    "bool": {
+                        "should": filters,
+                        "minimum_should_match": 1
                     }
+                },
+                terminate_after=1
+            )
+            matched = response["count"] > 0
+        except Exception as e:
+            # 사전 확인 실패는 본 검색에 맡김
+            logger.warning(f"필터 사전 확인 실패: {e}")
+            return True
+        
+        if matched:
+            self._filter_match_cache.set(key, True)
+        else:
+            logger.info(f"필터에 해당하는 문서 없음: {index_name}")
+        return matched
+    
+    def invalidate_cache(self, index_name: Optional[str] = None) -> int:
+        """
+        필터 사전 확인 캐시 무효화 (인덱스 갱신 시 호출)
+        
+        Args:
+            index_name: 무효화할 인덱스명 (None이면 전체)
+            
+        Returns:
+            int: 제거된 항목 수
+        """
+        if index_name is None:
+            removed = len(self._filter_match_cache)
+            self._filter_match_cache.clear()
+        else:
+            removed = self._filter_match_cache.pop_where(lambda key: key[0] == index_name)
+        
+        logger.info(f"필터 사전 확인 캐시 무효화: index={index_name or '전체'}, {removed}개 제거")
+        return removed
+    
+    def build_keyword_body(
+        self,
+        query: str,
+        text_fields: List[str],
+        filters: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """
+        키워드 검색 본문 구성 (실행하지 않음, msearch 배치에도 사용)
+        
+        Args:
+            query: 검색 쿼리
+            text_fields: 검색 대상 텍스트 필드들
+            filters: 적용할 필터들
+            
+        Returns:
+            Dict: 검색 본문
+        """
+        search_body = {
+            "query": {
+                "multi_match": {
+                    "query": query,
+                    "fields": text_fields,
+                    "type": "best_fields",
+                    "operator": "or"
                 }
             }
-            
-            # 필터 적용
-            if filters:
-                search_body["query"] = {
-                    "bool": {
-                        "must": search_body["query"],
-                        "filter": {
-                            "bool": {
-                                "should": filters,
-                                "minimum_should_match": 1
-                            }
+        }
+        
+        # 필터 적용
+        if filters:
+            search_body["query"] = {
+                "bool": {
+                    "must": search_body["query"],
+                    "filter": {
+                        "bool": {
+                            "should": filters,
+                            "minimum_should_match": 1
                         }
                     }
                 }
+            }
+        
+        return search_body
+    
+    def build_vector_body(
+        self,
+        index_name: str,
+        query_vector: List[float],
+        vector_field: str,
+        top_k: int,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        num_candidates: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        벡터 검색 본문 구성 (실행하지 않음, msearch 배치에도 사용)
+        
+        Args:
+            index_name: 인덱스명 (벡터 타입 확인용)
+            query_vector: 쿼리 벡터
+            vector_field: 벡터 필드명
+            top_k: knn 결과 수
+            filters: 적용할 필터들
+            num_candidates: ANN 탐색 후보 수 (None이면 자동)
             
-            response = self.conn.search(
-                index=index_name, 
-                body=search_body, 
-                size=top_k
-            )
+        Returns:
+            Dict: 검색 본문
+        """
+        search_body = {
+            "knn": {
+                "field": vector_field,
+                "query_vector": self._prepare_query_vector(index_name, vector_field, query_vector),
+                "k": top_k,
+                "num_candidates": resolve_num_candidates(top_k, num_candidates)
+            }
+        }
+        
+        # 필터 적용
+        if filters:
+            search_body["knn"]["filter"] = {
+                "bool": {
+                    "should": filters,
+                    "minimum_should_match": 1
+                }
+            }
+        
+        return search_body
+    
+    def msearch_batch(
+        self,
+        index_name: str,
+        bodies: List[Dict[str, Any]],
+        size: int,
+        chunk_size: int = 64
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        여러 검색 본문을 msearch로 묶어 실행 (평가 등 대량 질의용, chunk_size개씩 한 번의 왕복)
+        
+        Args:
+            index_name: 인덱스명
+            bodies: 검색 본문 목록 (build_*_body 결과)
+            size: 본문별 반환할 결과 수
+            chunk_size: 요청당 최대 본문 수
             
-            hits = response["hits"]["hits"]
+        Returns:
+            List[List[Dict]]: 본문 순서대로의 hits 목록 (실패한 본문은 빈 리스트)
+        """
+        results: List[List[Dict[str, Any]]] = []
+        header = {"index": index_name, "request_cache": self.request_cache}
+        
+        for start in range(0, len(bodies), chunk_size):
+            chunk = bodies[start:start + chunk_size]
+            searches = []
+            for body in chunk:
+                searches.append(header)
+                searches.append({
+                    **body,
+                    "size": size,
+                    "track_total_hits": False,
+                    "_source": self.source_filter
+                })
+            
+            try:
+                response = self._request(self.conn.msearch, searches=searches)
+                sub_responses = response.get("responses", [])
+            except Exception as e:
+                logger.error(f"msearch 배치 실패 ({start}~{start + len(chunk) - 1}): {e}")
+                sub_responses = []
+            
+            failed = 0
+            for i in range(len(chunk)):
+                sub_response = sub_responses[i] if i < len(sub_responses) else {"error": True}
+                if "error" in sub_response:
+                    failed += 1
+                    results.append([])
+                else:
+                    results.append(sub_response.get("hits", {}).get("hits", []))
+            
+            if failed:
+                logger.warning(f"msearch 배치 중 {failed}개 검색 실패")
+        
+        logger.debug(f"msearch 배치 완료: {len(bodies)}개 검색")
+        return results
+    
+    def keyword_search(
+        self,
+        index_name: str,
+        query: str,
+        text_fields: List[str],
+        top_k: int,
+        filters: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """키워드 검색 구현"""
+        if filters and not self._filters_match_anything(index_name, filters):
+            return []
+        
+        try:
+            search_body = self.build_keyword_body(query, text_fields, filters)
+            
+            hits = self._search_hits(index_name, search_body, top_k)
             logger.debug(f"키워드 검색 완료: {len(hits)}개 결과")
             return hits
             
@@ -102,35 +654,16 @@ class ElasticSearcher(BaseSearcher):
         query_vector: List[float],
         vector_field: str,
         top_k: int,
-        filters: Optional[List[Dict[str, Any]]] = None
+        filters: Optional[List[Dict[str, Any]]] = None,
+        num_candidates: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """벡터 검색 구현"""
         try:
-            search_body = {
-                "knn": {
-                    "field": vector_field,
-                    "query_vector": query_vector,
-                    "k": top_k,
-                    "num_candidates": 100
-                }
-            }
-            
-            # 필터 적용
-            if filters:
-                search_body["knn"]["filter"] = {
-                    "bool": {
-                        "should": filters,
-                        "minimum_should_match": 1
-                    }
-                }
-            
-            response = self.conn.search(
-                index=index_name,
-                body=search_body,
-                size=top_k
+            search_body = self.build_vector_body(
+                index_name, query_vector, vector_field, top_k, filters, num_candidates
             )
             
-            hits = response["hits"]["hits"]
+            hits = self._search_hits(index_name, search_body, top_k)
             logger.debug(f"벡터 검색 완료: {len(hits)}개 결과")
             return hits
             
@@ -151,6 +684,9 @@ class ElasticSearcher(BaseSearcher):
         filters: Optional[List[Dict[str, Any]]] = None
     ) -> List[Dict[str, Any]]:
         """하이브리드 검색 구현"""
+        if filters and not self._filters_match_anything(index_name, filters):
+            return []
+        
         try:
             # 기본 파라미터 설정
             params = fusion_params or {}
@@ -167,6 +703,12 @@ class ElasticSearcher(BaseSearcher):
                 top_k, params, filters
             )
 
+            elif fusion_method == "native_rrf":
+                return self._native_rrf_hybrid_search(
+                    index_name, query, query_vector, text_fields, vector_field,
+                    top_k, params, filters
+                )
+
             else:
                 raise ValueError(f"Hybrid Search에서 지원하지 않는 fusion 방식: {fusion_method}")
 
@@ -174,6 +716,45 @@ class ElasticSearcher(BaseSearcher):
             logger.error(f"하이브리도 검색 실패 ({fusion_method}): {e}")
             raise
     
+    def hybrid_search_batch(
+        self,
+        index_name: str,
+        queries: List[str],
+        query_vectors: List[List[float]],
+        text_fields: List[str],
+        vector_field: str,
+        top_k: int,
+        fusion_method: str = "convex",
+        fusion_params: Optional[Dict[str, Any]] = None,
+        filters_list: Optional[List[Optional[List[Dict[str, Any]]]]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """단일 요청 융합 방식(convex/native_rrf)은 msearch로 묶어 실행, 클라이언트 RRF는 질의별 실행"""
+        builders = {
+            "convex": self._build_convex_body,
+            "native_rrf": self._build_native_rrf_body,
+        }
+        build_body = builders.get(fusion_method)
+        if build_body is None:
+            return super().hybrid_search_batch(
+                index_name, queries, query_vectors, text_fields, vector_field,
+                top_k, fusion_method, fusion_params, filters_list
+            )
+        
+        params = fusion_params or {}
+        filters_list = filters_list or [None] * len(queries)
+        bodies = [
+            build_body(index_name, query, query_vector, text_fields, vector_field, top_k, params, filters)
+            for query, query_vector, filters in zip(queries, query_vectors, filters_list)
+        ]
+        results = self.msearch_batch(index_name, bodies, top_k)
+        
+        if fusion_method == "native_rrf":
+            rrf_k = params.get("rrf_k", 60)
+            for hits in results:
+                self._normalize_rrf_scores(hits, rrf_k)
+        
+        return results
+    
     def _convex_hybrid_search(
         self,
         index_name: str,
@@ -185,16 +766,43 @@ class ElasticSearcher(BaseSearcher):
         params: Dict[str, Any],
         filters: Optional[List[Dict[str, Any]]] = None
     ) -> List[Dict[str, Any]]:
-        """convex combination 방식으로 scoring 결합"""
+        """convex combination 방식으로 scoring 결합 (Painless 스크립트 없이 knn/query boost 합산)"""
+        search_body = self._build_convex_body(
+            index_name, query, query_vector, text_fields, vector_field, top_k, params, filters
+        )
+        hits = self._search_hits(index_name, search_body, top_k)
+        logger.debug(f"Convex 하이브리드 검색 완료: {len(hits)}개 결과")
+        return hits
+    
+    def _build_convex_body(
+        self,
+        index_name: str,
+        query: str,
+        query_vector: List[float],
+        text_fields: List[str],
+        vector_field: str,
+        top_k: int,
+        params: Dict[str, Any],
+        filters: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """convex 하이브리드 검색 본문 구성"""
         vector_weight = params.get("vector_weight", 0.3)
         text_weight = params.get("text_weight", 0.7)
         
+        knn_k = resolve_knn_window(top_k, params.get("rrf_window_size"))
+        
+        # ES는 knn 점수와 query 점수를 각각의 boost를 곱해 합산 (최종 점수 = 벡터 항 + 텍스트 항)
+        # - 벡터 항: cosine knn 점수 (1 + cos) / 2 에 boost 2 * vector_weight → vector_weight * (1 + cos)
+        #   knn 상위 k개 후보에만 부여되며, 그 밖의 텍스트 매칭 문서는 벡터 항이 0
+        # - 텍스트 항: text_weight * BM25
+        # 기존 Painless 방식(가중치 없는 knn 점수 + BM25 + vector_weight * (1 + cos) + text_weight 상수)과 점수 분포가 다름
         search_body = {
             "knn": {
                 "field": vector_field,
-                "query_vector": query_vector,
-                "k": 100,
-                "num_candidates": 100
+                "query_vector": self._prepare_query_vector(index_name, vector_field, query_vector),
+                "k": knn_k,
+                "num_candidates": resolve_num_candidates(knn_k, params.get("num_candidates")),
+                "boost": vector_weight * 2
             },
             "query": {
                 "bool": {
@@ -204,25 +812,8 @@ class ElasticSearcher(BaseSearcher):
                                 "query": query,
                                 "fields": text_fields,
                                 "type": "best_fields",
-                                "operator": "or"
-                            }
-                        }
-                    ],
-                    "should": [
-                        {
-                            "script_score": {
-                                "query": {"match_all": {}},
-                                "script": {
-                                    "source": f"""
-                                    double vector_score = cosineSimilarity(params.query_vector, params.vector_field) + 1.0;
-                                    double text_score = _score;
-                                    return {vector_weight} * vector_score + {text_weight} * text_score;
-                                    """,
-                                    "params": {
-                                        "query_vector": query_vector,
-                                        "vector_field": vector_field
-                                    }
-                                }
+                                "operator": "or",
+                                "boost": text_weight
                             }
                         }
                     ]
@@ -241,15 +832,87 @@ class ElasticSearcher(BaseSearcher):
             search_body["knn"]["filter"] = filter_clause
             search_body["query"]["bool"]["filter"] = filter_clause
         
-        response = self.conn.search(
-            index=index_name,
-            body=search_body,
-            size=top_k
+        return search_body
+
+    def _native_rrf_hybrid_search(
+        self,
+        index_name: str,
+        query: str,
+        query_vector: List[float],
+        text_fields: List[str],
+        vector_field: str,
+        top_k: int,
+        params: Dict[str, Any],
+        filters: Optional[List[Dict[str, Any]]] = None
+    ) -> List[Dict[str, Any]]:
+        """ES 내장 RRF retriever 방식 하이브리드 검색 (단일 요청, ES 8.14 이상)"""
+        rrf_k = params.get("rrf_k", 60)
+        search_body = self._build_native_rrf_body(
+            index_name, query, query_vector, text_fields, vector_field, top_k, params, filters
         )
         
-        hits = response["hits"]["hits"]
-        logger.debug(f"Convex 하이브리드 검색 완료: {len(hits)}개 결과")
+        hits = self._search_hits(index_name, search_body, top_k)
+        self._normalize_rrf_scores(hits, rrf_k)
+        
+        logger.debug(f"Native RRF 하이브리드 검색 완료: {len(hits)}개 결과")
         return hits
+    
+    def _build_native_rrf_body(
+        self,
+        index_name: str,
+        query: str,
+        query_vector: List[float],
+        text_fields: List[str],
+        vector_field: str,
+        top_k: int,
+        params: Dict[str, Any],
+        filters: Optional[List[Dict[str, Any]]] = None
+    ) -> Dict[str, Any]:
+        """ES 내장 RRF retriever 검색 본문 구성"""
+        rrf_k = params.get("rrf_k", 60)
+        # 기본값은 클라이언트 RRF와 동일하게 top_k * 2 후보 융합
+        rank_window_size = resolve_knn_window(top_k, params.get("rrf_window_size"))
+        
+        text_query = {
+            "multi_match": {
+                "query": query,
+                "fields": text_fields,
+                "type": "best_fields",
+                "operator": "or"
+            }
+        }
+        knn_retriever = {
+            "field": vector_field,
+            "query_vector": self._prepare_query_vector(index_name, vector_field, query_vector),
+            "k": rank_window_size,
+            "num_candidates": resolve_num_candidates(rank_window_size, params.get("num_candidates"))
+        }
+        
+        # 필터 적용 (텍스트/벡터 retriever 양쪽에 모두 적용)
+        if filters:
+            filter_clause = {
+                "bool": {
+                    "should": filters,
+                    "minimum_should_match": 1
+                }
+            }
+            text_query = {"bool": {"must": text_query, "filter": filter_clause}}
+            knn_retriever["filter"] = filter_clause
+        
+        search_body = {
+            "retriever": {
+                "rrf": {
+                    "retrievers": [
+                        {"standard": {"query": text_query}},
+                        {"knn": knn_retriever}
+                    ],
+                    "rank_window_size": rank_window_size,
+                    "rank_constant": rrf_k
+                }
+            }
+        }
+        
+        return search_body
 
     def _rrf_hybrid_search(
         self,
@@ -280,7 +943,8 @@ class ElasticSearcher(BaseSearcher):
             query_vector=query_vector,
             vector_field=vector_field,
             top_k=top_k * 2,
-            filters=filters
+            filters=filters,
+            num_candidates=params.get("num_candidates")
         )
         
         # 3. RRF 점수 계산 및 융합
@@ -320,35 +984,44 @@ class ElasticSearcher(BaseSearcher):
         # 점수 기준 정렬 및 상위 결과 선택
         sorted_docs = sorted(doc_scores.items(), key=lambda x: x[1], reverse=True)
 
-        # 절대적 정규화 (이론적 최댓값)
-        theoretical_max = 2 / (rrf_k + 1)
-
-        # 결과 재구성 with 절대적 정규화된 점수
+        # 결과 재구성
         final_results = []
         for doc_id, original_score in sorted_docs:
             if doc_id in doc_map:
                 hit = doc_map[doc_id].copy()
-                
-                # 절대적 정규화 (최대 100%로 제한)
-                normalized_score = min(1, (original_score / theoretical_max))
-                hit["_score"] = round(normalized_score, 1)
+                hit["_score"] = original_score
                 final_results.append(hit)
+        
+        # 절대적 정규화된 점수
+        self._normalize_rrf_scores(final_results, rrf_k)
                     
         return final_results
 
+    @staticmethod
+    def _normalize_rrf_scores(hits: List[Dict], rrf_k: int) -> None:
+        """RRF 점수를 이론적 최댓값(두 검색 모두 1위) 기준으로 정규화 (제자리 수정)"""
+        theoretical_max = 2 / (rrf_k + 1)
+        
+        for hit in hits:
+            # 절대적 정규화 (최대 100%로 제한)
+            normalized_score = min(1, (hit["_score"] / theoretical_max))
+            hit["_score"] = round(normalized_score, 1)
+
     def expand_search_results(
         self,
         index_name: str,
         hits: List[Dict[str, Any]],
         tolerance: int
     ) -> List[Dict[str, Any]]:
-        """검색 결과를 페이지 단위로 확장"""
+        """검색 결과를 페이지 단위로 확장 (PDF별 조건을 should로 묶은 단일 검색, PDF가 많으면 msearch)"""
         expanded_hits = []
         seen_ids = {hit["_id"] for hit in hits}
         
         logger.debug(f"페이지 확장 시작: {len(hits)}개 원본, tolerance={tolerance}")
         
-        # 각 원본 hit별로 페이지 확장
+        # 원본 hit/페이지 순서대로 확장 대상 (pdf, 페이지) 구성 (겹치는 페이지 범위는 한 번만)
+        expand_targets: Dict[Tuple[str, str], None] = {}
+        pages_by_pdf: Dict[str, Dict[str, None]] = {}  # 삽입 순서를 유지하는 페이지 집합
         for hit in hits:
             src = hit.get("_source", {})
             gcs_pdf_path = src.get("gcs_pdf_path", "")
@@ -358,45 +1031,137 @@ class ElasticSearcher(BaseSearcher):
                 continue
             
             page_num = int(page_str)
+            pdf_pages = pages_by_pdf.setdefault(gcs_pdf_path, {})
             
-            # 페이지 범위 확장
-            for delta in range(-tolerance, tolerance + 1):
-                if delta == 0:
+            # 페이지 범위 확장 (음수 페이지 제외, 원본 페이지 제외)
+            for new_num in range(max(page_num - tolerance, 0), page_num + tolerance + 1):
+                if new_num == page_num:
                     continue
-                    
-                new_num = page_num + delta
-                if new_num < 0:
-                    continue
-                    
-                new_page = f"{new_num:05d}"
                 
-                # 확장된 페이지 검색
-                must_clauses = [
-                    {"term": {"gcs_pdf_path.keyword": gcs_pdf_path}},
-                    {"term": {"page_number.keyword": new_page}}
-                ]
-                
-                search_body = {
-                    "query": {
-                        "bool": {
-                            "must": must_clauses
-                        }
-                    }
+                new_page = format_page_number(new_num)
+                expand_targets[(gcs_pdf_path, new_page)] = None
+                pdf_pages[new_page] = None
+        
+        if not expand_targets:
+            return expanded_hits
+        
+        # PDF당 하나의 조건 (pdf 경로 term + 페이지 terms)
+        pdf_queries = [
+            {
+                "bool": {
+                    "filter": [
+                        {"term": {"gcs_pdf_path.keyword": gcs_pdf_path}},
+                        {"terms": {"page_number.keyword": list(pages)}}
+                    ]
                 }
-                
-                try:
-                    response = self.conn.search(index=index_name, body=search_body)
-                    for new_hit in response.get("hits", {}).get("hits", []):
-                        nid = new_hit.get("_id")
-                        if nid and nid not in seen_ids:
-                            new_hit["_score"] = -1  # 확장된 결과 표시
-                            expanded_hits.append(new_hit)
-                            seen_ids.add(nid)
-                            
-                except Exception as e:
-                    # 개별 페이지 확장 실패는 DEBUG 레벨로 (너무 상세함)
-                    logger.debug(f"페이지 확장 중 오류 (페이지 {new_page}): {e}")
-                    continue
+            }
+            for gcs_pdf_path, pages in pages_by_pdf.items()
+        ]
+        
+        if len(pdf_queries) <= self.expand_max_should_clauses:
+            hits_by_page = self._fetch_expand_hits(index_name, pdf_queries, len(expand_targets))
+        else:
+            hits_by_page = self._msearch_expand_hits(index_name, pages_by_pdf, pdf_queries)
+        if hits_by_page is None:
+            return expanded_hits
+        
+        # 원본 hit/페이지 순서대로 병합
+        for target in expand_targets:
+            for new_hit in hits_by_page.get(target, []):
+                nid = new_hit.get("_id")
+                if nid and nid not in seen_ids:
+                    new_hit["_score"] = -1  # 확장된 결과 표시
+                    expanded_hits.append(new_hit)
+                    seen_ids.add(nid)
         
         logger.debug(f"페이지 확장 완료: +{len(expanded_hits)}개 추가")
-        return expanded_hits
\ No newline at end of file
+        return expanded_hits
+
+    def _fetch_expand_hits(
+        self,
+        index_name: str,
+        pdf_queries: List[Dict[str, Any]],
+        num_pages: int
+    ) -> Optional[Dict[Tuple[str, str], List[Dict[str, Any]]]]:
+        """
+        PDF별 조건을 should로 묶은 단일 검색으로 확장 페이지 조회
+        
+        Args:
+            index_name: 인덱스명
+            pdf_queries: PDF별 (경로, 페이지) 조건
+            num_pages: 확장 대상 (pdf, 페이지) 수
+            
+        Returns:
+            Dict: (pdf 경로, 페이지) → hits (실패 시 None)
+        """
+        search_body = {
+            "query": {
+                "bool": {
+                    "filter": {"bool": {"should": pdf_queries, "minimum_should_match": 1}}
+                }
+            }
+        }
+        try:
+            # 기존 페이지별 쿼리의 기본 size(10)와 동일한 상한
+            hits = self._search_hits(index_name, search_body, num_pages * 10)
+        except Exception as e:
+            logger.warning(f"페이지 확장 검색 실패: {e}")
+            return None
+        
+        # 응답 _source의 (pdf, 페이지)로 분류
+        hits_by_page: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for new_hit in hits:
+            src = new_hit.get("_source", {})
+            key = (src.get("gcs_pdf_path", ""), src.get("page_number", ""))
+            hits_by_page.setdefault(key, []).append(new_hit)
+        return hits_by_page
+    
+    def _msearch_expand_hits(
+        self,
+        index_name: str,
+        pages_by_pdf: Dict[str, Dict[str, None]],
+        pdf_queries: List[Dict[str, Any]]
+    ) -> Optional[Dict[Tuple[str, str], List[Dict[str, Any]]]]:
+        """
+        PDF별 조건을 msearch로 전송하여 확장 페이지 조회 (PDF 수가 많아 단일 쿼리가 커질 때)
+        
+        Args:
+            index_name: 인덱스명
+            pages_by_pdf: PDF 경로 → 확장 페이지 집합
+            pdf_queries: PDF별 (경로, 페이지) 조건 (pages_by_pdf 순서)
+            
+        Returns:
+            Dict: (pdf 경로, 페이지) → hits (실패 시 None)
+        """
+        searches = []
+        for pages, query in zip(pages_by_pdf.values(), pdf_queries):
+            searches.append({"index": index_name, "request_cache": self.request_cache})
+            searches.append({
+                "query": query,
+                "size": len(pages) * 10,  # 기존 페이지별 쿼리의 기본 size(10)와 동일한 상한
+                "track_total_hits": False,
+                "_source": self.source_filter
+            })
+        
+        try:
+            response = self._request(self.conn.msearch, searches=searches)
+        except Exception as e:
+            logger.warning(f"페이지 확장 msearch 실패: {e}")
+            return None
+        
+        # (pdf, 페이지)별로 응답 hit 분류
+        hits_by_page: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        failed_pdfs = []
+        for gcs_pdf_path, sub_response in zip(pages_by_pdf, response.get("responses", [])):
+            if "error" in sub_response:
+                failed_pdfs.append(gcs_pdf_path)
+                continue
+            
+            for new_hit in sub_response.get("hits", {}).get("hits", []):
+                page = new_hit.get("_source", {}).get("page_number", "")
+                hits_by_page.setdefault((gcs_pdf_path, page), []).append(new_hit)
+        
+        if failed_pdfs:
+            # 개별 페이지 확장 실패는 DEBUG 레벨로 (너무 상세함)
+            logger.debug(f"페이지 확장 중 오류: {len(failed_pdfs)}개 PDF 쿼리 실패 ({failed_pdfs})")
+        return hits_by_page
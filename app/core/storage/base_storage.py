@@ -4,12 +4,18 @@
 
 from abc import ABC, abstractmethod
 from typing import BinaryIO, Optional
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 
 class BaseStorage(ABC):
     """스토리지 시스템의 추상 인터페이스"""
     
+    # 최초 사용 시 연결 확인 완료 여부
+    _verified: bool = False
+    
     @abstractmethod
     def download_file(self, remote_path: str, local_path: str) -> bool:
         """
@@ -50,6 +56,24 @@ class BaseStorage(ABC):
         """
         pass
     
+    def _verify_connection(self) -> None:
+        """
+        스토리지 연결 확인 (구현체에서 재정의, 실패 시 예외 발생)
+        """
+        pass
+    
+    def _ensure_verified(self) -> None:
+        """최초 사용 시 한 번만 연결 확인 (생성자에서 네트워크 왕복 제거)"""
+        if self._verified:
+            return
+        
+        try:
+            self._verify_connection()
+            self._verified = True
+        except Exception as e:
+            # 실제 요청에서 오류가 드러나므로 로그만 남기고 다음 사용 시 재확인
+            logger.error(f"스토리지 연결 확인 실패: {e}")
+    
     def ensure_local_dir(self, local_path: str) -> None:
         """로컬 디렉토리가 존재하지 않으면 생성"""
         local_dir = os.path.dirname(local_path)
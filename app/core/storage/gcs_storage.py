@@ -3,6 +3,7 @@ Google Cloud Storage 구현 (추후 구현)
 """
 
 from typing import Optional
+from functools import lru_cache
 import logging
 from google.cloud import storage
 from google.cloud.exceptions import NotFound
@@ -13,6 +14,12 @@ from app.config.secrets_config import GoogleCloudSecrets
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def get_gcs_client(project_id: str) -> storage.Client:
+    """프로세스 공용 GCS 클라이언트 반환 (프로젝트별 하나의 인증 세션/커넥션 풀 공유)"""
+    return storage.Client(project=project_id)
+
+
 class GCSStorage(BaseStorage):
     """Google Cloud Storage 구현"""
     
@@ -25,19 +32,21 @@ class GCSStorage(BaseStorage):
             bucket_name: 버킷명
         """
         self.bucket_name = bucket_name
-        self.client = storage.Client(project=secrets.project_id)
+        self.client = get_gcs_client(secrets.project_id)
         self.bucket = self.client.bucket(bucket_name)
         
-        # 연결 테스트
-        try:
-            self.bucket.exists()
-            logger.info(f"GCS 연결 성공: {secrets.project_id}/{bucket_name}")
-        except Exception as e:
-            logger.error(f"GCS 연결 실패: {e}")
-            raise
+        # 연결 테스트는 최초 사용 시 수행 (_ensure_verified)
+        logger.info(f"GCS 클라이언트 초기화: {secrets.project_id}/{bucket_name}")
+    
+    def _verify_connection(self) -> None:
+        """GCS 버킷 접근 확인"""
+        if not self.bucket.exists():
+            raise ConnectionError(f"GCS 버킷을 찾을 수 없음: {self.bucket_name}")
+        logger.info(f"GCS 연결 성공: {self.bucket_name}")
     
     def download_file(self, remote_path: str, local_path: str) -> bool:
         """GCS에서 파일 다운로드"""
+        self._ensure_verified()
         try:
             self.ensure_local_dir(local_path)
             blob = self.bucket.blob(remote_path)
@@ -54,6 +63,7 @@ class GCSStorage(BaseStorage):
     
     def file_exists(self, remote_path: str) -> bool:
         """GCS에서 파일 존재 여부 확인"""
+        self._ensure_verified()
         try:
             blob = self.bucket.blob(remote_path)
             return blob.exists()
@@ -62,6 +72,7 @@ class GCSStorage(BaseStorage):
     
     def get_file_bytes(self, remote_path: str) -> Optional[bytes]:
         """GCS에서 파일 내용을 바이트로 반환"""
+        self._ensure_verified()
         try:
             blob = self.bucket.blob(remote_path)
             return blob.download_as_bytes()
@@ -71,4 +82,4 @@ class GCSStorage(BaseStorage):
             return None
         except Exception as e:
             logger.error(f"파일 읽기 실패: {remote_path} - {e}")
-            return None
\ No newline at end of file
+            return None
@@ -3,6 +3,7 @@ MinIO 스토리지 구현
 """
 
 from typing import Optional
+from functools import lru_cache
 import logging
 from minio import Minio
 from minio.error import S3Error
@@ -13,6 +14,24 @@ from app.config.secrets_config import MinIOSecrets
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def get_minio_client(host: str, access_key: str, secret_key: str, secure: bool) -> Minio:
+    """
+    프로세스 공용 MinIO 클라이언트 반환 (동일 접속 정보는 하나의 커넥션 풀 공유)
+    
+    Args:
+        host: MinIO 호스트
+        access_key: 액세스 키
+        secret_key: 시크릿 키
+        secure: HTTPS 사용 여부
+        
+    Returns:
+        Minio: 공용 클라이언트
+    """
+    logger.info(f"MinIO 클라이언트 생성: {host}")
+    return Minio(host, access_key=access_key, secret_key=secret_key, secure=secure)
+
+
 class MinIOStorage(BaseStorage):
     """MinIO 스토리지 구현"""
     
@@ -25,23 +44,23 @@ class MinIOStorage(BaseStorage):
             bucket_name: 버킷명
         """
         self.bucket_name = bucket_name
-        self.client = Minio(
-            secrets.host,
-            access_key=secrets.access_key,
-            secret_key=secrets.secret_key,
-            secure=secrets.secure
+        # 스토리지 인스턴스마다 새 클라이언트를 만들지 않고 공용 커넥션 풀 재사용
+        self.client = get_minio_client(
+            secrets.host, secrets.access_key, secrets.secret_key, secrets.secure
         )
         
-        # 연결 테스트
-        try:
-            self.client.bucket_exists(bucket_name)
-            logger.info(f"MinIO 연결 성공: {secrets.host}/{bucket_name}")
-        except S3Error as e:
-            logger.error(f"MinIO 연결 실패: {e}")
-            raise
+        # 연결 테스트는 최초 사용 시 수행 (_ensure_verified)
+        logger.info(f"MinIO 클라이언트 초기화: {secrets.host}/{bucket_name}")
+    
+    def _verify_connection(self) -> None:
+        """MinIO 버킷 접근 확인"""
+        if not self.client.bucket_exists(self.bucket_name):
+            raise ConnectionError(f"MinIO 버킷을 찾을 수 없음: {self.bucket_name}")
+        logger.info(f"MinIO 연결 성공: {self.bucket_name}")
     
     def download_file(self, remote_path: str, local_path: str) -> bool:
         """MinIO에서 파일 다운로드"""
+        self._ensure_verified()
         try:
             self.ensure_local_dir(local_path)
             self.client.fget_object(
@@ -58,6 +77,7 @@ class MinIOStorage(BaseStorage):
     
     def file_exists(self, remote_path: str) -> bool:
         """MinIO에서 파일 존재 여부 확인"""
+        self._ensure_verified()
         try:
             self.client.stat_object(self.bucket_name, remote_path)
             return True
@@ -66,11 +86,15 @@ class MinIOStorage(BaseStorage):
     
     def get_file_bytes(self, remote_path: str) -> Optional[bytes]:
         """MinIO에서 파일 내용을 바이트로 반환"""
+        self._ensure_verified()
         try:
             response = self.client.get_object(self.bucket_name, remote_path)
-            data = response.read()
-            response.close()
-            return data
+            try:
+                return response.read()
+            finally:
+                # 커넥션을 풀에 반환하여 다음 요청에서 재사용
+                response.close()
+                response.release_conn()
             
         except S3Error as e:
             logger.error(f"파일 읽기 실패: {remote_path} - {e}")
@@ -2,6 +2,7 @@
 컴포넌트 생성을 위한 팩토리 클래스들
 """
 
+import os
 import logging
 from typing import Optional
 
@@ -12,7 +13,12 @@ from app.core.storage.gcs_storage import GCSStorage
 from app.core.search.base_searcher import BaseSearcher
 from app.core.search.elastic_searcher import ElasticSearcher
 from app.core.embedding.base_embedder import BaseEmbedder
-from app.core.embedding.google_embedder import GoogleEmbedder
+from app.core.embedding.google_embedder import get_google_embedder
+from app.core.embedding.cached_embedder import CachedEmbedder
+from app.core.cache.semantic_cache import SemanticCache
+from app.core.cache.answer_cache import AnswerCache
+from app.core.cache.embedding_store import EmbeddingStore
+from app.core.cache.ttl_cache import TTLCache
 from app.core.generation.base_generator import BaseGenerator
 from app.core.generation.gemini_generator import GeminiGenerator
 
@@ -83,7 +89,11 @@ class SearcherFactory:
             BaseSearcher: 검색기 인스턴스
         """
         if searcher_type.lower() == "elasticsearch":
-            return ElasticSearcher(secrets.elasticsearch, config.elasticsearch)
+            filter_match_cache = TTLCache(
+                maxsize=config.cache.filter_match_cache_size,
+                ttl=config.cache.filter_match_cache_ttl
+            )
+            return ElasticSearcher(secrets.elasticsearch, config.elasticsearch, filter_match_cache)
         else:
             raise ValueError(f"지원하지 않는 검색기 타입: {searcher_type}")
 
@@ -95,7 +105,9 @@ class EmbedderFactory:
     def create_embedder(
         model_name: str,
         secrets: Optional[SecretsConfig] = None,
-        provider: str = "google"
+        provider: str = "google",
+        cache_size: int = 0,
+        store_path: Optional[str] = None
     ) -> BaseEmbedder:
         """
         임베딩 모델 인스턴스 생성
@@ -104,15 +116,28 @@ class EmbedderFactory:
             model_name: 모델명
             secrets: 보안 설정 (Google Cloud 인증용)
             provider: 제공업체 ("google")
+            cache_size: 임베딩 캐시 크기 (0이면 캐시 미사용)
+            store_path: 디스크 임베딩 저장소 경로 (None이면 미사용, cache_size > 0일 때만 적용)
             
         Returns:
             BaseEmbedder: 임베딩 모델 인스턴스
         """
         if provider.lower() == "google":
+            # 파이프라인을 다시 만들어도 같은 모델은 기존 인스턴스(클라이언트) 재사용
             google_secrets = secrets.google_cloud if secrets else None
-            return GoogleEmbedder(model_name, google_secrets)
+            if google_secrets:
+                embedder = get_google_embedder(
+                    model_name, google_secrets.project_id, google_secrets.location
+                )
+            else:
+                embedder = get_google_embedder(model_name)
         else:
             raise ValueError(f"지원하지 않는 임베딩 제공업체: {provider}")
+        
+        if cache_size > 0:
+            store = EmbeddingStore(store_path) if store_path else None
+            return CachedEmbedder(embedder, maxsize=cache_size, store=store)
+        return embedder
 
 
 class GeneratorFactory:
@@ -172,10 +197,18 @@ class RAGPipelineFactory:
         searcher = SearcherFactory.create_searcher("elasticsearch", secrets, config)
         generator_base = GeneratorFactory.create_generator(secrets, config.generation.default_model)
         
-        # 2. 유틸리티 컴포넌트들 생성
-        input_processor = InputProcessor()
+        # 2. 유틸리티 컴포넌트들 생성 (번역/키워드/HyDE 결과 캐시 포함)
+        cache_config = config.cache
+        translation_cache = enhancer_cache = None
+        if cache_config.llm_cache_enabled:
+            translation_cache = TTLCache(maxsize=cache_config.llm_cache_size, ttl=cache_config.llm_cache_ttl)
+            enhancer_cache = TTLCache(maxsize=cache_config.llm_cache_size, ttl=cache_config.llm_cache_ttl)
+        
+        input_processor = InputProcessor(cache=translation_cache)
         # QueryEnhancer에 GenerationConfig 전달
-        query_enhancer = QueryEnhancer(generator_base, input_processor, config.generation)
+        query_enhancer = QueryEnhancer(
+            generator_base, input_processor, config.generation, cache=enhancer_cache
+        )
         
         # 3. 임베딩 모델 생성 (벡터 검색 필요시)
         embedder = None
@@ -184,7 +217,15 @@ class RAGPipelineFactory:
             embedding_model = get_embedding_model_for_index(search_config.index_name)
             
             if embedding_model:
-                embedder = EmbedderFactory.create_embedder(embedding_model, secrets)
+                cache_size = cache_config.embedding_cache_size if cache_config.embedding_cache_enabled else 0
+                store_path = None
+                if cache_config.embedding_store_enabled:
+                    store_path = cache_config.embedding_store_path or os.path.join(
+                        config.storage.local_temp_dir, "embedding_cache.sqlite3"
+                    )
+                embedder = EmbedderFactory.create_embedder(
+                    embedding_model, secrets, cache_size=cache_size, store_path=store_path
+                )
                 logger.info(f"임베딩 모델 설정: {embedding_model}")
             else:
                 raise ValueError(f"인덱스 {search_config.index_name}에 대한 임베딩 모델을 찾을 수 없습니다")
@@ -217,11 +258,30 @@ class RAGPipelineFactory:
             config=config.generation
         )
         
-        # 6. 최종 파이프라인 조립 (config 기반)
+        # 6. 답변 캐시 생성 (의미 캐시는 임베딩 모델이 있을 때만)
+        semantic_cache = None
+        if config.cache.semantic_cache_enabled and embedder is not None:
+            semantic_cache = SemanticCache(
+                threshold=config.cache.semantic_cache_threshold,
+                maxsize=config.cache.semantic_cache_size,
+                ttl=config.cache.semantic_cache_ttl
+            )
+        
+        answer_cache = None
+        if config.cache.answer_cache_enabled:
+            answer_cache = AnswerCache(
+                maxsize=config.cache.answer_cache_size,
+                ttl=config.cache.answer_cache_ttl,
+                min_overlap=config.cache.answer_cache_min_overlap
+            )
+        
+        # 7. 최종 파이프라인 조립 (config 기반)
         pipeline = RAGPipeline(
             retriever=retriever,
             context_builder=context_builder,
-            generator=generator
+            generator=generator,
+            semantic_cache=semantic_cache,
+            answer_cache=answer_cache
         )
         
         logger.info("RAG 파이프라인 생성 완료")
@@ -12,9 +12,12 @@ from dotenv import load_dotenv
 load_dotenv()
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from contextlib import asynccontextmanager
+import asyncio
 import logging
 
 from app.api.routes import chat
+from app.api.dependencies import get_chat_service
 from app.config.app_config import get_app_config, get_cors_config
 
 # 로깅 설정
@@ -28,8 +31,30 @@ logger = logging.getLogger(__name__)
 config = get_app_config()
 cors_config = get_cors_config(config)
 
+
+async def _warmup_chat_service():
+    """ChatService 생성 및 워밍업 (백그라운드 실행)"""
+    try:
+        chat_service = await asyncio.to_thread(get_chat_service)
+        await chat_service.warmup()
+    except Exception as e:
+        logger.warning(f"시작 워밍업 실패: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작 시 워밍업 예약 (완료를 기다리지 않음)"""
+    warmup_task = None
+    if config.startup_warmup:
+        warmup_task = asyncio.create_task(_warmup_chat_service())
+    yield
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+
+
 # FastAPI 앱 생성
 app = FastAPI(
+    lifespan=lifespan,
     title=config.api_title,
     version=config.api_version,
     description=config.api_description,
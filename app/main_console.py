@@ -80,7 +80,7 @@ def create_custom_config():
         tolerance=3,                                         # 페이지 확장 범위 (0이면 확장 안함)
         
         # 검색 상세 설정
-        vector_search_candidates=100,                        # 벡터 검색 후보 수
+        vector_search_candidates=None,                       # 벡터 검색 후보 수 (None이면 top_k 기반 자동)
         text_search_operator="or",                           # 텍스트 검색 연산자 [or|and]
         text_search_type="best_fields",                      # 텍스트 검색 타입
         vector_weight=0.4,                                   # 하이브리드 검색의 벡터 가중치
@@ -90,6 +90,7 @@ def create_custom_config():
     # ========== 생성 설정 ==========
     generation_config = GenerationConfig(
         default_model="gemini-2.0-flash-001",
+        prompt_cache_ttl=None,                 # 시스템 프롬프트 컨텍스트 캐시 (초, 예: 3600)
         
         # 키워드 생성 설정
         keyword_generation={
@@ -123,7 +124,9 @@ def create_custom_config():
     # ========== 컨텍스트 설정 ==========
     context_config = ContextConfig(
         context_type="text",                   # [text|image|both]
-        text_field="extracted_text"            # [content|extracted_text]
+        text_field="extracted_text",           # [content|extracted_text]
+        image_download_workers=8,              # 이미지 병렬 다운로드 수
+        max_context_chars=120_000              # 컨텍스트 최대 글자 수 (None이면 제한 없음)
     )
     
     # ========== Elasticsearch 설정 ==========
@@ -164,7 +167,7 @@ def main():
     logger.info("🔍 스트리밍 파이프라인 실행 중...")
     
     # 스트리밍 답변과 검색 결과를 함께 받기
-    answer_stream, total_hits, original_hits = pipeline.run_stream(user_query, user_filter)
+    answer_stream, total_hits, original_hits, _ = pipeline.run_stream(user_query, user_filter)
     
     # ========== 결과 출력 ==========
     print("\n" + "="*50 + " USER " + "="*50)
@@ -2,9 +2,10 @@
 컨텍스트 구성 파이프라인 모듈
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Iterable, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import logging
-import os
 from google.genai import types
 
 from app.core.storage.base_storage import BaseStorage
@@ -12,6 +13,12 @@ from app.config.pipeline_config import ContextConfig
 
 logger = logging.getLogger(__name__)
 
+# 컨텍스트 길이 제한 계산 시 이미지 파트 하나를 텍스트 글자 수로 환산한 값
+IMAGE_PART_CHAR_COST = 1024
+
+# 설정된 텍스트 필드가 비어 있을 때 시도할 필드들
+_FALLBACK_TEXT_FIELDS = ("content", "extracted_text", "text")
+
 
 class ContextBuilder:
     """검색 결과로부터 컨텍스트를 구성하는 클래스"""
@@ -32,17 +39,36 @@ class ContextBuilder:
         self.config = config or ContextConfig()
         
         # 이미지 컨텍스트 사용시 스토리지 필수
-        if self.config.context_type in ("image", "both") and not storage:
+        # hit마다 비교하지 않도록 컨텍스트 종류를 미리 계산
+        self._include_text = self.config.context_type in ("text", "both")
+        self._include_image = self.config.context_type in ("image", "both")
+        
+        if self._include_image and not storage:
             raise ValueError("이미지 컨텍스트를 사용하려면 storage가 필요합니다")
         
+        # 이미지 다운로드는 I/O 대기이므로 hit별로 병렬 실행
+        self._image_executor: Optional[ThreadPoolExecutor] = None
+        if self._include_image:
+            self._image_executor = ThreadPoolExecutor(
+                max_workers=self.config.image_download_workers,
+                thread_name_prefix="context-image"
+            )
+        
         logger.info(f"컨텍스트 빌더 초기화: {self.config.context_type} 타입")
     
-    def build_context(self, hits: List[Dict[str, Any]]) -> List[types.Part]:
+    def build_context(
+        self,
+        hits: List[Dict[str, Any]],
+        start_index: int = 0,
+        used_chars: int = 0
+    ) -> List[types.Part]:
         """
-        검색 결과로부터 컨텍스트 파트들을 생성
+        검색 결과로부터 컨텍스트 파트들을 생성 (max_context_chars 초과 시 이후 hit 생략)
         
         Args:
             hits: 검색 결과 리스트
+            start_index: 첫 hit의 문서 번호 (결과를 나눠서 구성할 때 사용)
+            used_chars: 앞서 구성한 컨텍스트가 이미 사용한 글자 수 (결과를 나눠서 구성할 때 사용)
             
         Returns:
             List[types.Part]: 컨텍스트 파트들
@@ -53,21 +79,42 @@ class ContextBuilder:
         
         try:
             parts = []
+            max_chars = self.config.max_context_chars
+            running = used_chars
             
-            for i, hit in enumerate(hits):
+            # 이미지 파트는 먼저 병렬로 생성한 뒤 원래 hit 순서대로 배치
+            image_parts = []
+            if self._include_image:
+                image_parts = list(self._image_executor.map(
+                    self._create_image_part,
+                    [hit.get("_source", {}) for hit in hits],
+                    range(start_index, start_index + len(hits))
+                ))
+            
+            for offset, hit in enumerate(hits):
+                i = start_index + offset
                 src = hit.get("_source", {})
                 
+                hit_parts = []
+                
                 # 텍스트 컨텍스트 추가
-                if self.config.context_type in ("text", "both"):
+                if self._include_text:
                     text_part = self._create_text_part(src, i)
                     if text_part:
-                        parts.append(text_part)
+                        hit_parts.append(text_part)
                 
                 # 이미지 컨텍스트 추가
-                if self.config.context_type in ("image", "both"):
-                    image_part = self._create_image_part(src, i)
-                    if image_part:
-                        parts.append(image_part)
+                if image_parts and image_parts[offset]:
+                    hit_parts.append(image_parts[offset])
+                
+                # 길이 제한 초과 시 이후 hit은 생략 (hits는 중요도 순이므로 앞쪽 우선, 첫 hit은 항상 포함)
+                cost = self.context_size(hit_parts)
+                if max_chars and running > 0 and running + cost > max_chars:
+                    logger.info(f"컨텍스트 길이 제한 도달 ({running}자): {len(hits) - offset}개 hit 생략")
+                    break
+                
+                running += cost
+                parts.extend(hit_parts)
             
             logger.info(f"컨텍스트 구성 완료: {len(parts)}개 파트")
             return parts
@@ -76,20 +123,74 @@ class ContextBuilder:
             logger.error(f"컨텍스트 구성 실패: {e}")
             return []
     
+    def drop_duplicate_hits(
+        self,
+        hits: List[Dict[str, Any]],
+        seen_hits: Iterable[Dict[str, Any]] = ()
+    ) -> List[Dict[str, Any]]:
+        """
+        컨텍스트 내용(텍스트, 이미지 경로)이 앞선 hit과 같은 hit 제거 (먼저 나온 hit 유지, 순서 보존)
+        
+        Args:
+            hits: 중복을 제거할 검색 결과
+            seen_hits: 이미 컨텍스트에 포함된 검색 결과
+            
+        Returns:
+            List[Dict]: 중복이 제거된 검색 결과
+        """
+        seen = {self._content_key(hit.get("_source", {})) for hit in seen_hits}
+        seen.discard(None)
+        
+        unique_hits = []
+        for hit in hits:
+            key = self._content_key(hit.get("_source", {}))
+            if key is not None:
+                if key in seen:
+                    continue
+                seen.add(key)
+            unique_hits.append(hit)
+        
+        if len(unique_hits) < len(hits):
+            logger.info(f"중복 컨텍스트 제거: {len(hits) - len(unique_hits)}개 hit")
+        return unique_hits
+    
+    def _content_key(self, source: Dict[str, Any]) -> Optional[Tuple[Optional[bytes], Optional[str]]]:
+        """컨텍스트로 들어갈 내용 기준 키 (텍스트 해시, 이미지 경로), 내용이 없으면 None"""
+        text_content = self._text_content(source) if self._include_text else ""
+        image_path = (source.get("minio_image_path") or source.get("image_path")) if self._include_image else None
+        if not (text_content or image_path):
+            return None
+        
+        digest = hashlib.blake2b(text_content.encode("utf-8"), digest_size=8).digest() if text_content else None
+        return (digest, image_path)
+    
+    @staticmethod
+    def context_size(parts: List[types.Part]) -> int:
+        """
+        컨텍스트 파트들의 길이 (글자 수, 이미지는 IMAGE_PART_CHAR_COST로 환산)
+        
+        Args:
+            parts: 컨텍스트 파트들
+            
+        Returns:
+            int: 환산 글자 수
+        """
+        return sum(len(part.text) if part.text else IMAGE_PART_CHAR_COST for part in parts)
+    
+    def _text_content(self, source: Dict[str, Any]) -> str:
+        """설정된 텍스트 필드(비어 있으면 fallback 필드)의 내용"""
+        text_content = source.get(self.config.text_field, "")
+        if not text_content:
+            for field in _FALLBACK_TEXT_FIELDS:
+                text_content = source.get(field, "")
+                if text_content:
+                    break
+        return text_content
+    
     def _create_text_part(self, source: Dict[str, Any], index: int) -> types.Part:
         """텍스트 파트 생성"""
         try:
-            # 설정된 텍스트 필드에서 내용 추출
-            text_content = source.get(self.config.text_field, "")
-            
-            if not text_content:
-                # fallback 필드들 시도
-                fallback_fields = ["content", "extracted_text", "text"]
-                for field in fallback_fields:
-                    text_content = source.get(field, "")
-                    if text_content:
-                        break
-            
+            text_content = self._text_content(source)
             if not text_content:
                 logger.warning(f"텍스트 내용을 찾을 수 없음 (index: {index})")
                 return None
@@ -122,34 +223,16 @@ class ContextBuilder:
                 logger.warning(f"이미지 경로를 찾을 수 없음 (index: {index})")
                 return None
             
-            # 로컬 임시 경로 생성
-            local_path = os.path.join(
-                self.config.context_type == "both" and "tmp" or "tmp",
-                f"context_image_{index}_{os.path.basename(image_path)}"
-            )
-            
-            # 이미지 다운로드
-            if not self.storage.download_file(image_path, local_path):
+            # 임시 파일 없이 메모리로 바로 읽기
+            image_bytes = self.storage.get_file_bytes(image_path)
+            if not image_bytes:
                 logger.error(f"이미지 다운로드 실패: {image_path}")
                 return None
             
-            # 이미지 바이트 읽기
-            try:
-                with open(local_path, "rb") as f:
-                    image_bytes = f.read()
-                
-                # 임시 파일 정리
-                self.storage.cleanup_local_file(local_path)
-                
-                return types.Part.from_bytes(
-                    data=image_bytes,
-                    mime_type="image/png"  # 기본적으로 PNG로 처리
-                )
-                
-            except Exception as e:
-                logger.error(f"이미지 파일 읽기 실패: {e}")
-                self.storage.cleanup_local_file(local_path)
-                return None
+            return types.Part.from_bytes(
+                data=image_bytes,
+                mime_type="image/png"  # 기본적으로 PNG로 처리
+            )
             
         except Exception as e:
             logger.error(f"이미지 파트 생성 실패 (index: {index}): {e}")
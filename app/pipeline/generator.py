@@ -2,8 +2,10 @@
 답변 생성 파이프라인 모듈
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, AsyncIterator
 import logging
+import threading
+import time
 from google.genai import types
 
 from app.core.generation.base_generator import BaseGenerator
@@ -12,6 +14,12 @@ from app.config.pipeline_config import GenerationConfig
 
 logger = logging.getLogger(__name__)
 
+# 답변 생성 실패 시 반환 메시지
+ANSWER_ERROR_MESSAGE = "죄송합니다. 답변 생성 중 오류가 발생했습니다."
+
+# 컨텍스트 캐시 만료 직전 요청이 실패하지 않도록 미리 갱신하는 여유 시간 (초)
+_PROMPT_CACHE_REFRESH_MARGIN = 60
+
 
 class Generator:
     """RAG 답변 생성을 담당하는 클래스"""
@@ -31,6 +39,16 @@ class Generator:
         self.generator = generator
         self.config = config or GenerationConfig()
         
+        # 질문과 무관한 고정 프롬프트 파트는 한 번만 생성하여 재사용
+        self._system_part = types.Part.from_text(text=self._get_system_prompt())
+        self._context_label_part = types.Part.from_text(text="\nContext:\n")
+        self._instruction_part = types.Part.from_text(text=self._get_answer_instruction())
+        
+        # 시스템 프롬프트 서버 측 컨텍스트 캐시 (prompt_cache_ttl 설정 시 최초 요청에서 생성)
+        self._prompt_cache_name: Optional[str] = None
+        self._prompt_cache_expires_at = 0.0
+        self._prompt_cache_lock = threading.Lock()
+        
         logger.info("답변 생성기 초기화 완료")
     
     def generate_answer(
@@ -51,11 +69,8 @@ class Generator:
             str: 생성된 답변
         """
         try:
-            # 프롬프트 구성
-            prompt_parts = self._build_rag_prompt(user_query, context_parts)
-            
-            # 생성 설정
-            gen_config = generation_config or self.config.answer_generation
+            # 프롬프트 및 생성 설정 구성
+            prompt_parts, gen_config = self._prepare_request(user_query, context_parts, generation_config)
             
             # 답변 생성
             answer = self.generator.generate_multimodal(
@@ -68,7 +83,39 @@ class Generator:
             
         except Exception as e:
             logger.error(f"답변 생성 실패: {e}")
-            return "죄송합니다. 답변 생성 중 오류가 발생했습니다."
+            return ANSWER_ERROR_MESSAGE
+    
+    async def agenerate_answer(
+        self,
+        user_query: str,
+        context_parts: List[types.Part],
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        컨텍스트를 바탕으로 비동기 답변 생성 (generate_answer의 비동기 버전)
+        
+        Args:
+            user_query: 사용자 질문
+            context_parts: 컨텍스트 파트들
+            generation_config: 생성 설정 (선택적)
+            
+        Returns:
+            str: 생성된 답변
+        """
+        try:
+            prompt_parts, gen_config = self._prepare_request(user_query, context_parts, generation_config)
+            
+            answer = await self.generator.agenerate_multimodal(
+                parts=prompt_parts,
+                generation_config=gen_config
+            )
+            
+            logger.info(f"답변 생성 완료 (길이: {len(answer)})")
+            return answer.strip()
+            
+        except Exception as e:
+            logger.error(f"답변 생성 실패: {e}")
+            return ANSWER_ERROR_MESSAGE
     
     def generate_answer_stream(
         self,
@@ -88,11 +135,8 @@ class Generator:
             str: 생성된 답변 청크
         """
         try:
-            # 프롬프트 구성
-            prompt_parts = self._build_rag_prompt(user_query, context_parts)
-            
-            # 생성 설정
-            gen_config = generation_config or self.config.answer_generation
+            # 프롬프트 및 생성 설정 구성
+            prompt_parts, gen_config = self._prepare_request(user_query, context_parts, generation_config)
             
             # 스트리밍 답변 생성
             for chunk in self.generator.generate_multimodal_stream(
@@ -105,31 +149,102 @@ class Generator:
             
         except Exception as e:
             logger.error(f"스트리밍 답변 생성 실패: {e}")
-            yield "죄송합니다. 답변 생성 중 오류가 발생했습니다."
+            yield ANSWER_ERROR_MESSAGE
+    
+    async def agenerate_answer_stream(
+        self,
+        user_query: str,
+        context_parts: List[types.Part],
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[str]:
+        """
+        컨텍스트를 바탕으로 비동기 스트리밍 답변 생성 (generate_answer_stream의 비동기 버전)
+        
+        Args:
+            user_query: 사용자 질문
+            context_parts: 컨텍스트 파트들
+            generation_config: 생성 설정 (선택적)
+            
+        Yields:
+            str: 생성된 답변 청크
+        """
+        try:
+            prompt_parts, gen_config = self._prepare_request(user_query, context_parts, generation_config)
+            
+            async for chunk in self.generator.agenerate_multimodal_stream(
+                parts=prompt_parts,
+                generation_config=gen_config
+            ):
+                yield chunk
+            
+            logger.info("스트리밍 답변 생성 완료")
+            
+        except Exception as e:
+            logger.error(f"스트리밍 답변 생성 실패: {e}")
+            yield ANSWER_ERROR_MESSAGE
+    
+    def _prepare_request(
+        self,
+        user_query: str,
+        context_parts: List[types.Part],
+        generation_config: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[types.Part], Dict[str, Any]]:
+        """프롬프트와 생성 설정 구성 (컨텍스트 캐시 사용 시 시스템 프롬프트는 캐시로 대체)"""
+        gen_config = generation_config or self.config.answer_generation
+        
+        cache_name = self._get_prompt_cache()
+        if cache_name:
+            gen_config = {**gen_config, "cached_content": cache_name}
+        
+        return self._build_rag_prompt(user_query, context_parts, include_system=not cache_name), gen_config
+    
+    def warmup(self) -> None:
+        """시스템 프롬프트 컨텍스트 캐시를 미리 생성 (설정된 경우, 첫 답변 요청의 캐시 생성 지연 제거)"""
+        self._get_prompt_cache()
+    
+    def _get_prompt_cache(self) -> Optional[str]:
+        """
+        유효한 시스템 프롬프트 컨텍스트 캐시 이름 반환 (만료 전 갱신, 생성 실패 시 TTL 동안 재시도하지 않음)
+        
+        Returns:
+            str: 캐시 이름 또는 None
+        """
+        ttl = self.config.prompt_cache_ttl
+        if not ttl:
+            return None
+        
+        if time.monotonic() < self._prompt_cache_expires_at:
+            return self._prompt_cache_name
+        
+        with self._prompt_cache_lock:
+            now = time.monotonic()
+            if now >= self._prompt_cache_expires_at:
+                self._prompt_cache_name = self.generator.create_prompt_cache(
+                    self._get_system_prompt(), ttl
+                )
+                self._prompt_cache_expires_at = now + max(ttl - _PROMPT_CACHE_REFRESH_MARGIN, ttl / 2)
+            return self._prompt_cache_name
     
     def _build_rag_prompt(
         self,
         user_query: str,
-        context_parts: List[types.Part]
+        context_parts: List[types.Part],
+        include_system: bool = True
     ) -> List[types.Part]:
         """RAG 프롬프트 구성"""
-        prompt_parts = []
-        
-        # 시스템 프롬프트
-        system_prompt = self._get_system_prompt()
-        prompt_parts.append(types.Part.from_text(text=system_prompt))
+        # 시스템 프롬프트 (컨텍스트 캐시 사용 시 생략)
+        prompt_parts = [self._system_part] if include_system else []
         
         # 컨텍스트 섹션
         if context_parts:
-            prompt_parts.append(types.Part.from_text(text="\nContext:\n"))
+            prompt_parts.append(self._context_label_part)
             prompt_parts.extend(context_parts)
         
         # 사용자 질문
         prompt_parts.append(types.Part.from_text(text=f"\nQuery:\n{user_query}"))
         
         # 답변 지시사항
-        instruction = self._get_answer_instruction()
-        prompt_parts.append(types.Part.from_text(text=instruction))
+        prompt_parts.append(self._instruction_part)
         
         return prompt_parts
     
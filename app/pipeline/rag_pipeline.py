@@ -2,16 +2,79 @@
 통합 RAG 파이프라인
 """
 
-from typing import List, Dict, Any, Tuple, Optional, Generator, Iterator
+from typing import List, Dict, Any, Tuple, Optional, Generator, Iterator, AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import logging
 
 from app.pipeline.retriever import Retriever
 from app.pipeline.context_builder import ContextBuilder
-from app.pipeline.generator import Generator
+from app.pipeline.generator import Generator, ANSWER_ERROR_MESSAGE
+from app.core.cache.semantic_cache import SemanticCache
+from app.core.cache.answer_cache import AnswerCache
 from app.utils.formatters import timed
 
 logger = logging.getLogger(__name__)
 
+# 답변 청크 선행 수신 큐의 스트림 종료 표시
+_STREAM_END = object()
+
+# 선행 수신 큐 최대 청크 수 (소비가 늦으면 수신을 멈춰 생성 결과를 무한정 쌓지 않음)
+_PREFETCH_QUEUE_SIZE = 64
+
+
+class _PrefetchedStream:
+    """
+    백그라운드 작업에서 답변 스트림을 미리 소비하여 제한된 크기의 큐에 적재하는 비동기 이터레이터
+    
+    생성 요청/청크 수신이 소비 속도(타이핑 효과 지연 등)와 무관하게 진행되며, 큐가 가득 차면
+    수신을 멈춘다. aclose() 호출 또는 참조 해제 시 수신 작업을 취소하여 원본 스트림도 닫는다.
+    """
+    
+    def __init__(self, stream: AsyncIterator[str], maxsize: int = _PREFETCH_QUEUE_SIZE):
+        """
+        Args:
+            stream: 답변 청크 스트림 (오류는 스트림 내부에서 처리됨)
+            maxsize: 큐 최대 청크 수
+        """
+        self._queue: "asyncio.Queue" = asyncio.Queue(maxsize=maxsize)
+        # 작업이 self를 참조하지 않아야 참조 해제 시 __del__에서 취소 가능
+        self._producer = asyncio.create_task(self._produce(stream, self._queue))
+    
+    @staticmethod
+    async def _produce(stream: AsyncIterator[str], chunk_queue: "asyncio.Queue"):
+        try:
+            async for chunk in stream:
+                await chunk_queue.put(chunk)
+        except Exception as e:
+            logger.error(f"답변 스트림 선행 수신 실패: {e}")
+            await chunk_queue.put(ANSWER_ERROR_MESSAGE)
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        await chunk_queue.put(_STREAM_END)
+    
+    def __aiter__(self) -> "_PrefetchedStream":
+        return self
+    
+    async def __anext__(self) -> str:
+        chunk = await self._queue.get()
+        if chunk is _STREAM_END:
+            raise StopAsyncIteration
+        return chunk
+    
+    async def aclose(self) -> None:
+        """수신 작업 취소"""
+        self._cancel()
+    
+    def _cancel(self) -> None:
+        if not self._producer.done():
+            self._producer.cancel()
+    
+    def __del__(self):
+        self._cancel()
+
 
 class RAGPipeline:
     """통합 RAG 파이프라인 클래스"""
@@ -20,7 +83,9 @@ class RAGPipeline:
         self,
         retriever: Retriever,
         context_builder: ContextBuilder,
-        generator: Generator
+        generator: Generator,
+        semantic_cache: Optional[SemanticCache] = None,
+        answer_cache: Optional[AnswerCache] = None
     ):
         """
         RAG 파이프라인 초기화
@@ -29,10 +94,17 @@ class RAGPipeline:
             retriever: 검색기 (config 포함)
             context_builder: 컨텍스트 빌더
             generator: 답변 생성기
+            semantic_cache: 유사 질문 답변 캐시 (None이면 미사용, 임베딩 모델 필요)
+            answer_cache: 동일 질문 답변 캐시 (None이면 미사용)
         """
         self.retriever = retriever
         self.context_builder = context_builder
         self.generator = generator
+        self.semantic_cache = semantic_cache if retriever.embedder is not None else None
+        self.answer_cache = answer_cache
+        
+        # 결과 확장(Elasticsearch 왕복)을 컨텍스트 구성과 겹쳐 실행하기 위한 스레드 풀
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="rag_pipeline")
         
         logger.info(f"RAG 파이프라인 초기화 완료: {retriever.config.search_method} 방식, {retriever.config.index_name} 인덱스")
     
@@ -54,33 +126,11 @@ class RAGPipeline:
         logger.info(f"RAG 파이프라인 시작: '{user_query[:50]}...'")
         
         try:
-            # 1. 검색 (config 기반)
-            hits = timed(
-                "검색",
-                self.retriever.search,
-                user_query=user_query,
-                user_filter=user_filter
-            )
-            
-            if not hits:
-                logger.warning("검색 결과가 없습니다")
-                return "검색 결과를 찾을 수 없습니다.", [], []
-            
-            # 2. 결과 확장 (config의 tolerance 설정에 따라)
-            total_hits = hits
-            if self.retriever.config.tolerance > 0:
-                expanded_hits, total_hits = timed(
-                    "결과 확장",
-                    self.retriever.expand_results,
-                    hits
-                )
-            
-            # 3. 컨텍스트 구성
-            context_parts = timed(
-                "컨텍스트 구성",
-                self.context_builder.build_context,
-                total_hits
-            )
+            # 1~3. 캐시 조회, 검색, 결과 확장 및 컨텍스트 구성
+            result, prepared = self._prepare_answer(user_query, user_filter)
+            if result is not None:
+                return result
+            hits, total_hits, context_parts, query_vector, answer_key, degraded = prepared
             
             # 4. 답변 생성
             answer = timed(
@@ -90,6 +140,10 @@ class RAGPipeline:
                 context_parts
             )
             
+            if not degraded:
+                self._store_semantic_cache(query_vector, user_query, user_filter, answer, total_hits, hits)
+                self._store_answer_cache(answer_key, answer, total_hits, hits)
+            
             logger.info("RAG 파이프라인 완료")
             return answer, total_hits, hits
             
@@ -97,6 +151,68 @@ class RAGPipeline:
             logger.error(f"RAG 파이프라인 실행 실패: {e}")
             return f"처리 중 오류가 발생했습니다: {str(e)}", [], []
     
+    async def arun(
+        self,
+        user_query: str,
+        user_filter: str = ""
+    ) -> Tuple[str, List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        전체 RAG 파이프라인 비동기 실행 (run과 동일한 결과)
+        
+        검색/컨텍스트 구성은 스레드에서 실행하고, 가장 오래 걸리는 답변 생성은
+        비동기 클라이언트로 대기하여 생성 중에는 스레드를 점유하지 않는다.
+        
+        Args:
+            user_query: 사용자 질문 (동적)
+            user_filter: 사용자 필터 (동적)
+            
+        Returns:
+            Tuple: (생성된 답변, 전체 컨텍스트 hits, 원본 검색 hits)
+        """
+        logger.info(f"비동기 RAG 파이프라인 시작: '{user_query[:50]}...'")
+        
+        try:
+            result, prepared = await asyncio.to_thread(self._prepare_answer, user_query, user_filter)
+            if result is not None:
+                return result
+            hits, total_hits, context_parts, query_vector, answer_key, degraded = prepared
+            
+            answer = await self.generator.agenerate_answer(user_query, context_parts)
+            
+            if not degraded:
+                self._store_semantic_cache(query_vector, user_query, user_filter, answer, total_hits, hits)
+                self._store_answer_cache(answer_key, answer, total_hits, hits)
+            
+            logger.info("비동기 RAG 파이프라인 완료")
+            return answer, total_hits, hits
+            
+        except Exception as e:
+            logger.error(f"비동기 RAG 파이프라인 실행 실패: {e}")
+            return f"처리 중 오류가 발생했습니다: {str(e)}", [], []
+    
+    def warmup(self, sample_query: str = "test query") -> None:
+        """
+        더미 질의로 지연 초기화 자원을 미리 준비 (ES 커넥션 풀, 번역/임베딩/생성 클라이언트, 프롬프트 캐시)
+        
+        첫 사용자 요청이 부담하던 연결 수립/캐시 생성 지연을 시작 시점으로 옮긴다.
+        실패해도 서비스에는 영향이 없으므로 로그만 남긴다.
+        
+        Args:
+            sample_query: 워밍업 질의
+        """
+        steps = (
+            ("검색", lambda: self.retriever.search(user_query=sample_query, user_filter="", top_k=1)),
+            ("언어 감지", lambda: self.retriever.input_processor.detect_language(sample_query)),
+            ("프롬프트 캐시", self.generator.warmup),
+        )
+        for label, step in steps:
+            try:
+                step()
+            except Exception as e:
+                logger.warning(f"파이프라인 워밍업 실패 ({label}): {e}")
+        
+        logger.info("파이프라인 워밍업 완료")
+    
     def search_only(
         self,
         user_query: str,
@@ -117,6 +233,26 @@ class RAGPipeline:
             user_filter=user_filter
         )
     
+    def search_only_with_status(
+        self,
+        user_query: str,
+        user_filter: str = ""
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        검색만 수행 (검색 품질 저하 여부 포함, 결과 캐시 저장 판단용)
+        
+        Args:
+            user_query: 사용자 질문
+            user_filter: 사용자 필터
+            
+        Returns:
+            Tuple: (검색 결과, 품질 저하 여부)
+        """
+        return self.retriever.search_with_status(
+            user_query=user_query,
+            user_filter=user_filter
+        )
+    
     def generate_only(
         self,
         user_query: str,
@@ -153,7 +289,7 @@ class RAGPipeline:
         self,
         user_query: str,
         user_filter: str = ""
-    ) -> Tuple[Iterator[str], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    ) -> Tuple[Iterator[str], List[Dict[str, Any]], List[Dict[str, Any]], bool]:
         """
         스트리밍 RAG 파이프라인 실행 (검색 결과도 함께 반환)
         
@@ -162,59 +298,132 @@ class RAGPipeline:
             user_filter: 사용자 필터 (동적)
             
         Returns:
-            Tuple: (답변 스트림 이터레이터, 전체 컨텍스트 hits, 원본 검색 hits)
+            Tuple: (답변 스트림 이터레이터, 전체 컨텍스트 hits, 원본 검색 hits,
+                    캐시 저장 가능 여부 - 검색 품질 저하/오류 시 False)
         """
         logger.info(f"스트리밍 RAG 파이프라인 시작: '{user_query[:50]}...'")
         
         try:
-            # 1. 검색 (config 기반)
-            hits = timed(
-                "검색",
-                self.retriever.search,
-                user_query=user_query,
-                user_filter=user_filter
-            )
-            
-            if not hits:
-                logger.warning("검색 결과가 없습니다")
-                def empty_generator():
-                    yield "검색 결과를 찾을 수 없습니다."
-                return empty_generator(), [], []
-            
-            # 2. 결과 확장 (config의 tolerance 설정에 따라)
-            total_hits = hits
-            if self.retriever.config.tolerance > 0:
-                expanded_hits, total_hits = timed(
-                    "결과 확장",
-                    self.retriever.expand_results,
-                    hits
-                )
-            
-            # 3. 컨텍스트 구성
-            context_parts = timed(
-                "컨텍스트 구성",
-                self.context_builder.build_context,
-                total_hits
-            )
+            # 1~3. 캐시 조회, 검색, 결과 확장 및 컨텍스트 구성 (캐시 히트/결과 없음이면 해당 답변 재생)
+            result, prepared = self._prepare_answer(user_query, user_filter)
+            if result is not None:
+                answer, result_total_hits, result_hits = result
+                def cached_generator():
+                    yield answer
+                return cached_generator(), result_total_hits, result_hits, True
+            hits, total_hits, context_parts, query_vector, answer_key, degraded = prepared
             
             # 4. 스트리밍 답변 생성
             logger.info("스트리밍 답변 생성 시작")
             
             def answer_generator():
+                chunks = []
+                failed = degraded
                 for chunk in self.generator.generate_answer_stream(
                     user_query,
                     context_parts
                 ):
+                    # 생성 실패 시 받은 청크 뒤에 오류 메시지 청크가 붙으므로 청크 단위로 확인
+                    failed = failed or chunk == ANSWER_ERROR_MESSAGE
+                    chunks.append(chunk)
                     yield chunk
-                logger.info("스트리밍 RAG 파이프라인 완료")
+                
+                # 스트림이 끝까지 소비된 경우에만 캐시 저장
+                self._store_stream_caches(
+                    query_vector, answer_key, user_query, user_filter, "".join(chunks), total_hits, hits, failed
+                )
             
-            return answer_generator(), total_hits, hits
+            return answer_generator(), total_hits, hits, not degraded
             
         except Exception as e:
             logger.error(f"스트리밍 RAG 파이프라인 실행 실패: {e}")
             def error_generator():
                 yield f"처리 중 오류가 발생했습니다: {str(e)}"
-            return error_generator(), [], []
+            return error_generator(), [], [], False
+    
+    async def arun_stream(
+        self,
+        user_query: str,
+        user_filter: str = ""
+    ) -> Tuple[AsyncIterator[str], List[Dict[str, Any]], List[Dict[str, Any]], bool]:
+        """
+        비동기 스트리밍 RAG 파이프라인 실행 (run_stream과 동일한 결과)
+        
+        검색/컨텍스트 구성은 스레드에서 실행하고, 답변 청크는 비동기 클라이언트로
+        받아 청크 대기 중에는 스레드를 점유하지 않는다.
+        
+        Args:
+            user_query: 사용자 질문 (동적)
+            user_filter: 사용자 필터 (동적)
+            
+        Returns:
+            Tuple: (비동기 답변 스트림, 전체 컨텍스트 hits, 원본 검색 hits,
+                    캐시 저장 가능 여부 - 검색 품질 저하/오류 시 False)
+        """
+        logger.info(f"비동기 스트리밍 RAG 파이프라인 시작: '{user_query[:50]}...'")
+        
+        try:
+            result, prepared = await asyncio.to_thread(self._prepare_answer, user_query, user_filter)
+            if result is not None:
+                answer, result_total_hits, result_hits = result
+                return self._single_chunk_stream(answer), result_total_hits, result_hits, True
+            hits, total_hits, context_parts, query_vector, answer_key, degraded = prepared
+            
+            logger.info("스트리밍 답변 생성 시작")
+            
+            # 소비자가 첫 청크를 요청하기 전에 생성 요청을 시작하고 청크를 미리 받아둠
+            answer_stream = _PrefetchedStream(
+                self.generator.agenerate_answer_stream(user_query, context_parts)
+            )
+            
+            async def answer_generator():
+                chunks = []
+                failed = degraded
+                try:
+                    async for chunk in answer_stream:
+                        # 생성 실패 시 받은 청크 뒤에 오류 메시지 청크가 붙으므로 청크 단위로 확인
+                        failed = failed or chunk == ANSWER_ERROR_MESSAGE
+                        chunks.append(chunk)
+                        yield chunk
+                finally:
+                    # 소비 중단(클라이언트 연결 종료 등) 시 선행 수신 작업도 중단
+                    await answer_stream.aclose()
+                
+                # 스트림이 끝까지 소비된 경우에만 캐시 저장
+                self._store_stream_caches(
+                    query_vector, answer_key, user_query, user_filter, "".join(chunks), total_hits, hits, failed
+                )
+            
+            return answer_generator(), total_hits, hits, not degraded
+            
+        except Exception as e:
+            logger.error(f"비동기 스트리밍 RAG 파이프라인 실행 실패: {e}")
+            return self._single_chunk_stream(f"처리 중 오류가 발생했습니다: {str(e)}"), [], [], False
+    
+    @staticmethod
+    async def _single_chunk_stream(text: str) -> AsyncIterator[str]:
+        """고정 텍스트 하나를 내보내는 비동기 스트림"""
+        yield text
+    
+    def _store_stream_caches(
+        self,
+        query_vector: Optional[List[float]],
+        answer_key: Optional[Tuple[str, str]],
+        user_query: str,
+        user_filter: str,
+        answer: str,
+        total_hits: List[Dict[str, Any]],
+        hits: List[Dict[str, Any]],
+        failed: bool = False
+    ):
+        """끝까지 소비된 스트리밍 답변을 의미/답변 캐시에 저장 (생성 실패 또는 품질 저하된 검색 기반 답변은 저장하지 않음)"""
+        if failed:
+            logger.warning("스트리밍 답변 생성 실패 또는 검색 품질 저하로 캐시 저장 생략")
+            return
+        
+        self._store_semantic_cache(query_vector, user_query, user_filter, answer, total_hits, hits)
+        self._store_answer_cache(answer_key, answer, total_hits, hits)
+        logger.info("스트리밍 RAG 파이프라인 완료")
     
     def generate_only_stream(
         self,
@@ -249,6 +458,182 @@ class RAGPipeline:
             logger.error(f"스트리밍 답변 생성 실패: {e}")
             yield f"답변 생성 중 오류가 발생했습니다: {str(e)}"
     
+    def _prepare_answer(
+        self,
+        user_query: str,
+        user_filter: str
+    ) -> Tuple[Optional[Tuple[str, List[Dict[str, Any]], List[Dict[str, Any]]]], Optional[Tuple]]:
+        """
+        답변 생성 직전까지의 단계 실행 (캐시 조회 → 검색 → 결과 확장 및 컨텍스트 구성)
+        
+        Args:
+            user_query: 사용자 질문
+            user_filter: 사용자 필터
+            
+        Returns:
+            Tuple: (캐시 히트/검색 결과 없음 시 최종 결과 또는 None,
+                    (원본 hits, 전체 hits, 컨텍스트 파트들, 질문 임베딩, 답변 캐시 키, 검색 품질 저하 여부) 또는 None)
+        """
+        # 0. 의미 캐시 조회 (유사 질문이면 검색/생성 생략)
+        cached, query_vector = self._lookup_semantic_cache(user_query, user_filter)
+        if cached is not None:
+            return (cached.answer, cached.total_hits, cached.hits), None
+        
+        # 1. 검색 (config 기반)
+        hits, degraded = timed(
+            "검색",
+            self.retriever.search_with_status,
+            user_query=user_query,
+            user_filter=user_filter
+        )
+        
+        if not hits:
+            logger.warning("검색 결과가 없습니다")
+            return ("검색 결과를 찾을 수 없습니다.", [], []), None
+        
+        # 동일 질문이고 검색 결과도 그대로면 이전 답변 재사용 (품질 저하된 검색 결과로는 조회/저장하지 않음)
+        answer_key, cached_answer = None, None
+        if not degraded:
+            answer_key, cached_answer = self._lookup_answer_cache(user_query, user_filter, hits)
+        if cached_answer is not None:
+            return cached_answer, None
+        
+        # 2~3. 결과 확장 + 컨텍스트 구성 (확장 검색 중 원본 컨텍스트를 미리 구성)
+        total_hits, context_parts = timed(
+            "결과 확장 및 컨텍스트 구성",
+            self._expand_and_build_context,
+            hits
+        )
+        
+        return None, (hits, total_hits, context_parts, query_vector, answer_key, degraded)
+    
+    def _expand_and_build_context(
+        self,
+        hits: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Any]]:
+        """
+        결과 확장과 컨텍스트 구성을 겹쳐서 실행
+        
+        전체 hits는 원본 hits 뒤에 확장 hits가 붙는 순서이므로, 확장 검색이
+        진행되는 동안 원본 hits의 컨텍스트(이미지 다운로드 포함)를 먼저 구성한다.
+        
+        Args:
+            hits: 원본 검색 결과
+            
+        Returns:
+            Tuple: (전체 컨텍스트 hits, 컨텍스트 파트들)
+        """
+        if self.retriever.config.tolerance <= 0:
+            return hits, self.context_builder.build_context(hits)
+        
+        expand_future = self._executor.submit(self.retriever.expand_results, hits)
+        context_parts = self.context_builder.build_context(hits)
+        
+        # 인접 페이지 확장 결과 중 이미 포함된 내용과 같은 hit은 제외 (프롬프트 길이 절감)
+        expanded_hits, _ = expand_future.result()
+        expanded_hits = self.context_builder.drop_duplicate_hits(expanded_hits, hits)
+        total_hits = hits + expanded_hits
+        if expanded_hits:
+            context_parts = context_parts + self.context_builder.build_context(
+                expanded_hits,
+                start_index=len(hits),
+                used_chars=self.context_builder.context_size(context_parts)
+            )
+        
+        return total_hits, context_parts
+    
+    def _cache_namespace(self, user_filter: str) -> str:
+        """답변 캐시 구분 키 (검색 설정과 필터가 같을 때만 재사용)"""
+        config = self.retriever.config
+        return f"{config.index_name}|{config.search_method}|{config.top_k}|{config.tolerance}|{user_filter}"
+    
+    def _lookup_semantic_cache(self, user_query: str, user_filter: str) -> Tuple[Optional[Any], Optional[List[float]]]:
+        """
+        의미 캐시 조회
+        
+        Args:
+            user_query: 사용자 질문
+            user_filter: 사용자 필터
+            
+        Returns:
+            Tuple: (캐시 항목 또는 None, 질문 임베딩 또는 None)
+        """
+        if self.semantic_cache is None:
+            return None, None
+        
+        try:
+            query_vector = self.retriever.embedder.embed_text(user_query, task="RETRIEVAL_QUERY")
+        except Exception as e:
+            logger.warning(f"의미 캐시용 임베딩 실패: {e}")
+            return None, None
+        
+        namespace = self._cache_namespace(user_filter)
+        return self.semantic_cache.lookup(query_vector, namespace), query_vector
+    
+    def _store_semantic_cache(
+        self,
+        query_vector: Optional[List[float]],
+        user_query: str,
+        user_filter: str,
+        answer: str,
+        total_hits: List[Dict[str, Any]],
+        hits: List[Dict[str, Any]]
+    ):
+        """정상 생성된 답변만 의미 캐시에 저장"""
+        if self.semantic_cache is None or query_vector is None:
+            return
+        if not answer or answer == ANSWER_ERROR_MESSAGE:
+            return
+        
+        self.semantic_cache.add(
+            query_vector,
+            self._cache_namespace(user_filter),
+            user_query,
+            answer,
+            total_hits,
+            hits
+        )
+    
+    def _lookup_answer_cache(
+        self,
+        user_query: str,
+        user_filter: str,
+        hits: List[Dict[str, Any]]
+    ) -> Tuple[Optional[Tuple[str, str]], Optional[Tuple[str, List[Dict[str, Any]], List[Dict[str, Any]]]]]:
+        """
+        동일 질문 답변 캐시 조회
+        
+        Args:
+            user_query: 사용자 질문
+            user_filter: 사용자 필터
+            hits: 이번 요청의 원본 검색 결과
+            
+        Returns:
+            Tuple: (캐시 키 또는 None, (답변, 전체 hits, 원본 hits) 또는 None)
+        """
+        if self.answer_cache is None:
+            return None, None
+        
+        key = self.answer_cache.make_key(
+            self.retriever.config.index_name, self._cache_namespace(user_filter), user_query
+        )
+        return key, self.answer_cache.get(key, hits)
+    
+    def _store_answer_cache(
+        self,
+        key: Optional[Tuple[str, str]],
+        answer: str,
+        total_hits: List[Dict[str, Any]],
+        hits: List[Dict[str, Any]]
+    ):
+        """정상 생성된 답변만 동일 질문 답변 캐시에 저장"""
+        if self.answer_cache is None or key is None:
+            return
+        if not answer or answer == ANSWER_ERROR_MESSAGE:
+            return
+        
+        self.answer_cache.set(key, answer, total_hits, hits)
+    
     # 설정 조회 메서드들 (디버깅용)
     def get_config(self) -> Dict[str, Any]:
         """현재 파이프라인 설정 반환"""
@@ -3,18 +3,23 @@
 """
 
 from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 import logging
+import re
 
 from app.core.search.base_searcher import BaseSearcher
 from app.core.embedding.base_embedder import BaseEmbedder
 from app.utils.input_processor import InputProcessor
 from app.utils.query_enhancer import QueryEnhancer
-from app.utils.filter_builder import FilterBuilder
+from app.utils.filter_builder import FilterBuilder, FOLDER_FIELD, LEGACY_FOLDER_FIELD
 from app.config.pipeline_config import SearchConfig
 from app.config.model_mappings import auto_configure_for_index
 
 logger = logging.getLogger(__name__)
 
+# 생성 키워드 구분자 (" OR " 주변 공백 변형 포함)
+_KEYWORD_SEPARATOR = re.compile(r"\s+OR\s+")
+
 
 class Retriever:
     """검색 기능을 담당하는 클래스"""
@@ -43,6 +48,18 @@ class Retriever:
         self.input_processor = input_processor or InputProcessor()
         self.config = config or SearchConfig()
         
+        # 검색 방법 → 구현 메서드 (호출마다 분기하지 않도록 한 번만 바인딩, (결과, 품질 저하 여부) 반환)
+        self._search_methods = {
+            "keyword": self._keyword_search,
+            "vector": self._vector_search,
+            "hybrid": self._hybrid_search,
+            "hyde": self._hyde_vector_search,
+            "hyde_hybrid": self._hyde_hybrid_search,
+        }
+        
+        # (인덱스, 검색 방법) → 자동 설정 (오버라이드 인자가 없을 때만 사용, 읽기 전용)
+        self._search_configs: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        
         logger.info("검색기 초기화 완료")
     
     def search(
@@ -62,46 +79,111 @@ class Retriever:
         Returns:
             List[Dict]: 검색 결과
         """
+        hits, _ = self.search_with_status(user_query, user_filter, **kwargs)
+        return hits
+    
+    def search_with_status(
+        self,
+        user_query: str,
+        user_filter: str = "",
+        **kwargs
+    ) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        통합 검색 메서드 (품질 저하 여부 포함)
+        
+        쿼리 준비 작업(번역/키워드/HyDE/임베딩)이 시간 초과/실패하여 대체값으로 검색한 경우
+        degraded=True를 반환하므로, 호출 측은 이 결과를 캐시에 저장하지 않아야 한다.
+        
+        Args:
+            user_query: 사용자 쿼리
+            user_filter: 사용자 필터
+            **kwargs: 설정 오버라이드 옵션
+            
+        Returns:
+            Tuple: (검색 결과, 품질 저하 여부)
+        """
         # config에서 설정 가져오기 (kwargs로 오버라이드 가능)
         index_name = kwargs.get("index_name", self.config.index_name)
         search_method = kwargs.get("search_method", self.config.search_method)
         top_k = kwargs.get("top_k", self.config.top_k)
         
         try:
+            search_fn = self._search_methods.get(search_method)
+            if search_fn is None:
+                raise ValueError(f"지원하지 않는 검색 방법: {search_method}")
+            
             # 인덱스 기반 자동 설정
-            search_config = auto_configure_for_index(index_name, search_method, **kwargs)
+            search_config = self._get_search_config(index_name, search_method, kwargs)
             
             # 필터 생성
-            filters = self._create_filters(user_filter)
+            filters = self._create_filters(user_filter, index_name)
             
-            # 검색 방법에 따른 분기
-            if search_method == "keyword":
-                return self._keyword_search(
-                    index_name, user_query, filters, top_k, search_config
-                )
-            elif search_method == "vector":
-                return self._vector_search(
-                    index_name, user_query, filters, top_k, search_config
-                )
-            elif search_method == "hybrid":
-                return self._hybrid_search(
-                    index_name, user_query, filters, top_k, search_config
-                )
-            elif search_method == "hyde":
-                return self._hyde_vector_search(
-                    index_name, user_query, filters, top_k, search_config
-                )
-            elif search_method == "hyde_hybrid":
-                return self._hyde_hybrid_search(
-                    index_name, user_query, filters, top_k, search_config
-                )
-            else:
-                raise ValueError(f"지원하지 않는 검색 방법: {search_method}")
+            return search_fn(index_name, user_query, filters, top_k, search_config)
                 
         except Exception as e:
             logger.error(f"검색 실패 ({search_method}): {e}")
             raise
     
+    def batch_hybrid_search(
+        self,
+        queries: List[Tuple[str, str]],
+        top_k: Optional[int] = None,
+        index_name: Optional[str] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        여러 질문을 한 번에 하이브리드 검색 (평가 등 대량 질의용)
+        
+        질문별 번역은 배치 전용 스레드 풀에서 병렬 실행(parallel_workers로 동시 실행 수 제한),
+        키워드 생성과 임베딩은 배치 호출, 검색은 msearch 일괄 요청으로 처리
+        
+        Args:
+            queries: (사용자 질문, 사용자 필터) 목록
+            top_k: 질문별 검색 결과 수 (None이면 config 사용)
+            index_name: 인덱스명 (None이면 config 사용)
+            
+        Returns:
+            List[List[Dict]]: 입력 순서대로의 검색 결과
+        """
+        if not self.embedder:
+            raise ValueError("하이브리드 검색을 위해서는 embedder가 필요합니다")
+        if not queries:
+            return []
+        
+        index_name = index_name or self.config.index_name
+        top_k = top_k or self.config.top_k
+        search_config = self._get_search_config(index_name, "hybrid", {})
+        
+        user_queries = [user_query for user_query, _ in queries]
+        with ThreadPoolExecutor(
+            max_workers=self.config.parallel_workers,
+            thread_name_prefix="retriever_batch"
+        ) as executor:
+            translated_queries = list(executor.map(self._translate_or_original, user_queries))
+        
+        # 키워드는 여러 질문을 묶어 한 번의 생성 요청으로 처리
+        if self.query_enhancer:
+            text_queries = [
+                self._keywords_to_text_query(keywords)
+                for keywords in self.query_enhancer.generate_keywords_batch(translated_queries, False)
+            ]
+        else:
+            text_queries = translated_queries
+        
+        embed_queries = translated_queries if self.embedder.need_translation else user_queries
+        query_vectors = self.embedder.embed_batch(embed_queries, task="RETRIEVAL_QUERY")
+        
+        return self.searcher.hybrid_search_batch(
+            index_name=index_name,
+            queries=text_queries,
+            query_vectors=query_vectors,
+            text_fields=search_config["text_fields"],
+            vector_field=search_config["vector_field"],
+            top_k=top_k,
+            fusion_method=self.config.fusion_method,
+            fusion_params=self._fusion_params(),
+            filters_list=[self._create_filters(user_filter, index_name) for _, user_filter in queries]
+        )
+    
     def expand_results(
         self,
         hits: List[Dict[str, Any]],
@@ -146,26 +228,26 @@ class Retriever:
         filters: List[Dict[str, Any]],
         top_k: int,
         config: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[List[Dict[str, Any]], bool]:
         """키워드 검색 구현"""
         # 쿼리 향상 (키워드 생성) - keyword_generation 설정 사용
         if self.query_enhancer:
             keywords = self.query_enhancer.generate_keywords(user_query)
             # OR로 분리된 키워드들을 공백으로 연결
-            keyword_list = [kw.strip() for kw in keywords.split(" OR ")]
-            query = " ".join(keyword_list)
-            logger.debug(f"생성된 키워드: {keyword_list}")
+            query = self._keywords_to_text_query(keywords)
+            logger.debug(f"생성된 키워드: {keywords}")
         else:
             # 번역만 수행
             query = self.input_processor.translate_text(user_query, 'en')
         
-        return self.searcher.keyword_search(
+        hits = self.searcher.keyword_search(
             index_name=index_name,
             query=query,
             text_fields=config["text_fields"],
             top_k=top_k,
             filters=filters
         )
+        return hits, False
     
     def _vector_search(
         self,
@@ -174,7 +256,7 @@ class Retriever:
         filters: List[Dict[str, Any]],
         top_k: int,
         config: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[List[Dict[str, Any]], bool]:
         """벡터 검색 구현"""
         if not self.embedder:
             raise ValueError("벡터 검색을 위해서는 embedder가 필요합니다")
@@ -188,13 +270,7 @@ class Retriever:
         query_vector = self.embedder.embed_text(query_text, task="RETRIEVAL_QUERY")
         logger.debug("쿼리 벡터 생성 완료")
         
-        return self.searcher.vector_search(
-            index_name=index_name,
-            query_vector=query_vector,
-            vector_field=config["vector_field"],
-            top_k=top_k,
-            filters=filters
-        )
+        return self._run_vector_search(index_name, query_vector, filters, top_k, config), False
     
     def _hybrid_search(
         self,
@@ -203,59 +279,64 @@ class Retriever:
         filters: List[Dict[str, Any]],
         top_k: int,
         config: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[List[Dict[str, Any]], bool]:
         """하이브리드 검색 구현"""
         if not self.embedder:
             raise ValueError("하이브리드 검색을 위해서는 embedder가 필요합니다")
         
-        # 쿼리 준비
-        translated_query = self.input_processor.translate_text(user_query, 'en')
-        
-        # 키워드 생성 - keyword_generation 설정 사용
-        if self.query_enhancer:
-            keywords = self.query_enhancer.generate_keywords(translated_query, False)
-            keyword_list = [kw.strip() for kw in keywords.split(" OR ")]
-            text_query = " ".join(keyword_list)
-        else:
+        executor = self._new_request_executor()
+        try:
+            # 번역이 필요 없는 임베딩 모델이면 원본 쿼리 임베딩을 번역/키워드 생성과 병렬 실행
+            vector_future = None
+            if not self.embedder.need_translation:
+                vector_future = executor.submit(
+                    self.embedder.embed_text, user_query, task="RETRIEVAL_QUERY"
+                )
+            
+            # 쿼리 준비
+            translated_query, degraded = self._wait(
+                executor.submit(self.input_processor.translate_text, user_query, 'en'),
+                "번역", fallback=user_query
+            )
+            
+            # 번역 쿼리 임베딩은 키워드 생성(LLM 호출)과 독립적이므로 병렬 실행
+            if vector_future is None:
+                vector_future = executor.submit(
+                    self.embedder.embed_text, translated_query, task="RETRIEVAL_QUERY"
+                )
+            
+            # 키워드 생성 - keyword_generation 설정 사용
             text_query = translated_query
+            if self.query_enhancer:
+                keywords, keywords_degraded = self._wait(
+                    executor.submit(self.query_enhancer.generate_keywords, translated_query, False),
+                    "키워드 생성", fallback=translated_query
+                )
+                degraded = degraded or keywords_degraded
+                text_query = self._keywords_to_text_query(keywords)
+            
+            # 벡터 생성 (실패 시 키워드 검색으로 대체)
+            query_vector, vector_degraded = self._wait(vector_future, "쿼리 임베딩")
+        finally:
+            # 시간 초과된 작업의 완료를 기다리지 않음
+            executor.shutdown(wait=False)
         
-        # 벡터 생성
-        if self.embedder.need_translation:
-            query_vector = self.embedder.embed_text(translated_query, task="RETRIEVAL_QUERY")
-        else:
-            query_vector = self.embedder.embed_text(user_query, task="RETRIEVAL_QUERY")
+        if vector_degraded or query_vector is None:
+            hits = self.searcher.keyword_search(
+                index_name=index_name,
+                query=text_query,
+                text_fields=config["text_fields"],
+                top_k=top_k,
+                filters=filters
+            )
+            return hits, True
         
         logger.debug("하이브리드 검색 준비 완료")
         
-        # return self.searcher.hybrid_search(
-        #     index_name=index_name,
-        #     query=text_query,
-        #     query_vector=query_vector,
-        #     text_fields=config["text_fields"],
-        #     vector_field=config["vector_field"],
-        #     top_k=top_k,
-        #     vector_weight=self.config.vector_weight,
-        #     text_weight=self.config.text_weight,
-        #     filters=filters
-        # )
-        # fusion_params 딕셔너리로 파라미터 전달
-        fusion_params = {
-            "vector_weight": self.config.vector_weight,
-            "text_weight": self.config.text_weight,
-            "rrf_k": self.config.rrf_k  # RRF 파라미터도 추가
-        }
-        
-        return self.searcher.hybrid_search(
-            index_name=index_name,
-            query=text_query,
-            query_vector=query_vector,
-            text_fields=config["text_fields"],
-            vector_field=config["vector_field"],
-            top_k=top_k,
-            fusion_method=self.config.fusion_method,  # convex 또는 rrf
-            fusion_params=fusion_params,  # 파라미터들을 딕셔너리로 전달
-            filters=filters
+        hits = self._run_hybrid_search(
+            index_name, text_query, query_vector, filters, top_k, config
         )
+        return hits, degraded
 
     
     def _hyde_vector_search(
@@ -265,7 +346,7 @@ class Retriever:
         filters: List[Dict[str, Any]],
         top_k: int,
         config: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[List[Dict[str, Any]], bool]:
         """HyDE 벡터 검색 구현"""
         if not self.embedder or not self.query_enhancer:
             raise ValueError("HyDE 검색을 위해서는 embedder와 query_enhancer가 필요합니다")
@@ -277,13 +358,7 @@ class Retriever:
         # HyDE 문서 임베딩
         query_vector = self.embedder.embed_text(hyde_doc, task="RETRIEVAL_QUERY")
         
-        return self.searcher.vector_search(
-            index_name=index_name,
-            query_vector=query_vector,
-            vector_field=config["vector_field"],
-            top_k=top_k,
-            filters=filters
-        )
+        return self._run_vector_search(index_name, query_vector, filters, top_k, config), False
     
     def _hyde_hybrid_search(
         self,
@@ -292,43 +367,85 @@ class Retriever:
         filters: List[Dict[str, Any]],
         top_k: int,
         config: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
+    ) -> Tuple[List[Dict[str, Any]], bool]:
         """HyDE 하이브리드 검색 구현"""
         if not self.embedder or not self.query_enhancer:
             raise ValueError("HyDE 하이브리드 검색을 위해서는 embedder와 query_enhancer가 필요합니다")
         
-        # 쿼리 준비
-        translated_query = self.input_processor.translate_text(user_query, 'en')
-        
-        # HyDE 문서 생성 및 임베딩 - hyde_generation 설정 사용
-        hyde_doc = self.query_enhancer.generate_hyde_document(translated_query, False)
-        query_vector = self.embedder.embed_text(hyde_doc, task="RETRIEVAL_QUERY")
-        
-        # 키워드 생성 - keyword_generation 설정 사용
-        keywords = self.query_enhancer.generate_keywords(translated_query, False)
-        keyword_list = [kw.strip() for kw in keywords.split(" OR ")]
-        text_query = " ".join(keyword_list)
+        executor = self._new_request_executor()
+        try:
+            # 쿼리 준비
+            translated_query, degraded = self._wait(
+                executor.submit(self.input_processor.translate_text, user_query, 'en'),
+                "번역", fallback=user_query
+            )
+            
+            # 키워드 생성은 HyDE 문서와 독립적이므로 병렬 실행 - keyword_generation 설정 사용
+            keywords_future = executor.submit(
+                self.query_enhancer.generate_keywords, translated_query, False
+            )
+            
+            # HyDE 문서 생성 및 임베딩 - hyde_generation 설정 사용 (지연/실패 시 번역 쿼리로 대체)
+            hyde_doc, hyde_degraded = self._wait(
+                executor.submit(self.query_enhancer.generate_hyde_document, translated_query, False),
+                "HyDE 문서 생성", fallback=translated_query
+            )
+            query_vector = self.embedder.embed_text(hyde_doc, task="RETRIEVAL_QUERY")
+            
+            keywords, keywords_degraded = self._wait(keywords_future, "키워드 생성", fallback=translated_query)
+            text_query = self._keywords_to_text_query(keywords)
+        finally:
+            # 시간 초과된 작업의 완료를 기다리지 않음
+            executor.shutdown(wait=False)
         
         logger.debug("HyDE 하이브리드 검색 준비 완료")
         
-        # return self.searcher.hybrid_search(
-        #     index_name=index_name,
-        #     query=text_query,
-        #     query_vector=query_vector,
-        #     text_fields=config["text_fields"],
-        #     vector_field=config["vector_field"],
-        #     top_k=top_k,
-        #     vector_weight=self.config.vector_weight,
-        #     text_weight=self.config.text_weight,
-        #     filters=filters
-        # )
-        # fusion_params 딕셔너리로 파라미터 전달
-        fusion_params = {
-            "vector_weight": self.config.vector_weight,
-            "text_weight": self.config.text_weight,
-            "rrf_k": self.config.rrf_k  # RRF 파라미터도 추가
-        }
-        
+        hits = self._run_hybrid_search(
+            index_name, text_query, query_vector, filters, top_k, config
+        )
+        return hits, degraded or hyde_degraded or keywords_degraded
+    
+    def _translate_or_original(self, user_query: str) -> str:
+        """배치 검색용 번역 (실패 시 원본 쿼리)"""
+        try:
+            return self.input_processor.translate_text(user_query, 'en')
+        except Exception as e:
+            logger.warning(f"번역 실패, 원본 쿼리 사용: {e}")
+            return user_query
+    
+    @staticmethod
+    def _keywords_to_text_query(keywords: str) -> str:
+        """OR로 분리된 생성 키워드를 공백으로 연결한 텍스트 쿼리로 변환"""
+        return _KEYWORD_SEPARATOR.sub(" ", keywords.strip())
+    
+    def _run_vector_search(
+        self,
+        index_name: str,
+        query_vector: List[float],
+        filters: List[Dict[str, Any]],
+        top_k: int,
+        config: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """준비된 쿼리 벡터로 벡터 검색 실행 (vector/hyde 공통)"""
+        return self.searcher.vector_search(
+            index_name=index_name,
+            query_vector=query_vector,
+            vector_field=config["vector_field"],
+            top_k=top_k,
+            filters=filters,
+            num_candidates=self.config.vector_search_candidates
+        )
+    
+    def _run_hybrid_search(
+        self,
+        index_name: str,
+        text_query: str,
+        query_vector: List[float],
+        filters: List[Dict[str, Any]],
+        top_k: int,
+        config: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """준비된 텍스트 쿼리/벡터로 하이브리드 검색 실행 (hybrid/hyde_hybrid 공통)"""
         return self.searcher.hybrid_search(
             index_name=index_name,
             query=text_query,
@@ -336,17 +453,96 @@ class Retriever:
             text_fields=config["text_fields"],
             vector_field=config["vector_field"],
             top_k=top_k,
-            fusion_method=self.config.fusion_method,  # convex 또는 rrf
-            fusion_params=fusion_params,  # 파라미터들을 딕셔너리로 전달
+            fusion_method=self.config.fusion_method,  # convex | rrf | native_rrf
+            fusion_params=self._fusion_params(),
             filters=filters
         )
     
-    def _create_filters(self, user_filter: str) -> List[Dict[str, Any]]:
-        """사용자 필터를 Elasticsearch 필터로 변환"""
+    def _fusion_params(self) -> Dict[str, Any]:
+        """현재 검색 설정의 하이브리드 융합 파라미터"""
+        return {
+            "vector_weight": self.config.vector_weight,
+            "text_weight": self.config.text_weight,
+            "rrf_k": self.config.rrf_k,
+            "rrf_window_size": self.config.rrf_window_size,
+            "num_candidates": self.config.vector_search_candidates
+        }
+    
+    def _new_request_executor(self) -> ThreadPoolExecutor:
+        """
+        요청 전용 스레드 풀 생성 (서로 독립적인 번역/LLM 생성/임베딩 호출 병렬 실행용)
+        
+        요청 간 공유 풀을 쓰면 동시 요청이 많을 때 작업이 큐에서 대기하는 시간까지
+        task_timeout에 포함되어 실행 전에 시간 초과될 수 있으므로 요청마다 따로 만든다.
+        
+        Returns:
+            ThreadPoolExecutor: 호출 측에서 shutdown(wait=False)로 정리
+        """
+        return ThreadPoolExecutor(
+            max_workers=self.config.parallel_workers,
+            thread_name_prefix="retriever"
+        )
+    
+    def _wait(self, future: Future, task_name: str, fallback: Any = None) -> Tuple[Any, bool]:
+        """
+        병렬 작업 결과 대기 (작업별 타임아웃, 지연/실패 시 대체값 반환)
+        
+        Args:
+            future: 제출된 작업
+            task_name: 로그용 작업명
+            fallback: 타임아웃/실패 시 반환값
+            
+        Returns:
+            Tuple: (작업 결과 또는 fallback, 대체값 사용 여부)
+        """
+        timeout = self.config.task_timeout
+        try:
+            return future.result(timeout=timeout), False
+        except FutureTimeoutError:
+            # 실행 중인 스레드는 취소할 수 없으므로 결과만 버림
+            future.cancel()
+            logger.warning(f"{task_name} 시간 초과 ({timeout}s) - 대체값 사용")
+        except Exception as e:
+            logger.warning(f"{task_name} 실패 - 대체값 사용: {e}")
+        return fallback, True
+    
+    def _get_search_config(
+        self,
+        index_name: str,
+        search_method: str,
+        overrides: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        인덱스 기반 자동 설정 조회 (오버라이드가 없으면 (인덱스, 검색 방법)별로 한 번만 계산)
+        
+        Args:
+            index_name: 인덱스명
+            search_method: 검색 방법
+            overrides: search()에 전달된 설정 오버라이드
+            
+        Returns:
+            Dict: 검색 설정 (캐시된 객체일 수 있으므로 수정 금지)
+        """
+        if overrides:
+            return auto_configure_for_index(index_name, search_method, **overrides)
+        
+        key = (index_name, search_method)
+        search_config = self._search_configs.get(key)
+        if search_config is None:
+            search_config = auto_configure_for_index(index_name, search_method)
+            self._search_configs[key] = search_config
+        return search_config
+    
+    def _create_filters(self, user_filter: str, index_name: str) -> List[Dict[str, Any]]:
+        """사용자 필터를 Elasticsearch 필터로 변환 (keyword 폴더 필드가 없는 인덱스는 기존 match_phrase 필터)"""
         if not user_filter or not user_filter.strip():
             return []
         
-        return FilterBuilder.create_folder_filters(user_filter)
+        if self.searcher.has_field(index_name, FOLDER_FIELD):
+            field_name = FOLDER_FIELD
+        else:
+            field_name = LEGACY_FOLDER_FIELD
+        return FilterBuilder.get_folder_filters(user_filter, field_name)
     
     def _combine_original_and_expanded(
         self,
@@ -354,16 +550,6 @@ class Retriever:
         expanded_hits: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """원본과 확장된 결과를 적절한 순서로 조합"""
-        # 페이지별로 그룹화하여 순서대로 조합하는 로직
-        # 현재는 간단하게 원본 + 확장된 결과 순서로 반환
-        total_hits = []
-        
-        # 원본 결과들을 먼저 추가
-        for hit in original_hits:
-            total_hits.append(hit)
-        
-        # 확장된 결과들을 추가
-        for hit in expanded_hits:
-            total_hits.append(hit)
-        
-        return total_hits
\ No newline at end of file
+        # 원본 + 확장된 결과 순서로 반환 (확장 결과는 이미 원본 hit/페이지 순서로 정렬됨)
+        # RAGPipeline은 앞쪽 len(original_hits)개가 원본이라는 순서에 의존함
+        return original_hits + expanded_hits
\ No newline at end of file
@@ -7,16 +7,33 @@
 import os
 import json
 import asyncio
-from typing import List, AsyncGenerator, Optional, Tuple
+from functools import lru_cache
+from typing import List, Dict, Any, AsyncGenerator, Iterator, Optional, Tuple
 import logging
 
+
 from app.models.schemas import SearchResult, StreamEvent
 from app.factories import RAGPipelineFactory
 from app.config.pipeline_config import DEFAULT_CONFIG
+from app.core.cache.retrieval_cache import RetrievalCache
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _build_filter_str(filters: Tuple[str, ...]) -> str:
+    """필터 목록을 파이프라인 필터 문자열로 변환 (자주 쓰는 조합은 캐시)"""
+    return " & ".join(filters) if filters else ""
+
+
+def _first_nonempty(*values, default=None):
+    """첫 번째로 비어있지 않은 값 반환"""
+    for value in values:
+        if value:
+            return value
+    return default
+
+
 class ChatService:
     """채팅 서비스 클래스"""
     
@@ -34,31 +51,53 @@ class ChatService:
 
             self.pipeline = RAGPipelineFactory.create_pipeline(config=pipeline_config)
             self.current_config = pipeline_config   # 현재설정 보관
+            
+            # 검색 결과 캐시 (동일 질문/필터 재검색 시 ES 왕복 생략)
+            cache_config = pipeline_config.cache
+            self.retrieval_cache = None
+            if cache_config.retrieval_cache_enabled:
+                self.retrieval_cache = RetrievalCache(
+                    maxsize=cache_config.retrieval_cache_size,
+                    ttl=cache_config.retrieval_cache_ttl
+                )
             logger.info("RAG 파이프라인 초기화 완료")
         except Exception as e:
             logger.error(f"RAG 파이프라인 초기화 실패: {e}")
             raise
     
-    async def get_search_results(self, query: str, filters: List[str]) -> List[SearchResult]:
+    async def warmup(self) -> None:
+        """
+        더미 질의로 파이프라인 워밍업 (이벤트 루프를 막지 않도록 스레드에서 실행)
+        """
+        await asyncio.to_thread(self.pipeline.warmup)
+    
+    async def get_search_results(
+        self,
+        query: str,
+        filters: Optional[List[str]] = None,
+        filter_str: Optional[str] = None
+    ) -> List[SearchResult]:
         """
         검색 결과만 반환
         
         Args:
             query: 사용자 질문
             filters: 문서 필터 목록
+            filter_str: 미리 생성된 필터 문자열 (지정 시 filters 무시)
             
         Returns:
             검색 결과 목록
         """
         try:
             # 필터 문자열 생성
-            filter_str = " & ".join(filters) if filters else ""
+            if filter_str is None:
+                filter_str = _build_filter_str(tuple(filters or ()))
             
             # 검색 실행 (동기 함수를 비동기로 실행)
             loop = asyncio.get_event_loop()
             hits = await loop.run_in_executor(
                 None, 
-                self.pipeline.search_only, 
+                self._search, 
                 query, 
                 filter_str
             )
@@ -82,16 +121,10 @@ class ChatService:
             AI 응답
         """
         try:
-            filter_str = " & ".join(filters) if filters else ""
+            filter_str = _build_filter_str(tuple(filters or ()))
             
-            # 응답 생성 (동기 함수를 비동기로 실행)
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None,
-                self.pipeline.run,
-                query,
-                filter_str
-            )
+            # 응답 생성 (검색은 스레드에서, 답변 생성은 비동기 클라이언트로 대기)
+            result = await self.pipeline.arun(query, filter_str)
             
             answer, total_hits, original_hits = result
             return answer, self._format_search_results(original_hits)
@@ -116,56 +149,48 @@ class ChatService:
             스트리밍 이벤트
         """
         try:
-            filter_str = " & ".join(filters) if filters else ""
+            filter_str = _build_filter_str(tuple(filters or ()))
             
             # 1단계: 스트리밍 파이프라인 실행 (검색 + 답변 생성)
             logger.info("스트리밍 파이프라인 시작")
             
-            # 검색과 답변 생성을 별도 스레드에서 실행
-            loop = asyncio.get_event_loop()
-            
-            # 검색 결과를 미리 가져오기 (답변 완료 후 전송용)
-            search_results_task = loop.run_in_executor(
-                None,
-                self.get_search_results_sync,
-                query,
-                filters
-            )
-            
-            # 스트리밍 답변 생성
-            stream_task = loop.run_in_executor(
-                None,
-                self.get_streaming_generator,
+            # 검색/컨텍스트 구성은 스레드에서, 답변은 비동기 Gemini 스트림으로 수신
+            stream_generator, total_hits, original_hits, cacheable = await self.pipeline.arun_stream(
                 query,
                 filter_str
             )
             
-            # 스트리밍 답변을 실시간으로 전송
-            stream_generator = await stream_task
+            # 이후 동일 질문의 검색 요청이 재검색하지 않도록 캐시에 저장 (품질 저하된 검색 결과 제외)
+            if self.retrieval_cache is not None and original_hits and cacheable:
+                self.retrieval_cache.set(self._cache_key(query, filter_str), original_hits)
             
             # 2단계: 답변 스트리밍 (실제 타이핑 효과)
             full_answer = ""
             chunk_buffer = ""
             
-            for chunk in stream_generator:
-                if chunk:
-                    full_answer += chunk
-                    chunk_buffer += chunk
+            # 클라이언트 연결 종료 등으로 중단되면 답변 스트림(선행 수신 작업 포함)을 바로 닫음
+            try:
+                async for chunk in stream_generator:
+                    if chunk:
+                        full_answer += chunk
+                        chunk_buffer += chunk
                     
-                    # 청크를 더 작은 단위로 분할하여 타이핑 효과 구현
-                    while len(chunk_buffer) > 0:
-                        # 한 번에 1-3글자씩 전송 (자연스러운 타이핑 효과)
-                        send_length = min(len(chunk_buffer), 3)
-                        send_chunk = chunk_buffer[:send_length]
-                        chunk_buffer = chunk_buffer[send_length:]
+                        # 청크를 더 작은 단위로 분할하여 타이핑 효과 구현
+                        while len(chunk_buffer) > 0:
+                            # 한 번에 1-3글자씩 전송 (자연스러운 타이핑 효과)
+                            send_length = min(len(chunk_buffer), 3)
+                            send_chunk = chunk_buffer[:send_length]
+                            chunk_buffer = chunk_buffer[send_length:]
                         
-                        yield StreamEvent(
-                            type="response_chunk",
-                            data={"chunk": send_chunk}
-                        )
+                            yield StreamEvent(
+                                type="response_chunk",
+                                data={"chunk": send_chunk}
+                            )
                         
-                        # 타이핑 속도 조절 (20-50ms 간격)
-                        await asyncio.sleep(0.02 + len(send_chunk) * 0.01)
+                            # 타이핑 속도 조절 (20-50ms 간격)
+                            await asyncio.sleep(0.02 + len(send_chunk) * 0.01)
+            finally:
+                await stream_generator.aclose()
             
             # 3단계: 답변 완료 신호
             yield StreamEvent(type="response_completed", data={})
@@ -174,12 +199,12 @@ class ChatService:
             # 4단계: 잠시 대기 후 검색 결과 전송 (자연스러운 UX)
             await asyncio.sleep(1.0)  # 1초 대기
             
-            # 검색 결과 가져오기
-            search_results = await search_results_task
-            
+            # 검색 결과 포맷팅 (SSE 전송용 dict 형태)
+            search_results = self._format_search_results_as_dicts(original_hits)
+
             yield StreamEvent(
                 type="search_results",
-                data={"searchResults": [result.model_dump() for result in search_results]}
+                data={"searchResults": search_results}
             )
             
             # 5단계: 전체 완료 신호
@@ -205,12 +230,64 @@ class ChatService:
             검색 결과 목록
         """
         try:
-            filter_str = " & ".join(filters) if filters else ""
-            hits = self.pipeline.search_only(query, filter_str)
+            filter_str = _build_filter_str(tuple(filters or ()))
+            hits = self._search(query, filter_str)
             return self._format_search_results(hits)
         except Exception as e:
             logger.error(f"동기 검색 실패: {e}")
             return []
+
+    def _search(self, query: str, filter_str: str) -> List[Dict[str, Any]]:
+        """
+        검색 결과 캐시를 먼저 조회하고, 미스 시 검색 후 캐시에 저장
+        
+        Args:
+            query: 사용자 질문
+            filter_str: 필터 문자열
+            
+        Returns:
+            검색 결과 (캐시 사용 시 응답 구성에 필요한 필드만 포함)
+        """
+        if self.retrieval_cache is None:
+            return self.pipeline.search_only(query, filter_str)
+        
+        key = self._cache_key(query, filter_str)
+        hits = self.retrieval_cache.get(key)
+        if hits is None:
+            hits, degraded = self.pipeline.search_only_with_status(query, filter_str)
+            # 빈 결과/품질 저하된 결과는 일시적 오류일 수 있으므로 캐시하지 않음
+            if hits and not degraded:
+                hits = self.retrieval_cache.set(key, hits)
+        return hits
+    
+    def _cache_key(self, query: str, filter_str: str) -> Tuple:
+        """현재 검색 설정 기준 검색 결과 캐시 키 생성"""
+        search_config = self.pipeline.retriever.config
+        return self.retrieval_cache.make_key(
+            search_config.index_name,
+            search_config.search_method,
+            search_config.top_k,
+            query,
+            filter_str
+        )
+    
+    def invalidate_cache(self, index: Optional[str] = None) -> int:
+        """
+        검색 결과/답변/필터 사전 확인 캐시 무효화 (인덱스 갱신 시 호출)
+        
+        Args:
+            index: 무효화할 인덱스명 (None이면 전체)
+            
+        Returns:
+            제거된 캐시 항목 수
+        """
+        removed = 0
+        if self.retrieval_cache is not None:
+            removed += self.retrieval_cache.invalidate(index)
+        if self.pipeline.answer_cache is not None:
+            removed += self.pipeline.answer_cache.invalidate(index)
+        removed += self.pipeline.retriever.searcher.invalidate_cache(index)
+        return removed
     
     def get_streaming_generator(self, query: str, filter_str: str):
         """
@@ -223,16 +300,35 @@ class ChatService:
         Returns:
             스트리밍 제너레이터
         """
+        answer_stream, _ = self._stream(query, filter_str)
+        return answer_stream
+    
+    def _stream(self, query: str, filter_str: str) -> Tuple:
+        """
+        RAG 파이프라인의 스트리밍 제너레이터 생성 (실패 시 오류 메시지 제너레이터)
+        
+        Args:
+            query: 사용자 질문
+            filter_str: 필터 문자열
+            
+        Returns:
+            Tuple: (스트리밍 제너레이터, 원본 검색 hits)
+        """
         try:
             # RAG 파이프라인에서 스트리밍 제너레이터 가져오기
-            answer_stream, total_hits, original_hits = self.pipeline.run_stream(query, filter_str)
-            return answer_stream
+            answer_stream, total_hits, original_hits, cacheable = self.pipeline.run_stream(query, filter_str)
+            
+            # 이후 동일 질문의 검색 요청이 재검색하지 않도록 캐시에 저장 (품질 저하된 검색 결과 제외)
+            if self.retrieval_cache is not None and original_hits and cacheable:
+                self.retrieval_cache.set(self._cache_key(query, filter_str), original_hits)
+            
+            return answer_stream, original_hits
         except Exception as e:
             logger.error(f"스트리밍 제너레이터 생성 실패: {e}")
             # 에러 시 빈 제너레이터 반환
             def empty_generator():
                 yield f"답변 생성 중 오류가 발생했습니다: {str(e)}"
-            return empty_generator()
+            return empty_generator(), []
     
     async def generate_chunked_response(
         self,
@@ -266,26 +362,55 @@ class ChatService:
         Returns:
             포맷팅된 검색 결과
         """
-        results = []
-        
+        # 값의 타입은 _hit_to_result_dict에서 이미 변환되므로 검증 생략
+        return [
+            SearchResult.model_construct(**result)
+            for result in self._iter_search_result_dicts(hits)
+        ]
+
+    def _format_search_results_as_dicts(self, hits: List) -> List[Dict[str, Any]]:
+        """
+        검색 결과를 API 응답 형식의 dict로 변환 (Pydantic 모델 생성 없이)
+
+        Args:
+            hits: Elasticsearch 검색 결과
+
+        Returns:
+            포맷팅된 검색 결과 dict 목록
+        """
+        return list(self._iter_search_result_dicts(hits))
+
+    def _iter_search_result_dicts(self, hits: List) -> Iterator[Dict[str, Any]]:
+        """
+        검색 결과를 한 건씩 API 응답 형식의 dict로 변환 (중간 목록 생성 없음)
+
+        Args:
+            hits: Elasticsearch 검색 결과
+
+        Yields:
+            포맷팅된 검색 결과 dict (변환 실패한 hit는 건너뜀)
+        """
         for hit in hits:
             try:
-                src = hit.get("_source", {})
-                
-                # 파일 경로 처리 (MinIO 경로 또는 로컬 경로)
-                file_path = src.get("minio_pdf_path") or src.get("gcs_pdf_path") or "public/sample.pdf"
-                
-                result = SearchResult(
-                    fileName=os.path.basename(file_path) or "Unknown",
-                    filePath=file_path,
-                    pageNumber=int(src.get("page_number") or src.get("page") or 0),
-                    score=float(hit.get("_score", -1)),
-                )
-                
-                results.append(result)
-                
+                yield self._hit_to_result_dict(hit)
             except Exception as e:
                 logger.warning(f"검색 결과 포맷팅 실패: {e}")
-                continue
-        
-        return results
\ No newline at end of file
+
+    @staticmethod
+    def _hit_to_result_dict(hit: Dict[str, Any]) -> Dict[str, Any]:
+        """단일 검색 결과를 SearchResult 필드 구성의 dict로 변환"""
+        src = hit.get("_source", {})
+
+        # 파일 경로 처리 (MinIO 경로 또는 로컬 경로)
+        file_path = _first_nonempty(
+            src.get("minio_pdf_path"),
+            src.get("gcs_pdf_path"),
+            default="public/sample.pdf"
+        )
+
+        return {
+            "fileName": os.path.basename(file_path) or "Unknown",
+            "filePath": file_path,
+            "pageNumber": int(_first_nonempty(src.get("page_number"), src.get("page"), default=0)),
+            "score": float(hit.get("_score", -1)),
+        }
\ No newline at end of file
@@ -2,26 +2,38 @@
 검색 필터 구성 유틸리티
 """
 
-from typing import List, Dict, Any
+from itertools import combinations
+from functools import lru_cache
+from typing import List, Dict, Any, FrozenSet
 import logging
 
+from app.utils.formatters import get_known_folder_paths
+
 logger = logging.getLogger(__name__)
 
 
+# 폴더 필터 대상 필드 - folder_levels의 keyword 서브필드로 정확히 일치하는 폴더명을 term 필터링
+# (분석되지 않은 정확 일치 필터라 ES 필터 캐시 적용 가능)
+FOLDER_FIELD = "folder_levels.keyword"
+
+# 인덱스 매핑에 FOLDER_FIELD가 없을 때 사용하는 기존 필터 필드 (분석 필드 match_phrase)
+LEGACY_FOLDER_FIELD = "gcs_path"
+
+
 class FilterBuilder:
     """검색 필터 구성 클래스"""
     
     @staticmethod
-    def create_folder_filters(user_filter: str, field_name: str = "gcs_path") -> List[Dict[str, Any]]:
+    def create_folder_filters(user_filter: str, field_name: str = FOLDER_FIELD) -> List[Dict[str, Any]]:
         """
         사용자 필터 문자열에서 폴더 기반 필터 생성
         
         Args:
             user_filter: 사용자 입력 필터 ("폴더A/서브폴더1 & 폴더B/서브폴더2" 형태)
-            field_name: 필터를 적용할 필드명
+            field_name: 필터를 적용할 필드명 (keyword 필드면 term, 아니면 match_phrase)
             
         Returns:
-            List[Dict]: Elasticsearch match_phrase 필터 목록
+            List[Dict]: Elasticsearch term(또는 match_phrase) 필터 목록
         """
         if not user_filter or not user_filter.strip():
             return []
@@ -30,6 +42,9 @@ class FilterBuilder:
             # '&' 기준으로 분리
             filter_parts = user_filter.strip().split('&')
             
+            # keyword 필드는 정확 일치 term, 분석 필드는 기존 match_phrase 사용
+            clause_type = 'term' if field_name.endswith('.keyword') else 'match_phrase'
+            
             # 각 부분을 정리하고 마지막 경로 추출
             filters = []
             for part in filter_parts:
@@ -39,7 +54,7 @@ class FilterBuilder:
                     last_folder = cleaned_part.split('/')[-1].strip()
                     if last_folder:
                         filters.append({
-                            'match_phrase': {field_name: last_folder}
+                            clause_type: {field_name: last_folder}
                         })
             
             logger.debug(f"생성된 필터: {filters}")
@@ -49,6 +64,34 @@ class FilterBuilder:
             logger.error(f"필터 생성 실패: {e}")
             return []
     
+    @staticmethod
+    def get_folder_filters(user_filter: str, field_name: str = FOLDER_FIELD) -> List[Dict[str, Any]]:
+        """
+        폴더 필터 조회 (미리 계산된 조합이면 dict 조회, 아니면 동적 생성)
+        
+        Args:
+            user_filter: 사용자 입력 필터 ("폴더A/서브폴더1 & 폴더B/서브폴더2" 형태)
+            field_name: 필터를 적용할 필드명 (FOLDER_FIELD만 미리 계산됨)
+            
+        Returns:
+            List[Dict]: Elasticsearch 필터 목록 (호출마다 새 객체이므로 수정해도 캐시에 영향 없음)
+        """
+        if not user_filter or not user_filter.strip():
+            return []
+        
+        filters = None
+        if field_name == FOLDER_FIELD:
+            key = frozenset(part.strip() for part in user_filter.split('&') if part.strip())
+            filters = PRECOMPUTED_FILTERS.get(key)
+        if filters is None:
+            filters = _cached_folder_filters(user_filter.strip(), field_name)
+        
+        # 캐시된 필터는 {절 종류: {필드: 값}} 2단 구조이므로 두 단계만 복사
+        return [
+            {clause_type: dict(clause) for clause_type, clause in folder_filter.items()}
+            for folder_filter in filters
+        ]
+    
     @staticmethod
     def create_term_filters(values: List[str], field_name: str) -> List[Dict[str, Any]]:
         """
@@ -147,4 +190,34 @@ class FilterBuilder:
         if operator == "should" and minimum_should_match > 0:
             bool_query["bool"]["minimum_should_match"] = minimum_should_match
         
-        return bool_query
\ No newline at end of file
+        return bool_query
+
+
+@lru_cache(maxsize=256)
+def _cached_folder_filters(user_filter: str, field_name: str = FOLDER_FIELD) -> List[Dict[str, Any]]:
+    """미리 계산되지 않은 필터 조합의 동적 생성 결과 메모이즈 (공유 객체, get_folder_filters에서 복사하여 반환)"""
+    return FilterBuilder.create_folder_filters(user_filter, field_name)
+
+
+def _precompute_folder_filters(max_combination: int = 2) -> Dict[FrozenSet[str], List[Dict[str, Any]]]:
+    """
+    UI에서 선택 가능한 폴더 경로의 1~max_combination개 조합에 대한 필터를 미리 생성
+    
+    Args:
+        max_combination: 미리 계산할 최대 조합 크기
+        
+    Returns:
+        Dict: 폴더 경로 집합 → Elasticsearch 필터 목록
+    """
+    folder_paths = get_known_folder_paths()
+    precomputed = {}
+    
+    for size in range(1, max_combination + 1):
+        for combo in combinations(folder_paths, size):
+            precomputed[frozenset(combo)] = FilterBuilder.create_folder_filters(" & ".join(combo))
+    
+    return precomputed
+
+
+# 앱 시작(모듈 임포트) 시 한 번만 계산 (공유 객체, get_folder_filters에서 복사하여 반환)
+PRECOMPUTED_FILTERS: Dict[FrozenSet[str], List[Dict[str, Any]]] = _precompute_folder_filters()
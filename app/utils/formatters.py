@@ -1,15 +1,41 @@
 """
 포맷팅 및 유틸리티 함수들
 """
+import io
+import numpy as np
 import pandas as pd
+import re
 import time
 import logging
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import List, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+# 엑셀 표 이름 → 원본 폴더 경로 매핑 (UI에서 선택 가능한 문서 폴더 목록)
+_EXCEL_NAME_REVERT_MAP = {
+    'International_Standards__IEC': '1. International Standards/IEC',
+    'International_Standards__IEEE': '1. International Standards/IEEE',
+    'Type_Test_Reports__145SP3__145_kV_40_kA_MS_2017': '2. Type Test Reports/145SP-3/145 kV 40 kA MS (2017)',
+    'Type_Test_Reports__300SR__245_kV_50_kA_MS_2020': '2. Type Test Reports/300SR/245 kV 50 kA MS (2020)',
+    'Type_Test_Reports__300SR__245_kV_63_kA_MS_2024': '2. Type Test Reports/300SR/245 kV 63 kA MS (2024)',
+    'Customer_Standard_Specifications__Australia__Endeavour_Energy': '3. Customer Standard Specifications/Australia/Endeavour Energy',
+    'Customer_Standard_Specifications__Oman__OETC': '3. Customer Standard Specifications/Oman/OETC',
+    'Customer_Standard_Specifications__Saudi_Arabia__SEC': '3. Customer Standard Specifications/Saudi Arabia/SEC',
+    'Customer_Standard_Specifications__Spain__Iberdrola': '3. Customer Standard Specifications/Spain/Iberdrola',
+    'Customer_Standard_Specifications__Spain__REE': '3. Customer Standard Specifications/Spain/REE'
+}
+
+# 원본 폴더 경로 → 엑셀 표 이름 (알려진 폴더는 변환 규칙 적용 없이 바로 반환)
+_EXCEL_NAME_FORWARD_MAP = {original: excel for excel, original in _EXCEL_NAME_REVERT_MAP.items()}
+
+
+# 엑셀 표 이름 변환 규칙: 앞쪽 번호(`1.`) 제거 후 `/` → `__`, 공백 → `_`, `(`, `)`, `-` 제거
+_LEADING_NUMBER = re.compile(r'^\d+\.\s*')
+_EXCEL_NAME_TRANSLATION = str.maketrans({'/': '__', ' ': '_', '(': None, ')': None, '-': None})
+
+
 def timed(label: str, func, *args, **kwargs):
     """
     함수 실행 시간 측정 및 로깅
@@ -22,17 +48,22 @@ def timed(label: str, func, *args, **kwargs):
     Returns:
         함수 실행 결과
     """
-    logger.info(f"======================== [{label}] 시작 ========================")
-    start = time.time()
+    # 단조 시계로 측정 (시스템 시각 보정 영향 없음), 로그 포맷팅은 해당 레벨이 켜졌을 때만 수행
+    logger.info("======================== [%s] 시작 ========================", label)
+    start = time.perf_counter_ns()
     
     try:
         result = func(*args, **kwargs)
-        end = time.time()
-        logger.info(f"======================== [{label}] 완료 - (소요시간: {end - start:.3f}초) ========================\n")
+        logger.info(
+            "======================== [%s] 완료 - (소요시간: %.3f초) ========================\n",
+            label, (time.perf_counter_ns() - start) / 1e9
+        )
         return result
     except Exception as e:
-        end = time.time()
-        logger.error(f"======================== [{label}] 실패 - (소요시간: {end - start:.3f}초): {e} ========================\n")
+        logger.error(
+            "======================== [%s] 실패 - (소요시간: %.3f초): %s ========================\n",
+            label, (time.perf_counter_ns() - start) / 1e9, e
+        )
         raise
 
 
@@ -74,21 +105,22 @@ def convert_to_excel_name(original_name: str) -> str:
     Returns:
         str: 변환된 이름
     """
-    import re
-    
-    # 숫자 + 점(`1.`) 제거
-    modified_name = re.sub(r'^\d+\.\s*', '', original_name)
-    
-    # 슬래시(`/`) → `__`
-    modified_name = modified_name.replace("/", "__")
+    known = _EXCEL_NAME_FORWARD_MAP.get(original_name)
+    if known is not None:
+        return known
     
-    # 공백 → `_`
-    modified_name = modified_name.replace(" ", "_")
-    
-    # 특수 문자 제거 (`(`, `)`, `-`)
-    modified_name = re.sub(r'[()-]', '', modified_name)
+    # 숫자 + 점(`1.`) 제거 후 문자 치환/제거를 한 번에 처리
+    return _LEADING_NUMBER.sub('', original_name, count=1).translate(_EXCEL_NAME_TRANSLATION)
+
+
+def get_known_folder_paths() -> Tuple[str, ...]:
+    """
+    UI에서 선택 가능한 문서 폴더 원본 경로 목록
     
-    return modified_name
+    Returns:
+        Tuple[str, ...]: 원본 폴더 경로들 (정렬됨)
+    """
+    return tuple(sorted(_EXCEL_NAME_REVERT_MAP.values()))
 
 
 def revert_to_original_name(modified_name: str) -> str:
@@ -101,19 +133,7 @@ def revert_to_original_name(modified_name: str) -> str:
     Returns:
         str: 원본 이름
     """
-    mappings = {
-        'International_Standards__IEC': '1. International Standards/IEC',
-        'International_Standards__IEEE': '1. International Standards/IEEE',
-        'Type_Test_Reports__145SP3__145_kV_40_kA_MS_2017': '2. Type Test Reports/145SP-3/145 kV 40 kA MS (2017)',
-        'Type_Test_Reports__300SR__245_kV_50_kA_MS_2020': '2. Type Test Reports/300SR/245 kV 50 kA MS (2020)',
-        'Type_Test_Reports__300SR__245_kV_63_kA_MS_2024': '2. Type Test Reports/300SR/245 kV 63 kA MS (2024)',
-        'Customer_Standard_Specifications__Australia__Endeavour_Energy': '3. Customer Standard Specifications/Australia/Endeavour Energy',
-        'Customer_Standard_Specifications__Oman__OETC': '3. Customer Standard Specifications/Oman/OETC',
-        'Customer_Standard_Specifications__Saudi_Arabia__SEC': '3. Customer Standard Specifications/Saudi Arabia/SEC',
-        'Customer_Standard_Specifications__Spain__Iberdrola': '3. Customer Standard Specifications/Spain/Iberdrola',
-        'Customer_Standard_Specifications__Spain__REE': '3. Customer Standard Specifications/Spain/REE'
-    }
-    return mappings.get(modified_name, modified_name)
+    return _EXCEL_NAME_REVERT_MAP.get(modified_name, modified_name)
 
 
 def get_gt_refs(row) -> List[Tuple[str, str, int]]:
@@ -139,6 +159,47 @@ def get_gt_refs(row) -> List[Tuple[str, str, int]]:
     return gt_refs
 
 
+def get_gt_refs_df(df: pd.DataFrame) -> List[List[Tuple[str, str, int]]]:
+    """
+    QA 성능평가 데이터셋 전체에서 ground truth 참조 일괄 추출 (행별 get_gt_refs와 동일한 결과)
+    
+    Args:
+        df: 평가 데이터셋 (page_n/path_n/filename_n 컬럼)
+        
+    Returns:
+        List[List[Tuple]]: 행 순서대로의 (path, filename, page) 튜플 리스트
+    """
+    # page_1부터 연속으로 존재하는 참조 컬럼 수
+    num_refs = 0
+    while num_refs < 13 and f"page_{num_refs + 1}" in df.columns:
+        num_refs += 1
+    if num_refs == 0:
+        return [[] for _ in range(len(df))]
+    
+    ref_range = range(1, num_refs + 1)
+    pages = df[[f"page_{n}" for n in ref_range]].to_numpy(dtype=object)
+    paths = df[[f"path_{n}" for n in ref_range]].to_numpy(dtype=object)
+    filenames = df[[f"filename_{n}" for n in ref_range]].to_numpy(dtype=object)
+    
+    # 행별 첫 빈 페이지 위치까지가 유효 참조
+    valid = ~pd.isna(pages)
+    counts = np.where(valid.all(axis=1), num_refs, valid.argmin(axis=1))
+    
+    return [
+        [
+            (path, filename, int(page))
+            for path, filename, page in zip(paths[i, :k], filenames[i, :k], pages[i, :k])
+        ]
+        for i, k in enumerate(counts.tolist())
+    ]
+
+
+@lru_cache(maxsize=256)
+def _folder_levels_to_excel_name(folder_levels: Tuple[str, ...]) -> str:
+    """폴더 단계 목록을 엑셀 표 이름으로 변환 (캐시)"""
+    return convert_to_excel_name('/'.join(folder_levels))
+
+
 def get_search_refs(hits: List[Dict[str, Any]]) -> List[Tuple[str, str, int]]:
     """
     검색 결과에서 참조 정보 추출
@@ -153,10 +214,10 @@ def get_search_refs(hits: List[Dict[str, Any]]) -> List[Tuple[str, str, int]]:
     for hit in hits:
         src = hit.get("_source", {})
         
-        # 경로 정보
+        # 경로 정보 (폴더 종류가 적으므로 폴더별 변환 결과 재사용)
         folder_levels = src.get("folder_levels", [])
         if folder_levels:
-            search_path = convert_to_excel_name('/'.join(folder_levels))
+            search_path = _folder_levels_to_excel_name(tuple(folder_levels))
         else:
             search_path = "Unknown"
         
@@ -180,13 +241,18 @@ def get_retrieved_context(hits: List[Dict[str, Any]], text_field: str = "content
     Returns:
         str: 결합된 컨텍스트 텍스트
     """
-    search_contents = []
+    # 중간 리스트 없이 버퍼에 바로 기록 (빈 텍스트는 건너뛰고 번호도 매기지 않음)
+    buffer = io.StringIO()
+    count = 0
     for hit in hits:
         content = hit.get("_source", {}).get(text_field, "")
-        if content:
-            search_contents.append(content)
+        if not content:
+            continue
+        
+        if count:
+            buffer.write('\n\n')
+        count += 1
+        buffer.write(f"### Retrieved Context {count}: ")
+        buffer.write(content)
     
-    return '\n\n'.join(
-        f"### Retrieved Context {i+1}: {text}" 
-        for i, text in enumerate(search_contents)
-    )
\ No newline at end of file
+    return buffer.getvalue()
@@ -4,16 +4,56 @@
 
 from typing import Optional
 import logging
+import re
 from google.cloud import translate_v2 as translate
 
+from app.core.cache.ttl_cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+# 한글 음절 (포함 시 한국어로 판단)
+_HANGUL_SYLLABLE = re.compile(r"[\uac00-\ud7a3]")
+
+# 영어 단어 토큰 및 흔한 영어 불용어 (ASCII 텍스트에 포함 시 영어로 판단)
+_ASCII_WORD = re.compile(r"[a-z]+")
+_ENGLISH_STOPWORDS = frozenset({
+    "the", "an", "is", "are", "was", "were", "does", "what", "how",
+    "which", "when", "why", "where", "who", "can", "of", "to", "for",
+    "on", "with", "and", "this", "that",
+})
+
+
+def guess_language(text: str) -> Optional[str]:
+    """
+    번역 API 없이 확실한 경우만 언어 추정 (영어 불용어가 있는 ASCII 텍스트 → 'en', 한글 포함 → 'ko')
+    
+    로마자 표기 외국어, 제품 코드, 약어만 있는 ASCII 텍스트는 판단하지 않음 (None 반환 → detect_language 사용)
+    
+    Args:
+        text: 언어를 추정할 텍스트
+        
+    Returns:
+        str: 추정 언어 코드 (판단할 수 없으면 None)
+    """
+    if text.isascii():
+        words = _ASCII_WORD.findall(text.lower())
+        return "en" if any(word in _ENGLISH_STOPWORDS for word in words) else None
+    if _HANGUL_SYLLABLE.search(text):
+        return "ko"
+    return None
+
 
 class InputProcessor:
     """사용자 입력 처리 클래스"""
     
-    def __init__(self):
-        """번역 클라이언트 초기화"""
+    def __init__(self, cache: Optional[TTLCache] = None):
+        """
+        번역 클라이언트 초기화
+        
+        Args:
+            cache: 번역 결과 캐시 (None이면 미사용)
+        """
+        self.cache = cache
         try:
             self.translate_client = translate.Client()
             logger.info("Google 번역 클라이언트 초기화 완료")
@@ -63,22 +103,34 @@ class InputProcessor:
             logger.warning("번역 클라이언트가 없어서 원본 텍스트 반환")
             return text
         
+        # 같은 질문의 언어 감지/번역 API 재호출 방지 (실패한 결과는 캐시하지 않음)
+        cache_key = (" ".join(text.split()), target_language, source_language)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
-            # 언어 감지
-            if source_language is None:
-                detected_lang = self.detect_language(text)
-                if detected_lang == target_language:
-                    return text
+            # 원본이 이미 목표 언어면 그대로 사용 (영문/한글은 로컬 판단, 그 외는 번역 응답의 감지 결과로 판단)
+            if source_language is None and guess_language(text) == target_language:
+                translated = text
             elif source_language == target_language:
-                return text
+                translated = text
+            else:
+                # 번역 API가 원본 언어를 함께 감지하므로 별도 감지 호출 없이 한 번에 처리
+                result = self.translate_client.translate(
+                    text,
+                    target_language=target_language,
+                    source_language=source_language
+                )
+                if result.get('detectedSourceLanguage') == target_language:
+                    translated = text
+                else:
+                    translated = result['translatedText']
             
-            # 번역 수행
-            result = self.translate_client.translate(
-                text,
-                target_language=target_language,
-                source_language=source_language
-            )
-            return result['translatedText']
+            if self.cache is not None:
+                self.cache.set(cache_key, translated)
+            return translated
             
         except Exception as e:
             logger.error(f"번역 실패: {e}")
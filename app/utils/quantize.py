@@ -0,0 +1,85 @@
+"""
+차원별 보정 테이블 기반 int8 벡터 양자화 (ES element_type: byte 인덱스용)
+"""
+
+import logging
+
+import numpy as np
+
+from app.utils.vec_ops import VectorLike, as_float32
+
+logger = logging.getLogger(__name__)
+
+
+class Quantizer:
+    """차원별 min/max로 보정한 scale/zero_point로 float 벡터를 int8로 변환"""
+    
+    def __init__(self, scale: np.ndarray, zero_point: np.ndarray):
+        """
+        양자화기 초기화
+        
+        Args:
+            scale: 차원별 스케일 (dim,)
+            zero_point: 차원별 영점 (dim,)
+        """
+        self.scale = as_float32(scale)
+        self.zero_point = as_float32(zero_point)
+    
+    @property
+    def dim(self) -> int:
+        return self.scale.shape[0]
+    
+    @classmethod
+    def fit(cls, vectors: VectorLike) -> "Quantizer":
+        """
+        샘플 벡터로 차원별 보정 테이블 생성
+        
+        Args:
+            vectors: 샘플 코퍼스 임베딩 (n, dim)
+            
+        Returns:
+            Quantizer: 보정된 양자화기
+        """
+        array = as_float32(vectors)
+        if array.ndim != 2 or array.shape[0] == 0:
+            raise ValueError(f"(n, dim) 형태의 샘플 벡터가 필요합니다: {array.shape}")
+        
+        mins = array.min(axis=0)
+        maxs = array.max(axis=0)
+        
+        # 값 범위가 0인 차원은 스케일 1로 처리
+        scale = np.where(maxs > mins, (maxs - mins) / 255.0, 1.0)
+        zero_point = mins
+        
+        logger.info(f"양자화 보정 완료: {array.shape[0]}개 샘플, {array.shape[1]}차원")
+        return cls(scale, zero_point)
+    
+    def quantize(self, vectors: VectorLike) -> np.ndarray:
+        """
+        벡터(또는 행렬)를 int8로 양자화 (색인/질문 양쪽에 동일하게 적용)
+        
+        Args:
+            vectors: 벡터 (dim,) 또는 (n, dim)
+            
+        Returns:
+            np.ndarray: int8 배열
+        """
+        array = as_float32(vectors)
+        if array.shape[-1] != self.dim:
+            raise ValueError(f"벡터 차원 불일치: {array.shape[-1]} != {self.dim}")
+        
+        levels = np.round((array - self.zero_point) / self.scale) - 128
+        return np.clip(levels, -128, 127).astype(np.int8)
+    
+    def save(self, path: str) -> None:
+        """보정 테이블 저장 (.npz)"""
+        np.savez(path, scale=self.scale, zero_point=self.zero_point)
+        logger.info(f"양자화 보정 테이블 저장: {path}")
+    
+    @classmethod
+    def load(cls, path: str) -> "Quantizer":
+        """보정 테이블 로드 (.npz)"""
+        with np.load(path) as data:
+            quantizer = cls(data["scale"], data["zero_point"])
+        logger.info(f"양자화 보정 테이블 로드: {path} ({quantizer.dim}차원)")
+        return quantizer
@@ -2,16 +2,111 @@
 쿼리 향상 유틸리티 (키워드 생성, HyDE 등)
 """
 
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+import json
 import logging
 
 from app.core.generation.base_generator import BaseGenerator
+from app.core.cache.ttl_cache import TTLCache
 from app.utils.input_processor import InputProcessor
 from app.config.pipeline_config import GenerationConfig
 
 logger = logging.getLogger(__name__)
 
 
+# 프롬프트 템플릿 (임포트 시 한 번만 정리, {QUERY} 자리에 질문 삽입)
+_KEYWORD_PROMPT_TEMPLATE = """
+You are an AI assistant specialized in generating Elasticsearch query strings. Your task is to create the most effective query string for the given user question. This query string will be used to search for relevant documents in an Elasticsearch index.
+
+Guidelines:
+1. Analyze the user's question carefully.
+2. Generate ONLY a query string suitable for Elasticsearch's match query.
+3. Focus on key terms and concepts from the question.
+4. Include synonyms, related terms, and various word forms that might be in relevant documents:
+   - Include common synonyms and closely related concepts
+   - Consider different tenses of verbs (e.g., walk, walks, walked, walking)
+   - Include singular and plural forms of nouns
+   - Add common abbreviations or acronyms if applicable
+5. Use simple Elasticsearch query string syntax if helpful (e.g., OR).
+6. Do not use advanced Elasticsearch features or syntax.
+7. Do not include any explanations, comments, or additional text.
+8. Provide only the query string, nothing else.
+
+Use only OR as the operator. AND is not allowed.
+
+User Question:
+{QUERY}
+
+Generate the Elasticsearch query string:
+""".strip()
+
+# 여러 질문의 키워드를 한 번의 요청으로 생성 (JSON 객체 응답, {QUESTIONS} 자리에 "qN: 질문" 목록 삽입)
+_KEYWORD_BATCH_PROMPT_TEMPLATE = """
+You are an AI assistant specialized in generating Elasticsearch query strings. Your task is to create the most effective query string for each of the given user questions. These query strings will be used to search for relevant documents in an Elasticsearch index.
+
+Guidelines:
+1. Analyze each user question carefully and independently.
+2. Generate ONLY a query string suitable for Elasticsearch's match query for each question.
+3. Focus on key terms and concepts from the question.
+4. Include synonyms, related terms, and various word forms that might be in relevant documents:
+   - Include common synonyms and closely related concepts
+   - Consider different tenses of verbs (e.g., walk, walks, walked, walking)
+   - Include singular and plural forms of nouns
+   - Add common abbreviations or acronyms if applicable
+5. Use simple Elasticsearch query string syntax if helpful (e.g., OR).
+6. Do not use advanced Elasticsearch features or syntax.
+7. Do not include any explanations, comments, or additional text.
+
+Use only OR as the operator. AND is not allowed.
+
+User Questions:
+{QUESTIONS}
+
+Respond with a JSON object mapping each question id (q1, q2, ...) to its Elasticsearch query string.
+""".strip()
+
+_HYDE_PROMPT_TEMPLATE = """
+You are an AI assistant specialized in generating hypothetical documents based on user queries. Your task is to create a detailed, factual document that would likely contain the answer to the user's question. This hypothetical document will be used to enhance the retrieval process in a Retrieval-Augmented Generation (RAG) system.
+
+Guidelines:
+1. Carefully analyze the user's query to understand the topic and the type of information being sought.
+2. Generate a hypothetical document that:
+   a. Is directly relevant to the query
+   b. Contains factual information that would answer the query
+   c. Includes additional context and related information
+   d. Uses a formal, informative tone similar to an encyclopedia or textbook entry
+3. Structure the document with clear paragraphs, covering different aspects of the topic.
+4. Include specific details, examples, or data points that would be relevant to the query.
+5. Aim for a document length of 200-300 words.
+6. Do not use citations or references, as this is a hypothetical document.
+7. Avoid using phrases like "In this document" or "This text discusses" - write as if it's a real, standalone document.
+8. Do not mention or refer to the original query in the generated document.
+9. Ensure the content is factual and objective, avoiding opinions or speculative information.
+10. Output only the generated document, without any additional explanations or meta-text.
+
+User Question:
+{QUERY}
+
+Generate a hypothetical document that would likely contain the answer to this query:
+""".strip()
+
+
+def _split_template(template: str, placeholder: str) -> Tuple[str, str]:
+    """자리표시자가 정확히 한 번 나오는 템플릿을 (앞부분, 뒷부분)으로 분리"""
+    if template.count(placeholder) != 1:
+        raise ValueError(f"프롬프트 템플릿에 {placeholder}가 정확히 한 번 있어야 합니다")
+    prefix, _, suffix = template.partition(placeholder)
+    return prefix, suffix
+
+
+# 호출마다 템플릿 전체를 탐색하지 않도록 임포트 시 분리 (앞부분 + 질문 + 뒷부분)
+_KEYWORD_PROMPT_PREFIX, _KEYWORD_PROMPT_SUFFIX = _split_template(_KEYWORD_PROMPT_TEMPLATE, "{QUERY}")
+_KEYWORD_BATCH_PROMPT_PREFIX, _KEYWORD_BATCH_PROMPT_SUFFIX = _split_template(
+    _KEYWORD_BATCH_PROMPT_TEMPLATE, "{QUESTIONS}"
+)
+_HYDE_PROMPT_PREFIX, _HYDE_PROMPT_SUFFIX = _split_template(_HYDE_PROMPT_TEMPLATE, "{QUERY}")
+
+
 class QueryEnhancer:
     """쿼리 향상 처리 클래스"""
     
@@ -19,7 +114,8 @@ class QueryEnhancer:
         self, 
         generator: BaseGenerator, 
         input_processor: InputProcessor,
-        generation_config: Optional[GenerationConfig] = None
+        generation_config: Optional[GenerationConfig] = None,
+        cache: Optional[TTLCache] = None
     ):
         """
         쿼리 향상기 초기화
@@ -28,10 +124,16 @@ class QueryEnhancer:
             generator: 텍스트 생성기
             input_processor: 입력 처리기
             generation_config: 생성 설정 (각 단계별 설정 포함)
+            cache: 키워드/HyDE 생성 결과 캐시 (None이면 미사용)
         """
         self.generator = generator
         self.input_processor = input_processor
         self.generation_config = generation_config or GenerationConfig()
+        self.cache = cache
+    
+    def _cache_key(self, kind: str, query: str, translate_to_english: bool, config: Dict[str, Any]) -> tuple:
+        """(생성 종류, 정규화 질문, 번역 여부, 생성 설정) 기반 캐시 키"""
+        return (kind, " ".join(query.split()), translate_to_english, repr(sorted(config.items())))
     
     def generate_keywords(
         self,
@@ -50,6 +152,16 @@ class QueryEnhancer:
         Returns:
             str: 생성된 키워드 (OR로 연결)
         """
+        # 생성 설정: 파라미터 우선 → config의 keyword_generation → 기본값
+        config = generation_config or self.generation_config.keyword_generation
+        
+        cache_key = self._cache_key("keywords", query, translate_to_english, config)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug("키워드 캐시 히트")
+                return cached
+        
         try:
             # 필요시 영어로 번역
             if translate_to_english:
@@ -60,18 +172,98 @@ class QueryEnhancer:
             # 키워드 생성 프롬프트
             prompt = self._get_keyword_generation_prompt(query_en)
             
-            # 생성 설정: 파라미터 우선 → config의 keyword_generation → 기본값
-            config = generation_config or self.generation_config.keyword_generation
-            keywords = self.generator.generate_text(prompt, generation_config=config)
+            keywords = self.generator.generate_text(prompt, generation_config=config).strip()
             
             logger.debug(f"생성된 키워드: {keywords}")
-            return keywords.strip()
+            if self.cache is not None:
+                self.cache.set(cache_key, keywords)
+            return keywords
             
         except Exception as e:
             logger.error(f"키워드 생성 실패: {e}")
             # 실패 시 원본 쿼리 반환
             return query
     
+    def generate_keywords_batch(
+        self,
+        queries: List[str],
+        translate_to_english: bool = True,
+        generation_config: Optional[Dict[str, Any]] = None,
+        batch_size: int = 16
+    ) -> List[str]:
+        """
+        여러 쿼리의 키워드를 batch_size개씩 한 번의 생성 요청으로 생성 (평가 등 대량 질의용)
+        
+        Args:
+            queries: 원본 쿼리 목록
+            translate_to_english: 영어로 번역 여부
+            generation_config: 생성 설정 (None이면 기본 keyword_generation 설정 사용)
+            batch_size: 한 요청에 묶을 쿼리 수
+            
+        Returns:
+            List[str]: 입력 순서대로의 생성 키워드 (응답에 빠진 쿼리는 개별 생성)
+        """
+        config = generation_config or self.generation_config.keyword_generation
+        results: List[Optional[str]] = [None] * len(queries)
+        
+        # 캐시 미스 쿼리만 모으기 (같은 쿼리는 한 번만 생성)
+        pending: Dict[tuple, List[int]] = {}
+        for i, query in enumerate(queries):
+            cache_key = self._cache_key("keywords", query, translate_to_english, config)
+            cached = self.cache.get(cache_key) if self.cache is not None else None
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(cache_key, []).append(i)
+        
+        cache_keys = list(pending)
+        for start in range(0, len(cache_keys), batch_size):
+            chunk = cache_keys[start:start + batch_size]
+            chunk_queries = [queries[pending[key][0]] for key in chunk]
+            keywords_list = self._generate_keywords_chunk(chunk_queries, translate_to_english, config)
+            
+            for key, query, keywords in zip(chunk, chunk_queries, keywords_list):
+                if keywords is None:
+                    # 배치 응답 누락/실패 시 개별 생성 (실패 시 원본 쿼리)
+                    keywords = self.generate_keywords(query, translate_to_english, generation_config)
+                elif self.cache is not None:
+                    self.cache.set(key, keywords)
+                for i in pending[key]:
+                    results[i] = keywords
+        
+        return results
+    
+    def _generate_keywords_chunk(
+        self,
+        queries: List[str],
+        translate_to_english: bool,
+        config: Dict[str, Any]
+    ) -> List[Optional[str]]:
+        """쿼리 묶음의 키워드를 JSON 응답 한 번으로 생성 (실패한 항목은 None)"""
+        try:
+            if translate_to_english:
+                queries = [self.input_processor.translate_text(query, 'en') for query in queries]
+            
+            prompt = self._get_keyword_batch_prompt(queries)
+            batch_config = {
+                **config,
+                "max_output_tokens": config.get("max_output_tokens", 256) * len(queries),
+                "response_mime_type": "application/json"
+            }
+            response = json.loads(self.generator.generate_text(prompt, generation_config=batch_config))
+            
+            results = []
+            for i in range(1, len(queries) + 1):
+                keywords = response.get(f"q{i}") if isinstance(response, dict) else None
+                results.append(keywords.strip() if isinstance(keywords, str) and keywords.strip() else None)
+            
+            logger.debug(f"배치 키워드 생성: {sum(r is not None for r in results)}/{len(queries)}개")
+            return results
+            
+        except Exception as e:
+            logger.warning(f"배치 키워드 생성 실패, 개별 생성으로 대체: {e}")
+            return [None] * len(queries)
+    
     def generate_hyde_document(
         self,
         query: str,
@@ -89,6 +281,17 @@ class QueryEnhancer:
         Returns:
             str: 생성된 가상문서
         """
+        # 생성 설정: 파라미터 우선 → config의 hyde_generation → 기본값
+        config = generation_config or self.generation_config.hyde_generation
+        
+        # 같은 HyDE 문서가 나오므로 이후 임베딩도 임베딩 캐시에서 처리됨
+        cache_key = self._cache_key("hyde", query, translate_to_english, config)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.debug("HyDE 문서 캐시 히트")
+                return cached
+        
         try:
             # 필요시 영어로 번역
             if translate_to_english:
@@ -99,12 +302,12 @@ class QueryEnhancer:
             # HyDE 생성 프롬프트
             prompt = self._get_hyde_generation_prompt(query_en)
             
-            # 생성 설정: 파라미터 우선 → config의 hyde_generation → 기본값
-            config = generation_config or self.generation_config.hyde_generation
-            hyde_doc = self.generator.generate_text(prompt, generation_config=config)
+            hyde_doc = self.generator.generate_text(prompt, generation_config=config).strip()
             
             logger.debug(f"생성된 HyDE 문서 길이: {len(hyde_doc)}")
-            return hyde_doc.strip()
+            if self.cache is not None:
+                self.cache.set(cache_key, hyde_doc)
+            return hyde_doc
             
         except Exception as e:
             logger.error(f"HyDE 문서 생성 실패: {e}")
@@ -113,54 +316,13 @@ class QueryEnhancer:
     
     def _get_keyword_generation_prompt(self, query: str) -> str:
         """키워드 생성 프롬프트 템플릿"""
-        return f"""
-You are an AI assistant specialized in generating Elasticsearch query strings. Your task is to create the most effective query string for the given user question. This query string will be used to search for relevant documents in an Elasticsearch index.
-
-Guidelines:
-1. Analyze the user's question carefully.
-2. Generate ONLY a query string suitable for Elasticsearch's match query.
-3. Focus on key terms and concepts from the question.
-4. Include synonyms, related terms, and various word forms that might be in relevant documents:
-   - Include common synonyms and closely related concepts
-   - Consider different tenses of verbs (e.g., walk, walks, walked, walking)
-   - Include singular and plural forms of nouns
-   - Add common abbreviations or acronyms if applicable
-5. Use simple Elasticsearch query string syntax if helpful (e.g., OR).
-6. Do not use advanced Elasticsearch features or syntax.
-7. Do not include any explanations, comments, or additional text.
-8. Provide only the query string, nothing else.
-
-Use only OR as the operator. AND is not allowed.
-
-User Question:
-{query}
-
-Generate the Elasticsearch query string:
-""".strip()
+        return _KEYWORD_PROMPT_PREFIX + query + _KEYWORD_PROMPT_SUFFIX
+    
+    def _get_keyword_batch_prompt(self, queries: List[str]) -> str:
+        """배치 키워드 생성 프롬프트 템플릿"""
+        questions = "\n".join(f"q{i}: {query}" for i, query in enumerate(queries, 1))
+        return _KEYWORD_BATCH_PROMPT_PREFIX + questions + _KEYWORD_BATCH_PROMPT_SUFFIX
     
     def _get_hyde_generation_prompt(self, query: str) -> str:
         """HyDE 생성 프롬프트 템플릿"""
-        return f"""
-You are an AI assistant specialized in generating hypothetical documents based on user queries. Your task is to create a detailed, factual document that would likely contain the answer to the user's question. This hypothetical document will be used to enhance the retrieval process in a Retrieval-Augmented Generation (RAG) system.
-
-Guidelines:
-1. Carefully analyze the user's query to understand the topic and the type of information being sought.
-2. Generate a hypothetical document that:
-   a. Is directly relevant to the query
-   b. Contains factual information that would answer the query
-   c. Includes additional context and related information
-   d. Uses a formal, informative tone similar to an encyclopedia or textbook entry
-3. Structure the document with clear paragraphs, covering different aspects of the topic.
-4. Include specific details, examples, or data points that would be relevant to the query.
-5. Aim for a document length of 200-300 words.
-6. Do not use citations or references, as this is a hypothetical document.
-7. Avoid using phrases like "In this document" or "This text discusses" - write as if it's a real, standalone document.
-8. Do not mention or refer to the original query in the generated document.
-9. Ensure the content is factual and objective, avoiding opinions or speculative information.
-10. Output only the generated document, without any additional explanations or meta-text.
-
-User Question:
-{query}
-
-Generate a hypothetical document that would likely contain the answer to this query:
-""".strip()
\ No newline at end of file
+        return _HYDE_PROMPT_PREFIX + query + _HYDE_PROMPT_SUFFIX
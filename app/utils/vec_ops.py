@@ -0,0 +1,53 @@
+"""
+벡터 연산 유틸리티 (NumPy float32 벡터화 연산)
+"""
+
+from typing import Sequence, Union
+
+import numpy as np
+
+VectorLike = Union[Sequence[float], np.ndarray]
+
+
+def as_float32(vector: VectorLike) -> np.ndarray:
+    """
+    벡터를 float32 ndarray로 변환 (이미 float32면 복사 없이 반환)
+    
+    Args:
+        vector: 리스트 또는 ndarray 벡터
+        
+    Returns:
+        np.ndarray: float32 벡터
+    """
+    return np.asarray(vector, dtype=np.float32)
+
+
+def l2_normalize(vectors: VectorLike, eps: float = 1e-12) -> np.ndarray:
+    """
+    L2 정규화 (1차원 벡터 또는 행 단위 2차원 행렬)
+    
+    Args:
+        vectors: 벡터 또는 (n, dim) 행렬
+        eps: 0으로 나누기 방지용 값
+        
+    Returns:
+        np.ndarray: 정규화된 float32 배열
+    """
+    array = as_float32(vectors)
+    norms = np.linalg.norm(array, axis=-1, keepdims=True)
+    return array / np.maximum(norms, eps)
+
+
+def quantize_int8(vector: VectorLike, scale: float = 127.0) -> np.ndarray:
+    """
+    L2 정규화 후 int8로 대칭 양자화 (ES element_type: byte 인덱스 조회용)
+    
+    Args:
+        vector: 원본 벡터
+        scale: 양자화 스케일 (정규화된 성분 [-1, 1] → [-scale, scale])
+        
+    Returns:
+        np.ndarray: int8 벡터
+    """
+    normalized = l2_normalize(vector)
+    return np.clip(np.round(normalized * scale), -128, 127).astype(np.int8)